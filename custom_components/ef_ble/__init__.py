@@ -13,9 +13,10 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util.hass_dict import HassKey
 
 from . import eflib
-from .config_flow import ConfLogOptions, LogOptions
+from .config_flow import ConfLogOptions, ConfReconnectPolicy, LogOptions
 from .const import (
     CONF_CONNECTION_TIMEOUT,
     CONF_UPDATE_PERIOD,
@@ -25,12 +26,14 @@ from .const import (
     DOMAIN,
     MANUFACTURER,
 )
+from .eflib import key_material
 from .eflib.connection import (
     AuthFailedError,
     BleakError,
     ConnectionTimeout,
     MaxConnectionAttemptsReached,
 )
+from .eflib.connection_scheduler import ConnectionScheduler
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -42,6 +45,12 @@ PLATFORMS: list[Platform] = [
 
 type DeviceConfigEntry = ConfigEntry[eflib.DeviceBase]
 
+# Shared by all config entries, so devices behind the same adapter or proxy do not
+# compete for it during startup
+_CONNECTION_SCHEDULER: HassKey[ConnectionScheduler] = HassKey(
+    f"{DOMAIN}_connection_scheduler"
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 ConfigEntryNotReady = partial(ConfigEntryNotReady, translation_domain=DOMAIN)
@@ -64,12 +73,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: DeviceConfigEntry) -> bo
     if not bluetooth.async_address_present(hass, address):
         raise ConfigEntryNotReady(translation_key="device_not_present")
 
+    # Start generating session keys in the background, so handshakes of all devices
+    # can start without waiting for elliptic curve math
+    key_material.default_provider.prefill()
+
     _LOGGER.debug("Connecting Device")
+    discovery_info = bluetooth.async_last_service_info(hass, address, connectable=True)
+    if discovery_info is None:
+        # advertisement may age out between presence check and this lookup
+        raise ConfigEntryNotReady(translation_key="device_not_present")
+
     device: eflib.DeviceBase | None = getattr(entry, "runtime_data", None)
     if device is None:
-        discovery_info = bluetooth.async_last_service_info(
-            hass, address, connectable=True
-        )
         device = eflib.NewDevice(discovery_info.device, discovery_info.advertisement)
         if device is None:
             raise ConfigEntryNotReady(translation_key="unable_to_create_device")
@@ -83,6 +98,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: DeviceConfigEntry) -> bo
             device.with_update_period(update_period)
             .with_logging_options(ConfLogOptions.from_config(merged_options))
             .with_disabled_reconnect()
+            .with_reconnect_policy(ConfReconnectPolicy.from_config(merged_options))
+            .with_connection_scheduler(
+                hass.data.setdefault(_CONNECTION_SCHEDULER, ConnectionScheduler()),
+                discovery_info.source,
+            )
             .connect(user_id, timeout=timeout)
         )
         state = await device.wait_until_authenticated_or_error(raise_on_error=True)
@@ -132,6 +152,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: DeviceConfigEntry) -> bo
     _LOGGER.debug("Setup done")
     entry.async_on_unload(entry.add_update_listener(_update_listener))
 
+    # Lost connection is restored without reloading, entities are unavailable meanwhile
+    device.with_disabled_reconnect(is_disabled=False)
+
+    # Called only when connection could not be restored
     def _on_disconnect(exc: Exception | type[Exception] | None):
         async def _disconnect_and_reload():
             hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -167,4 +191,4 @@ async def _update_listener(hass: HomeAssistant, entry: DeviceConfigEntry):
     update_period = merged_options.get(CONF_UPDATE_PERIOD, DEFAULT_UPDATE_PERIOD)
     device.with_update_period(period=update_period).with_logging_options(
         ConfLogOptions.from_config(merged_options)
-    )
+    ).with_reconnect_policy(ConfReconnectPolicy.from_config(merged_options))
@@ -153,10 +153,12 @@ class EcoflowBinarySensor(EcoflowEntity, BinarySensorEntity):
     async def async_added_to_hass(self):
         """Run when this Entity has been added to HA."""
         self._device.register_state_update_callback(self.state_updated, self._prop_name)
+        await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self):
         """Entity being removed from hass."""
         self._device.remove_state_update_calback(self.state_updated, self._prop_name)
+        await super().async_will_remove_from_hass()
 
     @callback
     def state_updated(self, state: bool):
@@ -37,14 +37,21 @@ from .const import (
     CONF_LOG_MESSAGES,
     CONF_LOG_PACKETS,
     CONF_LOG_PAYLOADS,
+    CONF_RECONNECT_COOLDOWN,
+    CONF_RECONNECT_MAX_ATTEMPTS,
+    CONF_RECONNECT_MAX_DELAY,
     CONF_UPDATE_PERIOD,
     CONF_USER_ID,
     DEFAULT_CONNECTION_TIMEOUT,
+    DEFAULT_RECONNECT_COOLDOWN,
+    DEFAULT_RECONNECT_MAX_ATTEMPTS,
+    DEFAULT_RECONNECT_MAX_DELAY,
     DEFAULT_UPDATE_PERIOD,
     DOMAIN,
 )
 from .eflib.connection import ConnectionState
 from .eflib.logging_util import LogOptions
+from .eflib.reconnect_policy import ReconnectPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -373,6 +380,7 @@ class OptionsFlowHandler(OptionsFlow):
                 vol.Schema(
                     {
                         **_update_period_option(),
+                        **ConfReconnectPolicy.schema(merged_entry),
                         **ConfLogOptions.schema(merged_entry, False),
                     }
                 ),
@@ -437,6 +445,50 @@ class ConfLogOptions:
         }
 
 
+class ConfReconnectPolicy:
+    CONF_KEY = "reconnect_options"
+
+    _DEFAULTS: ClassVar = {
+        CONF_RECONNECT_MAX_DELAY: DEFAULT_RECONNECT_MAX_DELAY,
+        CONF_RECONNECT_MAX_ATTEMPTS: DEFAULT_RECONNECT_MAX_ATTEMPTS,
+        CONF_RECONNECT_COOLDOWN: DEFAULT_RECONNECT_COOLDOWN,
+    }
+
+    @classmethod
+    def from_config(cls, config_entry: Mapping[str, Any]):
+        config = cls._DEFAULTS | config_entry.get(cls.CONF_KEY, {})
+        return ReconnectPolicy(
+            max_delay=config[CONF_RECONNECT_MAX_DELAY],
+            max_attempts=config[CONF_RECONNECT_MAX_ATTEMPTS],
+            # 0 gives up and reloads the device instead of waiting
+            cooldown=config[CONF_RECONNECT_COOLDOWN] or None,
+        )
+
+    @classmethod
+    def schema(cls, defaults_dict: Mapping[str, Any] | None = None):
+        if defaults_dict is None:
+            defaults_dict = {}
+        defaults_dict = cls._DEFAULTS | defaults_dict.get(cls.CONF_KEY, {})
+
+        return {
+            vol.Required(cls.CONF_KEY): section(
+                vol.Schema(
+                    {
+                        vol.Optional(option, default=defaults_dict[option]): vol.All(
+                            int, vol.Range(min=min_value)
+                        )
+                        for option, min_value in (
+                            (CONF_RECONNECT_MAX_DELAY, 1),
+                            (CONF_RECONNECT_MAX_ATTEMPTS, 1),
+                            (CONF_RECONNECT_COOLDOWN, 0),
+                        )
+                    }
+                ),
+                {"collapsed": True},
+            ),
+        }
+
+
 def _update_period_option(default: int = DEFAULT_UPDATE_PERIOD):
     return {
         vol.Optional(CONF_UPDATE_PERIOD, default=default): vol.All(
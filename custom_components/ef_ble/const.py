@@ -15,6 +15,13 @@ CONF_LOG_MESSAGES = "log_messages"
 CONF_LOG_CONNECTION = "log_connection"
 CONF_LOG_BLEAK = "log_bleak"
 
+CONF_RECONNECT_MAX_DELAY = "reconnect_max_delay"
+CONF_RECONNECT_MAX_ATTEMPTS = "reconnect_max_attempts"
+CONF_RECONNECT_COOLDOWN = "reconnect_cooldown"
+
 
 DEFAULT_UPDATE_PERIOD = 10
 DEFAULT_CONNECTION_TIMEOUT = 20
+DEFAULT_RECONNECT_MAX_DELAY = 300
+DEFAULT_RECONNECT_MAX_ATTEMPTS = 10
+DEFAULT_RECONNECT_COOLDOWN = 900
@@ -0,0 +1,20 @@
+"""Diagnostics support for EcoFlow BLE"""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import DeviceConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: DeviceConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    device = entry.runtime_data
+    return {
+        "device": device.device,
+        "connection_state": device.connection_state,
+        "reconnect": device.reconnect_state,
+        "performance": device.performance_stats,
+    }
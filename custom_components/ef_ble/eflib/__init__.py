@@ -24,9 +24,8 @@ def NewDevice(ble_dev: BLEDevice, adv_data: AdvertisementData) -> DeviceBase | N
     sn = man_data[1:17]
 
     # Check if known devices fits the found serial number
-    for item in devices.devices:
-        if item.Device.check(sn):
-            return item.Device(ble_dev, adv_data, sn.decode("ASCII"))
+    if (module := devices.module_for_sn(sn)) is not None:
+        return module.Device(ble_dev, adv_data, sn.decode("ASCII"))
 
     _LOGGER.warning("%s: Unknown SN prefix: %s", ble_dev.address, sn[:4])
     return None
@@ -0,0 +1,89 @@
+from collections.abc import Sequence
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+
+from .crc import Buffer
+
+
+class SessionCipher:
+    """
+    AES-CBC cipher for frames that are all encrypted with the same key and IV
+
+    Creating new CBC cipher for every frame expands the key every time, so instead the
+    key is expanded only once into ECB cipher and CBC chaining is done here. Decrypted
+    CBC blocks do not depend on each other, so the whole frame is decrypted with a single
+    ECB call followed by one xor with the ciphertext shifted by one block.
+    """
+
+    # encryption has to be chained block by block, for longer payloads one-shot CBC
+    # cipher is faster than chaining in python
+    _MAX_CHAINED_ENCRYPT_BLOCKS = 2
+
+    def __init__(self, key: bytes, iv: bytes) -> None:
+        self._key = key
+        self._iv = iv
+        self._iv_int = int.from_bytes(iv)
+        self._ecb = AES.new(key, AES.MODE_ECB)
+
+    def encrypt(self, data: Buffer) -> bytes:
+        """Pad and encrypt frame payload"""
+        padded = pad(bytes(data), AES.block_size)
+        if len(padded) > self._MAX_CHAINED_ENCRYPT_BLOCKS * AES.block_size:
+            return AES.new(self._key, AES.MODE_CBC, self._iv).encrypt(padded)
+
+        encrypted = bytearray()
+        prev = self._iv_int
+        for i in range(0, len(padded), AES.block_size):
+            block = self._ecb.encrypt(
+                (int.from_bytes(padded[i : i + AES.block_size]) ^ prev).to_bytes(
+                    AES.block_size
+                )
+            )
+            encrypted += block
+            prev = int.from_bytes(block)
+        return bytes(encrypted)
+
+    def decrypt(self, data: Buffer) -> bytes:
+        """Decrypt frame payload and remove padding"""
+        return unpad(self._decrypt_raw(data), AES.block_size)
+
+    def decrypt_many(self, frames: Sequence[Buffer]) -> list[bytes]:
+        """
+        Decrypt multiple frame payloads with a single ECB call
+
+        Raises
+        ------
+        ValueError
+            If any of the frames is not aligned to block size or its padding is
+            incorrect
+        """
+        if len(frames) == 1:
+            return [self.decrypt(frames[0])]
+
+        if any(len(frame) % AES.block_size for frame in frames):
+            raise ValueError("Data must be aligned to block boundary in ECB mode")
+
+        # every frame is chained separately starting with IV
+        decrypted = self._xor(
+            self._ecb.decrypt(b"".join(frames)),
+            b"".join([self._iv + frame[: -AES.block_size] for frame in frames]),
+        )
+
+        payloads = []
+        offset = 0
+        for frame in frames:
+            payloads.append(
+                unpad(decrypted[offset : offset + len(frame)], AES.block_size)
+            )
+            offset += len(frame)
+        return payloads
+
+    def _decrypt_raw(self, data: Buffer) -> bytes:
+        if not data:
+            return b""
+        return self._xor(self._ecb.decrypt(data), self._iv + data[: -AES.block_size])
+
+    @staticmethod
+    def _xor(data: bytes, chain: bytes) -> bytes:
+        return (int.from_bytes(data) ^ int.from_bytes(chain)).to_bytes(len(data))
@@ -0,0 +1,203 @@
+import asyncio
+import bisect
+import time
+from collections import Counter, deque
+from collections.abc import Iterable
+
+from .exceptions import CommandTimeout
+from .packet import Packet
+
+DEFAULT_REPLY_TIMEOUT = 5.0
+CONFIG_WRITE_ACK = (0xFE, 0x12)
+
+type CommandKey = tuple[int, int]
+type ReplyKey = tuple[int, int, int]
+
+
+class LatencyHistogram:
+    """Histogram of round-trip times with fixed bucket bounds in seconds"""
+
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+    __slots__ = ("counts", "max", "total")
+
+    def __init__(self):
+        # last bucket holds values larger than the last bound
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / count if (count := self.count) else None
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self):
+        return {
+            "buckets": dict(
+                zip([*map(str, self.BUCKETS), "+Inf"], self.counts, strict=True)
+            ),
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+        }
+
+
+class _PendingCommand:
+    __slots__ = ("command", "future", "reply_key", "sent_at", "seq", "timer")
+
+    def __init__(
+        self,
+        command: CommandKey,
+        reply_key: ReplyKey,
+        seq: bytes,
+        future: asyncio.Future[Packet],
+    ):
+        self.command = command
+        self.reply_key = reply_key
+        self.seq = seq
+        self.future = future
+        self.sent_at = time.monotonic()
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class CommandTracker:
+    """
+    Correlates sent commands with replies from the device
+
+    Every tracked command gets its own sequence number. Reply is matched by sequence
+    number if device echoes it, otherwise the oldest pending command waiting for the
+    same (src, cmdSet, cmdId) reply is resolved. Packets with keys in `push_keys` are
+    also sent by device on its own, so they resolve commands only by sequence number.
+    Round-trip time of every resolved command is recorded in a histogram per
+    (cmdSet, cmdId) of the command.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_REPLY_TIMEOUT,
+        push_keys: Iterable[ReplyKey] = (),
+    ):
+        self._timeout = timeout
+        self.push_keys = frozenset(push_keys)
+        self._seq = 0
+        self._by_seq: dict[bytes, _PendingCommand] = {}
+        self._by_reply: dict[ReplyKey, deque[_PendingCommand]] = {}
+
+        self.latency: dict[CommandKey, LatencyHistogram] = {}
+        self.timeouts: Counter[CommandKey] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._by_seq)
+
+    def track(
+        self,
+        packet: Packet,
+        reply: CommandKey | None = None,
+        timeout: float | None = None,
+    ) -> asyncio.Future[Packet]:
+        """
+        Assign sequence number to packet and start waiting for its reply
+
+        Has to be called before packet is sent.
+
+        Parameters
+        ----------
+        packet
+            Command packet, its `seq` is overwritten
+        reply, optional
+            (cmdSet, cmdId) of the reply, defaults to the same as the command
+        timeout, optional
+            Time in seconds after which future fails with `CommandTimeout`
+
+        Returns
+        -------
+            Future resolved with reply packet
+        """
+        packet.seq = self._next_seq()
+        command = (packet.cmdSet, packet.cmdId)
+        reply_key = (packet.dst, *(reply if reply is not None else command))
+
+        loop = asyncio.get_running_loop()
+        pending = _PendingCommand(command, reply_key, packet.seq, loop.create_future())
+        pending.timer = loop.call_later(
+            self._timeout if timeout is None else timeout, self._expire, pending
+        )
+
+        self._by_seq[pending.seq] = pending
+        self._by_reply.setdefault(reply_key, deque()).append(pending)
+        return pending.future
+
+    def resolve(self, packet: Packet) -> bool:
+        """Resolve pending command if packet is its reply"""
+        if not self._by_seq:
+            return False
+
+        reply_key = (packet.src, packet.cmdSet, packet.cmdId)
+        pending = self._by_seq.get(packet.seq)
+        if pending is None or pending.reply_key != reply_key:
+            # unsolicited push would confirm command that device may have not received
+            if reply_key in self.push_keys or not (
+                waiting := self._by_reply.get(reply_key)
+            ):
+                return False
+            pending = waiting[0]
+
+        self._remove(pending)
+        self.latency.setdefault(pending.command, LatencyHistogram()).observe(
+            time.monotonic() - pending.sent_at
+        )
+        if not pending.future.done():
+            pending.future.set_result(packet)
+        return True
+
+    def discard(self, future: asyncio.Future[Packet]):
+        """Stop waiting for reply of command tracked with this future"""
+        for pending in self._by_seq.values():
+            if pending.future is future:
+                self._remove(pending)
+                return
+
+    def cancel_all(self, exc: Exception | None = None):
+        """Cancel all pending commands, or fail them with exception if it is given"""
+        for pending in list(self._by_seq.values()):
+            self._remove(pending)
+            if exc is None:
+                pending.future.cancel()
+            elif not pending.future.done():
+                pending.future.set_exception(exc)
+                # caller may not wait for the reply at all
+                pending.future.exception()
+
+    def _next_seq(self) -> bytes:
+        # first byte is used as xor key of the payload by some devices, so it is kept 0
+        self._seq = self._seq % 0xFFFFFF + 1
+        return b"\x00" + self._seq.to_bytes(3, "little")
+
+    def _expire(self, pending: _PendingCommand):
+        pending.timer = None
+        self._remove(pending)
+        self.timeouts[pending.command] += 1
+        if not pending.future.done():
+            pending.future.set_exception(CommandTimeout(pending.command))
+            # caller may not wait for the reply at all
+            pending.future.exception()
+
+    def _remove(self, pending: _PendingCommand):
+        if pending.timer is not None:
+            pending.timer.cancel()
+            pending.timer = None
+
+        self._by_seq.pop(pending.seq, None)
+        if (waiting := self._by_reply.get(pending.reply_key)) is not None:
+            waiting.remove(pending)
+            if not waiting:
+                del self._by_reply[pending.reply_key]
@@ -2,10 +2,12 @@ import logging
 import struct
 import time
 from dataclasses import dataclass
+from functools import cached_property
 
-from .devicebase import DeviceBase
+from .devicebase import DeviceBase, packet_handler
 from .packet import Packet
 from .pb import utc_sys_pb2
+from .send_queue import SendPriority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,52 +19,41 @@ class TimeCommands:
     async def sendUtcTime(self):
         """Send UTC time as unix timestamp seconds through PB"""
         _LOGGER.debug("%s: sendUtcTime", self.device.address)
-
-        utcs = utc_sys_pb2.SysUTCSync()
-        utcs.sys_utc_time = int(time.time())
-        payload = utcs.SerializeToString()
-        packet = Packet(0x21, 0x0B, 0x01, 0x55, payload, 0x01, 0x01, 0x13)
-
-        await self.device._conn.sendPacket(packet)
+        await self.device._conn.sendPacket(self._utc_time_packet())
 
     async def sendRTCRespond(self):
         """Send RTC timestamp seconds and TZ as respond to device's request"""
         _LOGGER.debug("%s: sendRTCRespond", self.device.address)
-
-        # Building payload
-        tz_offset = (
-            (time.timezone if (time.localtime().tm_isdst == 0) else time.altzone)
-            / 60
-            / 60
-            * -1
-        )
-        tz_maj = int(tz_offset)
-        tz_min = int((tz_offset - tz_maj) * 100)
-        time_sec = int(time.time())
-        payload = (
-            struct.pack("<L", time_sec)
-            + struct.pack("<b", tz_maj)
-            + struct.pack("<b", tz_min)
-        )
-
-        # Forming packet
-        packet = Packet(
-            0x21,
-            0x35,
-            0x01,
-            Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME,
-            payload,
-            0x01,
-            0x01,
-            0x03,
+        await self.device._conn.sendPacket(
+            self._rtc_packet(Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME)
         )
 
-        await self.device._conn.sendPacket(packet)
-
     async def sendRTCCheck(self):
         """Send command to check RTC of the device"""
         _LOGGER.debug("%s: sendRTCCheck", self.device.address)
+        await self.device._conn.sendPacket(
+            self._rtc_packet(Packet.NET_BLE_COMMAND_CMD_CHECK_RET_TIME)
+        )
 
+    def async_send_all(self):
+        """Queue all time packets at once without waiting for them to be sent"""
+        _LOGGER.debug("%s: Sending time", self.device.address)
+        for packet in (
+            self._utc_time_packet(),
+            self._rtc_packet(Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME),
+            self._rtc_packet(Packet.NET_BLE_COMMAND_CMD_CHECK_RET_TIME),
+        ):
+            self.device._conn.queuePacket(packet, SendPriority.NORMAL)
+
+    @staticmethod
+    def _utc_time_packet():
+        utcs = utc_sys_pb2.SysUTCSync()
+        utcs.sys_utc_time = int(time.time())
+        payload = utcs.SerializeToString()
+        return Packet(0x21, 0x0B, 0x01, 0x55, payload, 0x01, 0x01, 0x13)
+
+    @staticmethod
+    def _rtc_packet(cmd_id: int):
         # Building payload
         tz_offset = (
             (time.timezone if (time.localtime().tm_isdst == 0) else time.altzone)
@@ -80,20 +71,22 @@ class TimeCommands:
         )
 
         # Forming packet
-        packet = Packet(
-            0x21,
-            0x35,
-            0x01,
-            Packet.NET_BLE_COMMAND_CMD_CHECK_RET_TIME,
-            payload,
-            0x01,
-            0x01,
-            0x03,
-        )
+        return Packet(0x21, 0x35, 0x01, cmd_id, payload, 0x01, 0x01, 0x03)
 
-        await self.device._conn.sendPacket(packet)
 
-    def async_send_all(self):
-        self.device._conn._add_task(self.sendUtcTime())
-        self.device._conn._add_task(self.sendRTCRespond())
-        self.device._conn._add_task(self.sendRTCCheck())
+class TimeSync:
+    """
+    Mixin for devices that request time and timezone offset
+
+    Devices request it after connecting and will not send predictions and config data
+    until they receive it.
+    """
+
+    @cached_property
+    def _time_commands(self) -> TimeCommands:
+        return TimeCommands(self)  # type: ignore reportArgumentType
+
+    @packet_handler(0x35, 0x01, Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME)
+    async def _on_time_request(self, packet: Packet):
+        if len(packet.payload) == 0:
+            self._time_commands.async_send_all()
@@ -0,0 +1,119 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from google.protobuf.message import Message
+
+DEFAULT_MERGE_WINDOW = 0.05
+
+
+class ConfigWriteMerger[R]:
+    """
+    Merges config messages sent within short window into a single write
+
+    First message opens the window, messages sent until the window closes are merged
+    into it with `MergeFrom`, so later values of the same field win. Every sender waits
+    for the merged write on its own and receives its result or exception, cancelling
+    one sender does not affect the others.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Message], Awaitable[R]],
+        window: float = DEFAULT_MERGE_WINDOW,
+    ):
+        """
+        Create config write merger
+
+        Parameters
+        ----------
+        write
+            Coroutine function that sends message to the device
+        window, optional
+            Time in seconds to wait for more messages, 0 sends every message directly
+        """
+        self._write = write
+        self._window = window
+
+        self._pending: Message | None = None
+        self._waiters: list[asyncio.Future[R]] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+        self.messages = 0
+        self.writes = 0
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    def with_window(self, window: float):
+        self._window = window
+        return self
+
+    async def send(self, message: Message) -> R:
+        """Send message merged with other messages sent within the window"""
+        self.messages += 1
+        if self._window <= 0 and self._pending is None:
+            self.writes += 1
+            return await self._write(message)
+
+        if self._pending is not None and type(self._pending) is not type(message):
+            self.flush()
+
+        loop = asyncio.get_running_loop()
+        if self._pending is None:
+            self._pending = type(message)()
+            self._handle = loop.call_later(self._window, self.flush)
+
+        self._pending.MergeFrom(message)
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        return await waiter
+
+    def flush(self):
+        """Write pending merged message immediately"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if (message := self._pending) is None:
+            return
+
+        waiters, self._waiters = self._waiters, []
+        self._pending = None
+
+        task = asyncio.get_running_loop().create_task(self._flush(message, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def cancel(self):
+        """Drop pending message and cancel all waiting senders"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        for task in self._tasks:
+            task.cancel()
+
+        for waiter in self._waiters:
+            waiter.cancel()
+        self._waiters = []
+        self._pending = None
+
+    async def _flush(self, message: Message, waiters: list[asyncio.Future[R]]):
+        self.writes += 1
+        try:
+            result = await self._write(message)
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(result)
@@ -3,9 +3,11 @@ import contextlib
 import hashlib
 import logging
 import struct
+import time
 import traceback
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from enum import StrEnum, auto
+from typing import Any
 
 import ecdsa
 from bleak import BleakClient
@@ -17,35 +19,41 @@ from bleak_retry_connector import (
     BleakNotFoundError,
     establish_connection,
 )
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
 
-from . import keydata
-from .crc import crc16
-from .encpacket import EncPacket
+from . import key_material, keydata
+from .cipher import SessionCipher
+from .command_tracker import CommandKey, CommandTracker, ReplyKey
+from .connection_scheduler import ConnectionScheduler, ConnectPriority, SlotLease
+from .connection_stats import ConnectionStats
+from .encpacket import EncPacket, FrameDecoder
 from .exceptions import (
     AuthFailedError,
+    CommandAborted,
     ConnectionTimeout,
-    EncPacketParseError,
     FailedToAuthenticate,
     MaxConnectionAttemptsReached,
     MaxReconnectAttemptsReached,
+    PacketDropped,
     PacketParseError,
     PacketReceiveError,
 )
 from .logging_util import ConnectionLogger, LogOptions
 from .packet import Packet
-
-MAX_RECONNECT_ATTEMPTS = 2
-MAX_CONNECTION_ATTEMPTS = 10
+from .reconnect_policy import ReconnectBackoff, ReconnectPolicy
+from .send_queue import DropPolicy, SendPriority, SendQueue
+from .stall_watchdog import StallWatchdog
 
 type DisconnectListener = Callable[[Exception | type[Exception] | None], None]
+type NotificationHandler = Callable[
+    [BleakGATTCharacteristic, bytearray], Coroutine[Any, Any, None]
+]
 
 
 class ConnectionState(StrEnum):
     NOT_CONNECTED = auto()
 
     CREATED = auto()
+    WAITING_FOR_SLOT = auto()
     ESTABLISHING_CONNECTION = auto()
     CONNECTED = auto()
     PUBLIC_KEY_EXCHANGE = auto()
@@ -81,6 +89,7 @@ class ConnectionState(StrEnum):
 
     def is_connecting(self):
         return self in [
+            ConnectionState.WAITING_FOR_SLOT,
             ConnectionState.ESTABLISHING_CONNECTION,
             ConnectionState.CONNECTED,
             ConnectionState.PUBLIC_KEY_EXCHANGE,
@@ -153,12 +162,27 @@ class Connection:
         self._connected = asyncio.Event()
         self._disconnected = asyncio.Event()
         self._retry_on_disconnect = False
-        self._retry_on_disconnect_delay = 10
-        self._enc_packet_buffer = b""
+        self._backoff = ReconnectBackoff()
+        self._frame_errors: list[Exception] = []
+        self._frame_decoder = FrameDecoder(on_error=self._frame_errors.append)
+        self._key_material = key_material.default_provider
 
         self._tasks: set[asyncio.Task] = set()
         self._debug_mode = False
 
+        self._coalesce_writes = False
+        self._send_queue = SendQueue(
+            self._writeFrame, max_write_size=self._maxWriteSize
+        )
+        self._command_tracker = CommandTracker()
+        self._watchdog = StallWatchdog(self._on_stall)
+        self._stats = ConnectionStats()
+        self._request_data: Callable[[], Awaitable[bool]] | None = None
+
+        self._scheduler: ConnectionScheduler | None = None
+        self._adapter = ""
+        self._slot: SlotLease | None = None
+
         self._logger = ConnectionLogger(self)
 
         self._state_exception: Exception | type[Exception] | None = None
@@ -167,10 +191,17 @@ class Connection:
         self._state_changed = asyncio.Event()
         self._reconnect_task: asyncio.Task | None = None
         self._connection_attempt: int = 0
-        self._reconnect_attempt: int = 0
         self._reconnect = True
 
         self._disconnect_listeners: list[DisconnectListener] = []
+        # Notifications are subscribed once per connection and routed to the handler
+        # of the current handshake step
+        self._notification_handlers: dict[ConnectionState, NotificationHandler] = {
+            ConnectionState.PUBLIC_KEY_EXCHANGE: self.initBleSessionKeyHandler,
+            ConnectionState.REQUESTING_SESSION_KEY: self.getKeyInfoReqHandler,
+            ConnectionState.REQUESTING_AUTH_STATUS: self.getAuthStatusHandler,
+            ConnectionState.AUTHENTICATING: self.listenForDataHandler,
+        }
         self._connection_state = None
         self._set_state(ConnectionState.CREATED)
 
@@ -215,23 +246,112 @@ class Connection:
 
     def with_disabled_reconnect(self, is_disabled: bool = True):
         self._reconnect = not is_disabled
+        if self.is_connected:
+            self._retry_on_disconnect = self._reconnect
+        return self
+
+    def with_reconnect_policy(self, policy: ReconnectPolicy):
+        self._backoff.policy = policy
+        return self
+
+    def with_data_request(self, request_data: Callable[[], Awaitable[bool]] | None):
+        """
+        Set coroutine function that asks device to push its data again
+
+        It is used by stall watchdog before reconnecting, it should return False if
+        device does not support such request.
+        """
+        self._request_data = request_data
+        return self
+
+    @property
+    def stall_watchdog(self) -> StallWatchdog:
+        return self._watchdog
+
+    @property
+    def reconnect_backoff(self) -> ReconnectBackoff:
+        return self._backoff
+
+    def with_send_queue(
+        self,
+        max_depth: int | None = None,
+        drop_policy: DropPolicy | None = None,
+        coalesce_writes: bool | None = None,
+    ):
+        """
+        Configure queue of outgoing packets
+
+        Parameters
+        ----------
+        max_depth, optional
+            Maximum number of packets waiting to be sent
+        drop_policy, optional
+            What to do with new packet when queue is full
+        coalesce_writes, optional
+            If True, multiple queued packets are sent in a single write of MTU size,
+            device has to support receiving multiple frames in one write
+        """
+        self._send_queue.configure(max_depth=max_depth, drop_policy=drop_policy)
+        if coalesce_writes is not None:
+            self._coalesce_writes = coalesce_writes
+        return self
+
+    def with_connection_scheduler(
+        self, scheduler: ConnectionScheduler | None, adapter: str = ""
+    ):
+        """
+        Share adapter with other connections through connection scheduler
+
+        Parameters
+        ----------
+        scheduler
+            Scheduler that admits connection attempts, None connects immediately
+        adapter, optional
+            Identifier of the adapter or proxy the device is connected through
+        """
+        self._scheduler = scheduler
+        self._adapter = adapter
+        return self
+
+    def with_push_keys(self, keys: Iterable[ReplyKey]):
+        """
+        Set (src, cmdSet, cmdId) of packets that device sends without request
+
+        Such packets resolve pending commands only if they carry sequence number of the
+        command, see `CommandTracker`
+        """
+        self._command_tracker.push_keys = frozenset(keys)
         return self
 
+    @property
+    def send_queue(self) -> SendQueue:
+        return self._send_queue
+
+    @property
+    def command_tracker(self) -> CommandTracker:
+        return self._command_tracker
+
+    @property
+    def stats(self) -> ConnectionStats:
+        return self._stats
+
     async def connect(
         self,
         max_attempts: int = MAX_CONNECT_ATTEMPTS,
         timeout: int = 20,
+        priority: ConnectPriority = ConnectPriority.SETUP,
     ):
         if self._state.is_connecting():
             return
 
+        # max_attempts is passed to bleak, policy limits attempts of this method
+        outer_limit = self._backoff.policy.max_connect_attempts
         self._connection_attempt += 1
-        if self._connection_attempt > MAX_CONNECTION_ATTEMPTS:
+        if self._connection_attempt > outer_limit:
             self._connection_attempt = 0
             self._notify_disconnect(self._last_exception)
             raise MaxConnectionAttemptsReached(
-                last_error=self._last_exception,
-                attempts=MAX_CONNECTION_ATTEMPTS,
+                last_error=self._last_exception, attempts=outer_limit
             )
 
         self._connected.clear()
@@ -243,7 +363,22 @@ class Connection:
                 self._logger.warning("Device is already connected")
                 return
 
+            self._stats.connect_started()
+            if self._slot is not None and self._slot.released:
+                # Lease expired by hold timeout of the scheduler
+                self._slot = None
+
+            if self._scheduler is not None and self._slot is None:
+                # Slot is held until handshake finishes, see `_set_state`
+                self._set_state(ConnectionState.WAITING_FOR_SLOT)
+                try:
+                    self._slot = await self._scheduler.acquire(self._adapter, priority)
+                except asyncio.CancelledError:
+                    self._set_state(ConnectionState.DISCONNECTED)
+                    raise
+
             self._set_state(ConnectionState.ESTABLISHING_CONNECTION)
+            self._frame_decoder.reset()
             self._logger.info("Connecting to device")
             self._client = await establish_connection(
                 BleakClient,
@@ -285,6 +420,9 @@ class Connection:
         self._logger.log_filtered(
             LogOptions.CONNECTION_DEBUG, "MTU: %d", self._client.mtu_size
         )
+        await self._client.start_notify(
+            Connection.NOTIFY_CHARACTERISTIC, self.notificationHandler
+        )
         self._logger.info("Init completed, starting auth routine...")
 
         await self.initBleSessionKey()
@@ -292,6 +430,13 @@ class Connection:
     def disconnected(self, *args, **kwargs) -> None:
         self._logger.warning("Disconnected from device")
         self._client = None
+        self._watchdog.stop()
+        # Frames are encrypted for this session, the next one would reject them
+        self._send_queue.clear()
+        # Replies to commands sent in this session will never arrive
+        self._command_tracker.cancel_all(CommandAborted("Device disconnected"))
+        # Link dropped during handshake, adapter must not be held over reconnect delay
+        self._release_slot(success=False)
 
         if not self._retry_on_disconnect:
             if self._reconnect_task:
@@ -307,6 +452,8 @@ class Connection:
         if self._reconnect_task is not None:
             return
 
+        # Entities become unavailable while waiting for reconnect
+        self._set_state(ConnectionState.RECONNECTING)
         loop = asyncio.get_event_loop()
         self._reconnect_task = self._add_task(self.reconnect(), loop)
 
@@ -318,49 +465,55 @@ class Connection:
 
         self._reconnect_task.add_done_callback(_reconnect_done)
 
-    async def reconnect(self) -> None:
-        # Wait before reconnect
-        if self._reconnect_attempt == 0:
-            self._retry_on_disconnect_delay = 10
+    def _release_slot(self, success: bool):
+        if self._slot is not None:
+            self._slot.release(success=success)
+            self._slot = None
 
-        self._reconnect_attempt += 1
-        if self._reconnect_attempt > MAX_RECONNECT_ATTEMPTS:
-            self._logger.error(
-                "Could not reconnect after %d attempts", MAX_RECONNECT_ATTEMPTS
-            )
-            self._set_state(
-                ConnectionState.ERROR_MAX_RECONNECT_ATTEMPTS_REACHED,
-                MaxReconnectAttemptsReached(
-                    attempts=MAX_RECONNECT_ATTEMPTS,
-                    last_error=self._last_exception,
-                ),
-            )
-            self._notify_disconnect(self._last_exception)
+    async def reconnect(self) -> None:
+        # Failed attempt does not schedule another reconnect, so it is retried here
+        while not self.is_connected:
+            if (delay := self._backoff.next_delay()) is None:
+                attempts = self._backoff.attempt - 1
+                self._logger.error("Could not reconnect after %d attempts", attempts)
+                self._backoff.reset()
+                self._set_state(
+                    ConnectionState.ERROR_MAX_RECONNECT_ATTEMPTS_REACHED,
+                    MaxReconnectAttemptsReached(
+                        attempts=attempts, last_error=self._last_exception
+                    ),
+                )
+                return
 
-            self._reconnect_attempt = 0
-            return
+            if self._scheduler is not None:
+                # Adapter that keeps failing for other devices is likely busy as well
+                delay = max(delay, self._scheduler.backoff(self._adapter))
 
-        self._logger.warning(
-            "Reconnecting to the device in %d seconds, attempt: %d/%d...",
-            self._retry_on_disconnect_delay,
-            self._reconnect_attempt,
-            MAX_RECONNECT_ATTEMPTS,
-        )
-        await asyncio.sleep(self._retry_on_disconnect_delay)
-        if not self._retry_on_disconnect:
-            self._logger.warning("Reconnect is aborted")
-            return
+            self._logger.warning(
+                "Reconnecting to the device in %.1f seconds, attempt: %d (%s)...",
+                delay,
+                self._backoff.attempt,
+                self._backoff.state,
+            )
+            await asyncio.sleep(delay)
+            if not self._retry_on_disconnect:
+                self._logger.warning("Reconnect is aborted")
+                return
 
-        self._retry_on_disconnect_delay += 10
-        self._set_state(ConnectionState.RECONNECTING)
-        await self.connect()
+            self._set_state(ConnectionState.RECONNECTING)
+            # Limit of initial connection attempts does not apply to reconnects
+            self._connection_attempt = 0
+            await self.connect(priority=ConnectPriority.RECONNECT)
 
     async def disconnect(self) -> None:
         self._logger.info(msg="Disconnecting from device")
         self._retry_on_disconnect = False
 
-        self._reconnect_attempt = 0
+        self._backoff.reset()
+        self._watchdog.stop()
         self._cancel_tasks()
+        self._send_queue.clear()
+        self._command_tracker.cancel_all()
 
         if self._client is not None and self._client.is_connected:
             self._set_state(ConnectionState.DISCONNECTING)
@@ -447,22 +600,30 @@ class Connection:
         self._last_state = self._state
         self._state = state
 
-        if state.is_error():
+        self._stats.connect_step(
+            state.value, finished=state.is_terminal(), success=state.authenticated()
+        )
+        if state.is_terminal():
+            self._release_slot(success=state.authenticated())
+
+        # Listeners are not notified about errors that are recovered from by reconnect
+        if state.is_error() and not (
+            self._retry_on_disconnect
+            and state is not ConnectionState.ERROR_MAX_RECONNECT_ATTEMPTS_REACHED
+        ):
             self._notify_disconnect(exc)
 
-    # En/Decrypt functions must create AES object every time, because
-    # it saves the internal state after encryption and become useless
-    async def decryptShared(self, encrypted_payload: str):
-        aes_shared = AES.new(self._shared_key, AES.MODE_CBC, self._iv)
-        return unpad(aes_shared.decrypt(encrypted_payload), AES.block_size)
+    async def decryptShared(self, encrypted_payload: bytes):
+        return self._shared_cipher.decrypt(encrypted_payload)
+
+    async def decryptSession(self, encrypted_payload: bytes):
+        return self._session_cipher.decrypt(encrypted_payload)
 
-    async def decryptSession(self, encrypted_payload: str):
-        aes_session = AES.new(self._session_key, AES.MODE_CBC, self._iv)
-        return unpad(aes_session.decrypt(encrypted_payload), AES.block_size)
+    async def decryptSessionMany(self, encrypted_payloads: list[memoryview]):
+        return self._session_cipher.decrypt_many(encrypted_payloads)
 
-    async def encryptSession(self, payload: str):
-        aes_session = AES.new(self._session_key, AES.MODE_CBC, self._iv)
-        return aes_session.encrypt(pad(payload, AES.block_size))
+    async def encryptSession(self, payload: bytes):
+        return self._session_cipher.encrypt(payload)
 
     async def genSessionKey(self, seed: bytes, srand: bytes):
         """Implements the necessary part of the logic, rest is skipped"""
@@ -496,7 +657,7 @@ class Connection:
         # Hashing data to get the session key
         return hashlib.md5(data).digest()
 
-    async def parseSimple(self, data: str):
+    async def parseSimple(self, data: bytes):
         """Deserializes bytes stream into the simple bytes"""
         self._logger.log_filtered(
             LogOptions.ENCRYPTED_PAYLOADS,
@@ -504,75 +665,68 @@ class Connection:
             bytearray(data).hex(),
         )
 
-        header = data[0:6]
-        data_end = 6 + struct.unpack("<H", header[4:6])[0]
-        payload_data = data[6 : data_end - 2]
-        payload_crc = data[data_end - 2 : data_end]
+        payloads = self._frame_decoder.feed(data)
+        if errors := self._pop_frame_errors():
+            self._frame_decoder.reset()
+            for error in errors:
+                self._stats.frame_error(error)
+                self._logger.error("parseSimple: %s", error)
+            raise PacketParseError(errors[0])
 
-        # Check the payload CRC16
-        if crc16(header + payload_data) != struct.unpack("<H", payload_crc)[0]:
-            error_msg = (
-                "parseSimple: Unable to parse simple packet - incorrect CRC16: %r"
+        if not payloads:
+            self._frame_decoder.reset()
+            self._logger.error(
+                "parseSimple: Unable to parse simple packet - incomplete: %r",
+                bytearray(data).hex(),
             )
-            payload_hex = bytearray(payload_data).hex()
-            self._logger.error(error_msg, payload_hex)
             raise PacketParseError
 
-        return payload_data
+        return bytes(payloads[0])
 
-    async def parseEncPackets(self, data: str) -> list[Packet]:
+    async def parseEncPackets(self, data: bytes) -> list[Packet]:
         """Deserializes bytes stream into a list of Packets"""
-        # In case there are leftovers from previous processing - adding them to current
-        # data
-        if self._enc_packet_buffer:
-            data = self._enc_packet_buffer + data
-            self._enc_packet_buffer = b""
-
         self._logger.log_filtered(
             LogOptions.ENCRYPTED_PAYLOADS,
             "parseEncPackets: Data: %r",
             bytearray(data).hex(),
         )
-        if len(data) < 8:
-            error_msg = (
-                "parseEncPackets: Unable to parse encrypted packet - too small: %r"
-            )
-            self._logger.error(error_msg, bytearray(data).hex())
-            raise EncPacketParseError
-
-        # Data can contain multiple EncPackets and even incomplete ones, so walking
-        # through
-        packets = []
-        while data:
-            if not data.startswith(EncPacket.PREFIX):
-                error_msg = (
-                    "parseEncPackets: Unable to parse encrypted packet - prefix is "
-                    "incorrect: %r"
-                )
-                self._logger.error(error_msg, bytearray(data).hex())
-                return packets
 
-            header = data[0:6]
-            data_end = 6 + struct.unpack("<H", header[4:6])[0]
-            if data_end > len(data):
-                self._enc_packet_buffer += data
-                break
+        # Data can contain multiple EncPackets and even incomplete ones, leftovers are
+        # kept by the decoder until the rest of the frame arrives
+        payloads = self._frame_decoder.feed(data)
+        self._stats.frames.add(len(payloads))
+
+        for error in self._pop_frame_errors():
+            self._stats.frame_error(error)
+            self._logger.error("parseEncPackets: %s", error)
+            if isinstance(error, PacketParseError):
+                await self.add_error(error)
+
+        # Decrypting all payloads at once, if any of them is corrupted, falling back to
+        # decrypting one by one so only the broken one is dropped
+        stats = self._stats
+        decrypted = None
+        if len(payloads) > 1:
+            with contextlib.suppress(ValueError):
+                start = time.perf_counter()
+                decrypted = await self.decryptSessionMany(payloads)
+                stats.decrypt_time.observe(time.perf_counter() - start)
 
-            payload_data = data[6 : data_end - 2]
-            payload_crc = data[data_end - 2 : data_end]
-
-            # Move to next data packet
-            data = data[data_end:]
+        packets = []
+        for i, payload_data in enumerate(payloads):
+            if decrypted is not None:
+                payload = decrypted[i]
+            else:
+                try:
+                    start = time.perf_counter()
+                    payload = await self.decryptSession(payload_data)
+                    stats.decrypt_time.observe(time.perf_counter() - start)
+                except Exception as e:  # noqa: BLE001
+                    stats.decrypt_errors += 1
+                    await self.add_error(e)
+                    continue
 
             try:
-                # Check the packet CRC16
-                if crc16(header + payload_data) != struct.unpack("<H", payload_crc)[0]:
-                    error_msg = "Unable to parse encrypted packet - incorrect CRC16: %r"
-                    self._logger.error(error_msg, bytearray(payload_data).hex())
-                    raise PacketParseError  # noqa: TRY301
-
-                # Decrypt the payload packet
-                payload = await self.decryptSession(payload_data)
                 self._logger.log_filtered(
                     LogOptions.DECRYPTED_PAYLOADS,
                     "parseEncPackets: decrypted payload: %r",
@@ -580,7 +734,9 @@ class Connection:
                 )
 
                 # Parse packet
+                start = time.perf_counter()
                 packet = await self._packet_parse(payload)
+                stats.packet_parse_time.observe(time.perf_counter() - start)
                 self._logger.log_filtered(
                     LogOptions.PACKETS,
                     "Parsed packet: %s",
@@ -589,11 +745,18 @@ class Connection:
                 if packet is not None:
                     packets.append(packet)
             except Exception as e:  # noqa: BLE001
+                stats.parse_errors += 1
                 await self.add_error(e)
 
+        stats.packets.add(len(packets))
         return packets
 
-    async def sendRequest(self, send_data: bytes, response_handler=None):
+    def _pop_frame_errors(self):
+        errors = self._frame_errors.copy()
+        self._frame_errors.clear()
+        return errors
+
+    async def sendRequest(self, send_data: bytes):
         self._logger.log_filtered(
             LogOptions.CONNECTION_DEBUG, "Sending: %r", bytearray(send_data).hex()
         )
@@ -601,7 +764,7 @@ class Connection:
         err = None
         for retry in range(4):
             try:
-                await self._sendRequest(send_data, response_handler)
+                await self._sendRequest(send_data)
             except Exception as e:  # noqa: BLE001
                 self._logger.log_filtered(
                     LogOptions.CONNECTION_DEBUG,
@@ -623,7 +786,7 @@ class Connection:
 
         await self.add_error(err)
 
-    async def _sendRequest(self, send_data: bytes, response_handler=None):
+    async def _sendRequest(self, send_data: bytes):
         # Make sure the connection is here, otherwise just skipping
         if self._client is None or not self._client.is_connected:
             self._logger.log_filtered(
@@ -633,30 +796,95 @@ class Connection:
             )
             return
 
-        if response_handler:
-            await self._client.start_notify(
-                Connection.NOTIFY_CHARACTERISTIC, response_handler
-            )
         await self._client.write_gatt_char(
             Connection.WRITE_CHARACTERISTIC, bytearray(send_data)
         )
 
-    async def sendPacket(self, packet: Packet, response_handler=None):
+    async def _writeFrame(self, data: bytes):
+        # Not retried here, failed write fails queued frames instead of blocking the
+        # queue, their senders decide whether to resend
+        if self._client is None or not self._client.is_connected:
+            raise PacketDropped("Device is disconnected")
+
+        self._logger.log_filtered(
+            LogOptions.CONNECTION_DEBUG, "Sending: %r", bytearray(data).hex()
+        )
+        try:
+            await self._sendRequest(data)
+        except Exception as e:
+            await self.add_error(e)
+            raise
+
+    def _maxWriteSize(self) -> int:
+        if not self._coalesce_writes or self._client is None:
+            return 0
+        # 3 bytes of ATT header
+        return self._client.mtu_size - 3
+
+    def _encryptPacket(self, packet: Packet) -> bytes:
         self._logger.log_filtered(
             LogOptions.CONNECTION_DEBUG, "Sending packet: %r", packet
         )
         # Wrapping and encrypting with session key
-        to_send = EncPacket(
+        return EncPacket(
             EncPacket.FRAME_TYPE_PROTOCOL,
             EncPacket.PAYLOAD_TYPE_VX_PROTOCOL,
             packet.toBytes(),
-            0,
-            0,
-            self._session_key,
-            self._iv,
+            cipher=self._session_cipher,
         ).toBytes()
 
-        await self.sendRequest(to_send, response_handler)
+    async def sendPacket(
+        self, packet: Packet, priority: SendPriority = SendPriority.COMMAND
+    ):
+        """
+        Send packet through the send queue and wait until it is written
+
+        Raises
+        ------
+        PacketDropped
+            If send queue was full or cleared before packet was written or device is
+            disconnected
+        """
+        await self._send_queue.send(self._encryptPacket(packet), priority)
+
+    def queuePacket(
+        self, packet: Packet, priority: SendPriority = SendPriority.NORMAL
+    ) -> asyncio.Future[None]:
+        """Queue packet without waiting for it to be sent"""
+        return self._send_queue.put(self._encryptPacket(packet), priority)
+
+    async def sendCommand(
+        self,
+        packet: Packet,
+        reply: CommandKey | None = None,
+        timeout: float | None = None,
+    ) -> asyncio.Future[Packet]:
+        """
+        Send command packet and return future resolved with device reply
+
+        Parameters
+        ----------
+        packet
+            Command packet, its sequence number is overwritten
+        reply, optional
+            (cmdSet, cmdId) of the reply, defaults to the same as the command
+        timeout, optional
+            Time in seconds after which future fails with `CommandTimeout`
+
+        Returns
+        -------
+            Future that is resolved with reply packet once the command is written,
+            awaiting it is optional. It fails with `CommandAborted` if connection is
+            lost before the reply arrives
+        """
+        future = self._command_tracker.track(packet, reply, timeout)
+        try:
+            await self.sendPacket(packet)
+        except BaseException:
+            future.cancel()
+            self._command_tracker.discard(future)
+            raise
+        return future
 
     async def replyPacket(self, packet: Packet):
         """Copy and change the packet to be reply packet and sends it back to device"""
@@ -675,15 +903,15 @@ class Connection:
             packet.seq,
             packet.productId,
         )
-        # Running reply asynchroneously
-        self._add_task(self.sendPacket(reply_packet))
+        # Acks are sent after all queued commands, nobody waits for them
+        self.queuePacket(reply_packet, SendPriority.ACK)
 
     async def initBleSessionKey(self):
         self._set_state(ConnectionState.PUBLIC_KEY_EXCHANGE)
         self._logger.log_filtered(
             LogOptions.CONNECTION_DEBUG, "initBleSessionKey: Pub key exchange"
         )
-        self._private_key = ecdsa.SigningKey.generate(curve=ecdsa.SECP160r1)
+        self._private_key = await self._key_material.private_key()
         self._public_key = self._private_key.get_verifying_key()
 
         to_send = EncPacket(
@@ -695,7 +923,27 @@ class Connection:
 
         # Device public key is sent as response, process will continue on device
         # response in handler
-        await self.sendRequest(to_send, self.initBleSessionKeyHandler)
+        await self.sendRequest(to_send)
+
+    async def notificationHandler(
+        self, characteristic: BleakGATTCharacteristic, recv_data: bytearray
+    ):
+        """Route notification to the handler of current connection state"""
+        self._stats.notification(len(recv_data))
+        handler = self._notification_handlers.get(self._state)
+        if handler is None:
+            if self._state.is_connecting():
+                # Between handshake steps, nothing is expected from the device
+                self._logger.log_filtered(
+                    LogOptions.CONNECTION_DEBUG,
+                    "Dropping notification in state %s: %r",
+                    self._state,
+                    bytearray(recv_data).hex(),
+                )
+                return
+            handler = self.listenForDataHandler
+
+        await handler(characteristic, recv_data)
 
     async def initBleSessionKeyHandler(
         self, characteristic: BleakGATTCharacteristic, recv_data: bytearray
@@ -704,7 +952,6 @@ class Connection:
             return
 
         self._set_state(ConnectionState.PUBLIC_KEY_RECEIVED)
-        await self._client.stop_notify(Connection.NOTIFY_CHARACTERISTIC)
 
         data = await self.parseSimple(bytes(recv_data))
         if len(data) < 3:
@@ -721,14 +968,15 @@ class Connection:
         # NOTE: The device will do the same with it's private key and our public key to
         # generate the # same shared key value and use it to encrypt/decrypt using
         # symmetric encryption algorithm
-        self._shared_key = ecdsa.ECDH(
-            ecdsa.SECP160r1, self._private_key, self._dev_pub_key
-        ).generate_sharedsecret_bytes()
+        self._shared_key = await self._key_material.shared_secret(
+            self._private_key, self._dev_pub_key
+        )
         # Set Initialization Vector from digest of the original shared key
         self._iv = hashlib.md5(self._shared_key).digest()
         if len(self._shared_key) > 16:
             # Using just 16 bytes of generated shared key
             self._shared_key = self._shared_key[0:16]
+        self._shared_cipher = SessionCipher(self._shared_key, self._iv)
 
         await self.getKeyInfoReq()
 
@@ -743,7 +991,7 @@ class Connection:
             b"\x02",  # command to get key info to make the shared key
         ).toBytes()
 
-        await self.sendRequest(to_send, self.getKeyInfoReqHandler)
+        await self.sendRequest(to_send)
 
     async def getKeyInfoReqHandler(
         self, characteristic: BleakGATTCharacteristic, recv_data: bytearray
@@ -752,7 +1000,6 @@ class Connection:
             return
 
         self._set_state(ConnectionState.SESSION_KEY_RECEIVED)
-        await self._client.stop_notify(Connection.NOTIFY_CHARACTERISTIC)
         encrypted_data = await self.parseSimple(bytes(recv_data))
 
         if encrypted_data[0] != 0x02:
@@ -766,6 +1013,8 @@ class Connection:
 
         # Parse the data that contains sRand (first 16 bytes) & seed (last 2 bytes)
         self._session_key = await self.genSessionKey(data[16:18], data[:16])
+        # Key is expanded only once and reused for every frame during this session
+        self._session_cipher = SessionCipher(self._session_key, self._iv)
 
         await self.getAuthStatus()
 
@@ -777,7 +1026,8 @@ class Connection:
 
         packet = Packet(0x21, 0x35, 0x35, 0x89, b"", 0x01, 0x01, self._packet_version)
 
-        await self.sendPacket(packet, self.getAuthStatusHandler)
+        # Handshake packets are written directly, send queue is used for data
+        await self.sendRequest(self._encryptPacket(packet))
 
     async def getAuthStatusHandler(
         self, characteristic: BleakGATTCharacteristic, recv_data: bytearray
@@ -786,7 +1036,6 @@ class Connection:
             return
 
         self._set_state(ConnectionState.AUTH_STATUS_RECEIVED)
-        await self._client.stop_notify(Connection.NOTIFY_CHARACTERISTIC)
         packets = await self.parseEncPackets(bytes(recv_data))
         if len(packets) < 1:
             raise PacketReceiveError
@@ -816,12 +1065,13 @@ class Connection:
             0x21, 0x35, 0x35, 0x86, payload, 0x01, 0x01, self._packet_version
         )
 
-        # Sending request and starting the common listener
-        await self.sendPacket(packet, self.listenForDataHandler)
+        # Response is processed by the common listener
+        await self.sendRequest(self._encryptPacket(packet))
 
     async def listenForDataHandler(
         self, characteristic: BleakGATTCharacteristic, recv_data: bytearray
     ):
+        self._watchdog.frame()
         try:
             packets = await self.parseEncPackets(bytes(recv_data))
         except Exception as e:  # noqa: BLE001
@@ -839,6 +1089,8 @@ class Connection:
                     error_msg = "Auth failed with response: %r"
                     self._logger.error(error_msg, packet)
                     exc = AuthFailedError(error_msg % packet)
+                    # Reconnect would fail the same way
+                    self._retry_on_disconnect = False
                     self._set_state(ConnectionState.ERROR_AUTH_FAILED, exc)
 
                     if self._client is not None and self._client.is_connected:
@@ -847,15 +1099,21 @@ class Connection:
                     raise exc
 
                 self._connection_attempt = 0
-                self._reconnect_attempt = 0
+                self._backoff.succeeded()
                 processed = True
                 self._logger.info("Auth completed, everything is fine")
                 self._set_state(ConnectionState.AUTHENTICATED)
                 self._connected.set()
+                self._watchdog.start()
             else:
+                self._watchdog.packet((packet.src, packet.cmdSet, packet.cmdId))
+                # Replies are still parsed by device as they usually contain new state
+                self._command_tracker.resolve(packet)
                 try:
                     # Processing the packet with specific device
+                    start = time.perf_counter()
                     processed = await self._data_parse(packet)
+                    self._stats.data_parse_time.observe(time.perf_counter() - start)
                 except Exception as e:  # noqa: BLE001
                     await self.add_error(e)
                     continue
@@ -865,6 +1123,29 @@ class Connection:
                     LogOptions.CONNECTION_DEBUG, "listenForDataHandler: %r", packet
                 )
 
+    def _on_stall(self, stage: int):
+        silence = time.monotonic() - (self._watchdog.last_frame_time or 0)
+        if stage == 1 and self._request_data is not None:
+            self._logger.warning(
+                "No data received for %.0f seconds, requesting data", silence
+            )
+            self._add_task(self._requestDataOrReconnect())
+            return
+
+        self._logger.warning("No data received for %.0f seconds, reconnecting", silence)
+        self._forceReconnect()
+
+    async def _requestDataOrReconnect(self):
+        assert self._request_data is not None
+        if not await self._request_data():
+            self._forceReconnect()
+
+    def _forceReconnect(self):
+        self._watchdog.stop()
+        # Reconnect is started from disconnect callback if it is enabled
+        if self._client is not None and self._client.is_connected:
+            self._add_task(self._client.disconnect())
+
     def _cancel_tasks(self):
         for task in self._tasks:
             task.cancel()
@@ -0,0 +1,180 @@
+import asyncio
+import heapq
+import itertools
+from enum import IntEnum
+
+DEFAULT_SLOTS = 2
+DEFAULT_STAGGER = 0.5
+DEFAULT_MAX_BACKOFF = 60.0
+DEFAULT_HOLD_TIMEOUT = 60.0
+
+
+class ConnectPriority(IntEnum):
+    """Priority of connection attempt, attempts with lower value are admitted first"""
+
+    RECONNECT = 0
+    SETUP = 1
+
+
+class SlotLease:
+    """Admission of single connection attempt to the adapter"""
+
+    __slots__ = ("_scheduler", "_timer", "adapter", "released")
+
+    def __init__(self, scheduler: "ConnectionScheduler", adapter: str):
+        self._scheduler = scheduler
+        self._timer: asyncio.TimerHandle | None = None
+        self.adapter = adapter
+        self.released = False
+
+    def release(self, success: bool):
+        """Release slot, failed attempts increase backoff of the adapter"""
+        self._scheduler._release(self, success)
+
+
+class _Adapter:
+    __slots__ = ("active", "failures", "next_admit", "slots", "timer", "waiting")
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self.active = 0
+        self.failures = 0
+        self.next_admit = 0.0
+        self.timer: asyncio.TimerHandle | None = None
+        self.waiting: list[tuple[int, int, asyncio.Future[SlotLease]]] = []
+
+
+class ConnectionScheduler:
+    """
+    Admits connection attempts of devices sharing the same adapter or proxy
+
+    Number of concurrent handshakes on every adapter is limited to its slot budget.
+    Waiting attempts are admitted in order of their priority with a delay between two
+    admissions. Every failed attempt doubles the delay up to the maximum, so devices
+    behind overloaded adapter back off together instead of competing for it, successful
+    attempt resets the delay.
+    """
+
+    def __init__(
+        self,
+        slots: int = DEFAULT_SLOTS,
+        stagger: float = DEFAULT_STAGGER,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        hold_timeout: float = DEFAULT_HOLD_TIMEOUT,
+    ):
+        """
+        Create connection scheduler
+
+        Parameters
+        ----------
+        slots, optional
+            Default number of concurrent connection attempts per adapter
+        stagger, optional
+            Minimum time in seconds between two admissions on the same adapter
+        max_backoff, optional
+            Maximum time in seconds between two admissions after failed attempts
+        hold_timeout, optional
+            Time in seconds after which slot that was not released is considered failed
+        """
+        self._slots = slots
+        self._stagger = stagger
+        self._max_backoff = max_backoff
+        self._hold_timeout = hold_timeout
+        self._adapters: dict[str, _Adapter] = {}
+        self._order = itertools.count()
+
+    def set_slots(self, adapter: str, slots: int):
+        """Set number of concurrent connection attempts for the adapter"""
+        state = self._adapter(adapter)
+        state.slots = slots
+        self._admit(adapter, state)
+
+    def backoff(self, adapter: str) -> float:
+        """Current delay in seconds between two admissions on the adapter"""
+        if (state := self._adapters.get(adapter)) is None:
+            return self._stagger
+        return min(self._stagger * 2**state.failures, self._max_backoff)
+
+    async def acquire(
+        self, adapter: str, priority: ConnectPriority = ConnectPriority.SETUP
+    ) -> SlotLease:
+        """
+        Wait until connection attempt can start on the adapter
+
+        Returned lease has to be released when the attempt finishes.
+        """
+        state = self._adapter(adapter)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(state.waiting, (priority, next(self._order), future))
+        self._admit(adapter, state)
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # admitted at the same time caller was cancelled
+                future.result().release(success=True)
+            raise
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {
+            adapter: {
+                "slots": state.slots,
+                "active": state.active,
+                "waiting": len(state.waiting),
+                "failures": state.failures,
+                "backoff": self.backoff(adapter),
+            }
+            for adapter, state in self._adapters.items()
+        }
+
+    def _adapter(self, adapter: str) -> _Adapter:
+        if (state := self._adapters.get(adapter)) is None:
+            state = self._adapters[adapter] = _Adapter(self._slots)
+        return state
+
+    def _admit(self, adapter: str, state: _Adapter):
+        loop = asyncio.get_running_loop()
+        while state.waiting and state.active < state.slots:
+            now = loop.time()
+            if now < state.next_admit:
+                if state.timer is None:
+                    state.timer = loop.call_at(
+                        state.next_admit, self._on_timer, adapter, state
+                    )
+                return
+
+            _, _, future = heapq.heappop(state.waiting)
+            if future.done():
+                continue
+
+            lease = SlotLease(self, adapter)
+            lease._timer = loop.call_later(self._hold_timeout, lease.release, False)
+            state.active += 1
+            state.next_admit = now + self.backoff(adapter)
+            future.set_result(lease)
+
+    def _on_timer(self, adapter: str, state: _Adapter):
+        state.timer = None
+        self._admit(adapter, state)
+
+    def _release(self, lease: SlotLease, success: bool):
+        if lease.released:
+            return
+
+        lease.released = True
+        if lease._timer is not None:
+            lease._timer.cancel()
+            lease._timer = None
+
+        state = self._adapters[lease.adapter]
+        state.active -= 1
+        if success:
+            state.failures = 0
+        else:
+            state.failures += 1
+            state.next_admit = max(
+                state.next_admit,
+                asyncio.get_running_loop().time() + self.backoff(lease.adapter),
+            )
+        self._admit(lease.adapter, state)
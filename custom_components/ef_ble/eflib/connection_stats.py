@@ -0,0 +1,196 @@
+import time
+
+from .command_tracker import LatencyHistogram
+from .exceptions import EncPacketParseError, PacketParseError
+
+DEFAULT_RATE_WINDOW = 60.0
+
+_RATE_BUCKETS = 12
+# weight of the newest sample in the recent processing time
+_SMOOTHING = 0.1
+
+
+class TimingHistogram(LatencyHistogram):
+    """Histogram of processing times, bounds are finer than for round-trip times"""
+
+    BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+
+    __slots__ = ("recent",)
+
+    def __init__(self):
+        super().__init__()
+        self.recent: float | None = None
+
+    def observe(self, seconds: float):
+        super().observe(seconds)
+        if self.recent is None:
+            self.recent = seconds
+        else:
+            self.recent += _SMOOTHING * (seconds - self.recent)
+
+    def as_dict(self):
+        return super().as_dict() | {"recent": self.recent}
+
+
+class RateCounter:
+    """
+    Counter with rate per second over sliding window
+
+    Window is split into fixed number of buckets, so counting is constant time and the
+    rate is updated every `window / 12` seconds.
+    """
+
+    __slots__ = ("_buckets", "_resolution", "_slot", "_started", "total")
+
+    def __init__(self, window: float = DEFAULT_RATE_WINDOW):
+        self._resolution = window / _RATE_BUCKETS
+        self._buckets = [0] * _RATE_BUCKETS
+        self._started = time.monotonic()
+        self._slot = int(self._started / self._resolution)
+        self.total = 0
+
+    def add(self, count: int = 1, now: float | None = None):
+        if now is None:
+            now = time.monotonic()
+        self._advance(int(now / self._resolution))
+        self._buckets[self._slot % _RATE_BUCKETS] += count
+        self.total += count
+
+    def rate(self, now: float | None = None) -> float:
+        """Average count per second over the window"""
+        if now is None:
+            now = time.monotonic()
+        self._advance(int(now / self._resolution))
+        # current bucket is only partially filled
+        span = (_RATE_BUCKETS - 1) * self._resolution + (
+            now - self._slot * self._resolution
+        )
+        span = min(span, now - self._started)
+        return sum(self._buckets) / span if span > 0 else 0.0
+
+    def _advance(self, slot: int):
+        if slot == self._slot:
+            return
+
+        for i in range(self._slot + 1, min(slot, self._slot + _RATE_BUCKETS) + 1):
+            self._buckets[i % _RATE_BUCKETS] = 0
+        self._slot = slot
+
+
+class ConnectionStats:
+    """
+    Performance counters of single connection
+
+    Counters are kept for the lifetime of the connection object, so they include all
+    reconnects. Steps of the connection attempt are timed from its start until the
+    connection is authenticated, only the last successful attempt is kept.
+    """
+
+    def __init__(self, rate_window: float = DEFAULT_RATE_WINDOW):
+        self.notifications = RateCounter(rate_window)
+        self.bytes = RateCounter(rate_window)
+        self.frames = RateCounter(rate_window)
+        self.packets = RateCounter(rate_window)
+
+        self.crc_errors = 0
+        self.prefix_errors = 0
+        self.decrypt_errors = 0
+        self.parse_errors = 0
+
+        self.decrypt_time = TimingHistogram()
+        self.packet_parse_time = TimingHistogram()
+        self.data_parse_time = TimingHistogram()
+
+        self.connects = 0
+        self.time_to_authenticated: float | None = None
+        self.connect_steps: dict[str, float] = {}
+
+        self._attempt_start: float | None = None
+        self._attempt_steps: dict[str, float] = {}
+        self._step: str | None = None
+        self._step_start = 0.0
+
+    def notification(self, size: int):
+        now = time.monotonic()
+        self.notifications.add(1, now)
+        self.bytes.add(size, now)
+
+    def frame_error(self, error: Exception):
+        if isinstance(error, EncPacketParseError):
+            self.prefix_errors += 1
+        elif isinstance(error, PacketParseError):
+            self.crc_errors += 1
+
+    def connect_started(self):
+        self._attempt_start = self._step_start = time.monotonic()
+        self._attempt_steps = {}
+        self._step = None
+
+    def connect_step(self, state: str, finished: bool = False, success: bool = False):
+        """
+        Register state change of the connection
+
+        Parameters
+        ----------
+        state
+            New state of the connection
+        finished, optional
+            True if state ends the connection attempt
+        success, optional
+            True if connection attempt ended with authenticated connection
+        """
+        if self._attempt_start is None:
+            return
+
+        now = time.monotonic()
+        if self._step is not None:
+            self._attempt_steps[self._step] = (
+                self._attempt_steps.get(self._step, 0.0) + now - self._step_start
+            )
+        self._step = state
+        self._step_start = now
+
+        if not finished:
+            return
+
+        if success:
+            self.connects += 1
+            self.time_to_authenticated = now - self._attempt_start
+            self.connect_steps = self._attempt_steps
+        self._attempt_start = None
+        self._attempt_steps = {}
+        self._step = None
+
+    def as_dict(self):
+        now = time.monotonic()
+        return {
+            "rates": {
+                name: counter.rate(now)
+                for name, counter in (
+                    ("notifications", self.notifications),
+                    ("bytes", self.bytes),
+                    ("frames", self.frames),
+                    ("packets", self.packets),
+                )
+            },
+            "totals": {
+                "notifications": self.notifications.total,
+                "bytes": self.bytes.total,
+                "frames": self.frames.total,
+                "packets": self.packets.total,
+            },
+            "errors": {
+                "crc": self.crc_errors,
+                "prefix": self.prefix_errors,
+                "decrypt": self.decrypt_errors,
+                "parse": self.parse_errors,
+            },
+            "timings": {
+                "decrypt": self.decrypt_time.as_dict(),
+                "packet_parse": self.packet_parse_time.as_dict(),
+                "data_parse": self.data_parse_time.as_dict(),
+            },
+            "connects": self.connects,
+            "time_to_authenticated": self.time_to_authenticated,
+            "connect_steps": self.connect_steps,
+        }
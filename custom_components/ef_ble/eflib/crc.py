@@ -1,20 +1,91 @@
-"""Utils for simple use of crc"""
+"""
+Table-driven CRC8/CRC16 checksums used by packet framing
 
-from crc import Calculator, Configuration, Crc8
+Both checksums are computed with precomputed 256-entry lookup tables, so each byte
+costs a single table lookup instead of eight shift/xor rounds. Functions accept any
+bytes-like object (`bytes`, `bytearray` or `memoryview`) without copying.
+"""
 
-crc16_arc = Configuration(
-    width=16,
-    polynomial=0x8005,
-    init_value=0x0000,
-    final_xor_value=0x0000,
-    reverse_input=True,
-    reverse_output=True,
-)
+from typing import Self
 
+type Buffer = bytes | bytearray | memoryview
 
-def crc8(data: str):
-    return Calculator(Crc8.CCITT).checksum(data)
 
+def _make_crc8_table(polynomial: int) -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial) if crc & 0x80 else (crc << 1)
+        table.append(crc & 0xFF)
+    return tuple(table)
 
-def crc16(data: str):
-    return Calculator(crc16_arc).checksum(data)
+
+def _make_crc16_reflected_table(polynomial: int) -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc >> 1) ^ polynomial) if crc & 0x01 else (crc >> 1)
+        table.append(crc)
+    return tuple(table)
+
+
+# CRC-8/CCITT: poly 0x07, init 0x00, no reflection, no final xor
+_CRC8_TABLE = _make_crc8_table(0x07)
+# CRC-16/ARC: poly 0x8005 (reflected 0xA001), init 0x0000, reflected in/out
+_CRC16_TABLE = _make_crc16_reflected_table(0xA001)
+
+
+class Crc8:
+    """Incremental CRC-8/CCITT calculator"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, data: Buffer = b"") -> None:
+        self.value = 0
+        if data:
+            self.update(data)
+
+    def update(self, data: Buffer) -> Self:
+        crc = self.value
+        table = _CRC8_TABLE
+        for byte in data:
+            crc = table[crc ^ byte]
+        self.value = crc
+        return self
+
+
+class Crc16:
+    """Incremental CRC-16/ARC calculator"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, data: Buffer = b"") -> None:
+        self.value = 0
+        if data:
+            self.update(data)
+
+    def update(self, data: Buffer) -> Self:
+        crc = self.value
+        table = _CRC16_TABLE
+        for byte in data:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        self.value = crc
+        return self
+
+
+def crc8(data: Buffer) -> int:
+    crc = 0
+    table = _CRC8_TABLE
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+
+def crc16(data: Buffer) -> int:
+    crc = 0
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
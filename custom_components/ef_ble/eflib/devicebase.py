@@ -1,16 +1,91 @@
 import abc
+import asyncio
+import inspect
 import time
-from collections import defaultdict
-from collections.abc import Callable
-from typing import Any
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, ClassVar, NamedTuple
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 from bleak_retry_connector import MAX_CONNECT_ATTEMPTS
+from google.protobuf.message import Message
 
+from .command_tracker import CONFIG_WRITE_ACK
+from .config_merger import DEFAULT_MERGE_WINDOW, ConfigWriteMerger
 from .connection import Connection, ConnectionState, DisconnectListener
+from .connection_scheduler import ConnectionScheduler
+from .connection_stats import TimingHistogram
 from .logging_util import DeviceLogger, LogOptions
 from .packet import Packet
+from .reconnect_policy import ReconnectPolicy
+from .send_queue import DropPolicy
+from .update_scheduler import DEFAULT_WARMUP, UpdateScheduler
+
+type PacketKey = tuple[int, int, int]
+
+
+class _PacketHandler(NamedTuple):
+    message_types: tuple[type, ...]
+    method_name: str | None
+    reply: bool = False
+    skip_unchanged: bool = False
+
+
+def packet_handler[**P, R: Awaitable[Any]](
+    src: int,
+    cmd_set: int,
+    cmd_id: int,
+    message_type: type | tuple[type, ...] | None = None,
+    *,
+    reply: bool = False,
+    skip_unchanged: bool = False,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Register decorated coroutine method as handler of packets on device class
+
+    Handlers are inherited by subclasses and can be overridden by registering another
+    handler for the same key. Decorator can be stacked to handle multiple keys.
+
+    Parameters
+    ----------
+    src
+        Source of the packet
+    cmd_set
+        Command set of the packet
+    cmd_id
+        Command id of the packet
+    message_type, optional
+        Message type or tuple of message types that packet payload is decoded into
+        with `update_from_bytes` before handler is called
+    reply, optional
+        If True, packet is sent back to device as acknowledgement before it is
+        processed, even if the rest of processing is skipped
+    skip_unchanged, optional
+        If True, decoding and handler are skipped for payload identical to the last
+        one received with the same key, use only if handler just updates fields
+        decoded from `message_type`
+    """
+    if message_type is None:
+        message_types = ()
+    elif isinstance(message_type, tuple):
+        message_types = message_type
+    else:
+        message_types = (message_type,)
+
+    def _decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"Packet handler '{func.__name__}' has to be a coroutine")
+
+        keys = getattr(func, "_packet_keys", [])
+        setattr(
+            func,
+            "_packet_keys",
+            [*keys, ((src, cmd_set, cmd_id), message_types, reply, skip_unchanged)],
+        )
+        return func
+
+    return _decorator
 
 
 class DeviceBase(abc.ABC):
@@ -18,6 +93,75 @@ class DeviceBase(abc.ABC):
 
     MANUFACTURER_KEY = 0xB5B5
 
+    # Packets that only need their payload decoded, (src, cmdSet, cmdId) -> message type
+    # Identical payloads received repeatedly for the same key are decoded only once
+    PACKET_MESSAGES: ClassVar[dict[PacketKey, type]] = {}
+
+    # Destination of config write packets
+    CONFIG_WRITE_DST: ClassVar[int] = 0x02
+
+    _packet_handlers: ClassVar[dict[PacketKey, _PacketHandler]] = {}
+    # Cached payloads invalidated by processing packet with the key, as they decode
+    # the same message types into the same fields
+    _payload_cache_peers: ClassVar[dict[PacketKey, tuple[PacketKey, ...]]] = {}
+    # Fields with change policies decoded from packet with the key
+    _payload_cache_policy_fields: ClassVar[dict[PacketKey, tuple[Any, ...]]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        handlers: dict[PacketKey, _PacketHandler] = {}
+        for klass in reversed(cls.__mro__):
+            for key, message_type in vars(klass).get("PACKET_MESSAGES", {}).items():
+                handlers[key] = _PacketHandler(
+                    (message_type,), None, skip_unchanged=True
+                )
+
+            for name, attr in vars(klass).items():
+                if not inspect.iscoroutinefunction(attr):
+                    continue
+
+                for key, message_types, reply, skip_unchanged in getattr(
+                    attr, "_packet_keys", []
+                ):
+                    handlers[key] = _PacketHandler(
+                        message_types, name, reply, skip_unchanged
+                    )
+
+        cls._packet_handlers = handlers
+
+        cached = {
+            key: set(handler.message_types)
+            for key, handler in handlers.items()
+            if handler.skip_unchanged
+        }
+        cls._payload_cache_peers = {
+            key: peers
+            for key, handler in handlers.items()
+            if (
+                peers := tuple(
+                    other
+                    for other, types in cached.items()
+                    if other != key and types.intersection(handler.message_types)
+                )
+            )
+        }
+
+        policy_fields = [
+            field
+            for field in getattr(cls, "_fields", ())
+            if field.change_policy is not None
+        ]
+        cls._payload_cache_policy_fields = {
+            key: fields
+            for key, types in cached.items()
+            if (
+                fields := tuple(
+                    field for field in policy_fields if field.message_type in types
+                )
+            )
+        }
+
     @classmethod
     @abc.abstractmethod
     def check(cls, sn: bytes) -> bool: ...
@@ -47,13 +191,26 @@ class DeviceBase(abc.ABC):
         self._state_update_callbacks: dict[str, set[Callable[[Any], None]]] = (
             defaultdict(set)
         )
-        self._update_period = 0
-        self._last_updated = 0
-        self._props_to_update = set()
-        self._wait_until_throttle = 0
+        self._batch_update_callbacks: dict[
+            str, set[Callable[[dict[str, Any]], None]]
+        ] = defaultdict(set)
+        self._update_scheduler = UpdateScheduler(self._run_callbacks)
+        self._config_merger = ConfigWriteMerger(self._write_config_packet)
 
         self._reconnect_disabled = False
+        self._send_queue_options: dict[str, Any] = {}
+        self._reconnect_policy: ReconnectPolicy | None = None
+        self._connection_scheduler: ConnectionScheduler | None = None
+        self._adapter = ""
         self._disconnect_listeners: list[DisconnectListener] = []
+        self._availability_listeners: list[Callable[[bool], None]] = []
+        self._available = False
+        self._unhandled_packets: Counter[PacketKey] = Counter()
+        self._last_payloads: dict[PacketKey, bytes] = {}
+        self._payload_cache_hits = 0
+        self._payload_cache_misses = 0
+        self._last_packet_time: float | None = None
+        self._callback_time = TimingHistogram()
 
     @property
     def device(self):
@@ -83,6 +240,109 @@ class DeviceBase(abc.ABC):
     def is_connected(self) -> bool:
         return self._conn is not None and self._conn.is_connected
 
+    @property
+    def is_available(self) -> bool:
+        """True while connection is authenticated, see `on_availability_change`"""
+        return self._available
+
+    @property
+    def unhandled_packets(self) -> dict[PacketKey, int]:
+        """Number of received packets without handler by (src, cmdSet, cmdId)"""
+        return dict(self._unhandled_packets)
+
+    @property
+    def payload_cache_hits(self) -> int:
+        """Number of packets skipped because their payload did not change"""
+        return self._payload_cache_hits
+
+    @property
+    def payload_cache_misses(self) -> int:
+        """Number of packets decoded because their payload changed"""
+        return self._payload_cache_misses
+
+    @property
+    def last_packet_time(self) -> float | None:
+        """Value of `time.monotonic()` when the last packet was received"""
+        return self._last_packet_time
+
+    @property
+    def performance_stats(self) -> dict[str, Any] | None:
+        """Snapshot of performance counters of the connection and the device"""
+        if self._conn is None:
+            return None
+
+        send_queue = self._conn.send_queue
+        return self._conn.stats.as_dict() | {
+            "callbacks": self._callback_time.as_dict(),
+            "reconnects": self._conn.reconnect_backoff.reconnects,
+            "payload_cache": {
+                "hits": self._payload_cache_hits,
+                "misses": self._payload_cache_misses,
+            },
+            "unhandled_packets": self._unhandled_packets.total(),
+            "send_queue": {
+                "depth": len(send_queue),
+                "dropped": send_queue.dropped,
+                "writes": send_queue.writes,
+                "frames": send_queue.frames,
+            },
+        }
+
+    # Performance counters exposed as diagnostic sensors
+
+    @property
+    def link_frame_rate(self) -> float | None:
+        return None if self._conn is None else self._conn.stats.frames.rate()
+
+    @property
+    def link_byte_rate(self) -> float | None:
+        return None if self._conn is None else self._conn.stats.bytes.rate()
+
+    @property
+    def link_packet_rate(self) -> float | None:
+        return None if self._conn is None else self._conn.stats.packets.rate()
+
+    @property
+    def link_crc_errors(self) -> int | None:
+        return None if self._conn is None else self._conn.stats.crc_errors
+
+    @property
+    def link_prefix_errors(self) -> int | None:
+        return None if self._conn is None else self._conn.stats.prefix_errors
+
+    @property
+    def link_decrypt_errors(self) -> int | None:
+        return None if self._conn is None else self._conn.stats.decrypt_errors
+
+    @property
+    def link_decrypt_time(self) -> float | None:
+        """Recent decrypt time in milliseconds"""
+        return None if self._conn is None else _ms(self._conn.stats.decrypt_time)
+
+    @property
+    def link_packet_parse_time(self) -> float | None:
+        """Recent `packet_parse` time in milliseconds"""
+        return None if self._conn is None else _ms(self._conn.stats.packet_parse_time)
+
+    @property
+    def link_data_parse_time(self) -> float | None:
+        """Recent `data_parse` time in milliseconds"""
+        return None if self._conn is None else _ms(self._conn.stats.data_parse_time)
+
+    @property
+    def link_callback_time(self) -> float | None:
+        """Recent time of running update callbacks in milliseconds"""
+        return _ms(self._callback_time)
+
+    @property
+    def link_time_to_authenticated(self) -> float | None:
+        """Duration of the last successful connection attempt in seconds"""
+        return None if self._conn is None else self._conn.stats.time_to_authenticated
+
+    @property
+    def link_reconnects(self) -> int | None:
+        return None if self._conn is None else self._conn.reconnect_backoff.reconnects
+
     @property
     def packet_version(self) -> int:
         return 0x03
@@ -91,8 +351,27 @@ class DeviceBase(abc.ABC):
     def connection_state(self):
         return None if self._conn is None else self._conn._state
 
-    def with_update_period(self, period: int):
-        self._update_period = period
+    def with_update_period(
+        self,
+        period: float,
+        field_periods: dict[str, float] | None = None,
+        warmup: float = DEFAULT_WARMUP,
+    ):
+        """
+        Set minimum time between callbacks for updated properties
+
+        Parameters
+        ----------
+        period
+            Period in seconds, 0 runs callbacks immediately after property update
+        field_periods, optional
+            Periods for specific properties that override default period
+        warmup, optional
+            Time in seconds after first update during which callbacks are not throttled
+        """
+        self._update_scheduler.with_period(period, warmup=warmup)
+        for field_name, field_period in (field_periods or {}).items():
+            self._update_scheduler.set_field_period(field_name, field_period)
         return self
 
     def with_logging_options(self, options: LogOptions):
@@ -107,10 +386,141 @@ class DeviceBase(abc.ABC):
             self._conn.with_disabled_reconnect(is_disabled)
         return self
 
+    def with_reconnect_policy(self, policy: ReconnectPolicy):
+        """Set delays between attempts to restore lost connection"""
+        self._reconnect_policy = policy
+        if self._conn is not None:
+            self._conn.with_reconnect_policy(policy)
+        return self
+
+    @property
+    def reconnect_state(self) -> dict[str, Any] | None:
+        """State of reconnect backoff and circuit breaker"""
+        return None if self._conn is None else self._conn.reconnect_backoff.as_dict()
+
+    def with_send_queue(
+        self,
+        max_depth: int | None = None,
+        drop_policy: DropPolicy | None = None,
+        coalesce_writes: bool | None = None,
+    ):
+        """Configure queue of outgoing packets, see `Connection.with_send_queue`"""
+        options = {
+            "max_depth": max_depth,
+            "drop_policy": drop_policy,
+            "coalesce_writes": coalesce_writes,
+        }
+        self._send_queue_options |= {
+            name: value for name, value in options.items() if value is not None
+        }
+        if self._conn is not None:
+            self._conn.with_send_queue(**self._send_queue_options)
+        return self
+
+    def with_connection_scheduler(
+        self, scheduler: ConnectionScheduler | None, adapter: str = ""
+    ):
+        """Share adapter with other devices, see `Connection.with_connection_scheduler`"""
+        self._connection_scheduler = scheduler
+        self._adapter = adapter
+        if self._conn is not None:
+            self._conn.with_connection_scheduler(scheduler, adapter)
+        return self
+
+    def with_config_merge_window(self, window: float = DEFAULT_MERGE_WINDOW):
+        """
+        Set time in seconds during which config writes are merged into single packet
+
+        0 sends every config write as separate packet.
+        """
+        self._config_merger.with_window(window)
+        return self
+
+    async def _send_config_packet(self, message: Message) -> asyncio.Future[Packet]:
+        """
+        Send config message to device
+
+        Messages sent within merge window are merged into a single packet.
+
+        Returns
+        -------
+            Future resolved with device reply, see `Connection.sendCommand`
+        """
+        return await self._config_merger.send(message)
+
+    async def _write_config_packet(self, message: Message) -> asyncio.Future[Packet]:
+        """Send packet with config message to `CONFIG_WRITE_DST`"""
+        payload = message.SerializeToString()
+        packet = Packet(
+            0x20, self.CONFIG_WRITE_DST, 0xFE, 0x11, payload, 0x01, 0x01, 0x13
+        )
+        return await self._conn.sendCommand(packet, reply=CONFIG_WRITE_ACK)  # type: ignore reportOptionalMemberAccess
+
     async def data_parse(self, packet: Packet) -> bool:
         """Function to parse incoming data and trigger sensors update"""
         return False
 
+    async def dispatch_packet(self, packet: Packet) -> bool:
+        """
+        Process packet with handler registered for its src, cmdSet and cmdId
+
+        Devices push the same state over and over, so if handler allows it, payload
+        identical to the last one with the same key is not decoded again. Payload is
+        still decoded if other packet decoded the same message type in the meantime,
+        or if a field with change policy would be published again. Replies are sent for
+        every packet.
+
+        Returns
+        -------
+            True if packet was processed, False if there is no handler for it
+        """
+        self._last_packet_time = time.monotonic()
+
+        key = (packet.src, packet.cmdSet, packet.cmdId)
+        if (handler := self._packet_handlers.get(key)) is None:
+            self._unhandled_packets[key] += 1
+            return False
+
+        if handler.reply:
+            await self._conn.replyPacket(packet)  # type: ignore reportOptionalMemberAccess
+
+        if handler.skip_unchanged:
+            if self._last_payloads.get(key) == packet.payload and not (
+                (fields := self._payload_cache_policy_fields.get(key))
+                and self._change_pending(fields)  # type: ignore reportAttributeAccessIssue
+            ):
+                self._payload_cache_hits += 1
+                return True
+            self._payload_cache_misses += 1
+
+        for peer in self._payload_cache_peers.get(key, ()):
+            self._last_payloads.pop(peer, None)
+
+        for message_type in handler.message_types:
+            self.update_from_bytes(message_type, packet.payload)  # type: ignore reportAttributeAccessIssue
+
+        if handler.method_name is not None:
+            await getattr(self, handler.method_name)(packet)
+
+        # payload is stored only after it was processed successfully
+        if handler.skip_unchanged:
+            self._last_payloads[key] = bytes(packet.payload)
+        return True
+
+    @packet_handler(0x35, 0x35, 0x20)
+    async def _on_ping(self, packet: Packet):
+        self._logger.debug("%s: %s: Ping received: %r", self.address, self.name, packet)
+
+    async def request_data(self) -> bool:
+        """
+        Ask device to push its data again
+
+        Returns
+        -------
+            False if device does not support such request
+        """
+        return False
+
     async def packet_parse(self, data: bytes):
         """Function to parse packet"""
         return Packet.fromBytes(data)
@@ -129,14 +539,23 @@ class DeviceBase(abc.ABC):
                     user_id,
                     self.data_parse,
                     self.packet_parse,
+                    on_state_change=self._on_connection_state_change,
                     packet_version=self.packet_version,
                 )
                 .with_logging_options(self._logger.options)
                 .with_disabled_reconnect(self._reconnect_disabled)
+                .with_send_queue(**self._send_queue_options)
+                .with_connection_scheduler(self._connection_scheduler, self._adapter)
+                .with_data_request(self.request_data)
+                .with_push_keys(self._packet_handlers)
             )
+            if self._reconnect_policy is not None:
+                self._conn.with_reconnect_policy(self._reconnect_policy)
             self._logger.info("Connecting to %s", self.device)
 
             def _disconnect_callback(exc):
+                # device state may change while disconnected
+                self._last_payloads.clear()
                 for callback in self._disconnect_listeners:
                     callback(exc)
 
@@ -152,6 +571,9 @@ class DeviceBase(abc.ABC):
             return
 
         await self._conn.disconnect()
+        self._update_scheduler.cancel()
+        self._config_merger.cancel()
+        self._last_payloads.clear()
 
     async def wait_connected(self, timeout: int = 20):
         if self._conn is None:
@@ -196,16 +618,64 @@ class DeviceBase(abc.ABC):
 
         return _unlisten
 
+    def on_availability_change(self, listener: Callable[[bool], None]):
+        """
+        Add listener called when device becomes available or unavailable
+
+        Device is available while it is authenticated, listener receives new
+        availability. Unlike disconnect listeners, it is also called when connection
+        is lost and restored by reconnect.
+
+        Return
+        -------
+        Function to remove this listener
+        """
+        self._availability_listeners.append(listener)
+
+        def _unlisten():
+            self._availability_listeners.remove(listener)
+
+        return _unlisten
+
+    def _on_connection_state_change(self, state: ConnectionState):
+        if (available := state.authenticated()) == self._available:
+            return
+
+        self._available = available
+        if not available:
+            # device state may change while disconnected
+            self._last_payloads.clear()
+
+        for listener in list(self._availability_listeners):
+            listener(available)
+
     def register_callback(
-        self, callback: Callable[[], None], propname: str | None = None
+        self,
+        callback: Callable[[], None],
+        propname: str | None = None,
+        period: float | None = None,
     ) -> None:
-        """Register callback, called when Device changes state."""
+        """
+        Register callback, called when Device changes state.
+
+        Parameters
+        ----------
+        callback
+            Function called after property is updated
+        propname, optional
+            Name of property to watch
+        period, optional
+            Minimum time in seconds between calls for this property, overrides period
+            set with `with_update_period`
+        """
         if propname is None:
             self._callbacks.add(callback)
         else:
             self._callbacks_map[propname] = self._callbacks_map.get(
                 propname, set()
             ).union([callback])
+            if period is not None:
+                self._update_scheduler.set_field_period(propname, period)
 
     def remove_callback(
         self, callback: Callable[[], None], propname: str | None = None
@@ -216,31 +686,21 @@ class DeviceBase(abc.ABC):
         else:
             self._callbacks_map.get(propname, set()).discard(callback)
 
-    def update_callback(self, propname: str) -> None:
-        """Find the registered callbacks in the map and then calling the callbacks"""
-
-        self._props_to_update.add(propname)
-
-        if self._update_period != 0:
-            now = time.time()
-            if now - self._last_updated < self._update_period:
-                if self._wait_until_throttle is None:
-                    return
-
-                # let first few messages update as soon as they come, otherwise everything
-                # would display unknown until first period ends
-                if self._wait_until_throttle == 0:
-                    self._wait_until_throttle = now + 5
-                elif self._wait_until_throttle < now:
-                    self._wait_until_throttle = None
-
-            self._last_updated = now
-
-        for prop in self._props_to_update:
-            for callback in self._callbacks_map.get(prop, set()):
-                callback()
-
-        self._props_to_update.clear()
+    def update_callback(self, *propnames: str) -> None:
+        """Schedule registered callbacks of updated properties"""
+        self._update_scheduler.mark_dirty(*propnames)
+
+    def _run_callbacks(self, propnames: Iterable[str]):
+        start = time.perf_counter()
+        # callback registered for multiple properties is called only once
+        callbacks = {
+            callback: None
+            for prop in propnames
+            for callback in self._callbacks_map.get(prop, ())
+        }
+        for callback in callbacks:
+            callback()
+        self._callback_time.observe(time.perf_counter() - start)
 
     def register_state_update_callback(
         self, state_update_callback: Callable[[Any], None], propname: str
@@ -261,3 +721,78 @@ class DeviceBase(abc.ABC):
 
         for update in self._state_update_callbacks[propname]:
             update(value)
+
+    def register_batch_update_callback(
+        self,
+        callback: Callable[[dict[str, Any]], None],
+        propnames: Iterable[str],
+    ):
+        """
+        Register a callback that receives all updated properties it watches at once
+
+        Callback is called once per `publish_updates` with dictionary of updated
+        property names and their values, so entities depending on multiple properties
+        can update their state only once.
+        """
+        for propname in propnames:
+            self._batch_update_callbacks[propname].add(callback)
+
+    def remove_batch_update_callback(
+        self,
+        callback: Callable[[dict[str, Any]], None],
+        propnames: Iterable[str],
+    ):
+        """Remove previously registered batch update callback"""
+        for propname in propnames:
+            self._batch_update_callbacks[propname].discard(callback)
+
+    def publish_updates(
+        self,
+        propnames: Iterable[str],
+        on_error: Callable[[str, Exception], None] | None = None,
+    ):
+        """
+        Run all callbacks for properties updated from single packet
+
+        Parameters
+        ----------
+        propnames
+            Names of updated properties
+        on_error, optional
+            Function called with property name and exception if reading the property
+            or running its callbacks fails, the rest of properties is still published.
+            If not set, the exception is raised.
+        """
+        propnames = list(dict.fromkeys(propnames))
+        self.update_callback(*propnames)
+
+        start = time.perf_counter()
+        batches: dict[Callable[[dict[str, Any]], None], dict[str, Any]] = {}
+        for propname in propnames:
+            try:
+                value = getattr(self, propname)
+                self.update_state(propname, value)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(propname, e)
+                continue
+
+            if propname not in self._batch_update_callbacks:
+                continue
+
+            for callback in self._batch_update_callbacks[propname]:
+                batches.setdefault(callback, {})[propname] = value
+
+        for callback, updates in batches.items():
+            try:
+                callback(updates)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(", ".join(updates), e)
+        self._callback_time.observe(time.perf_counter() - start)
+
+
+def _ms(histogram: TimingHistogram):
+    return None if histogram.recent is None else histogram.recent * 1000
@@ -16,6 +16,59 @@ __all__ = [
     if f.is_file() and f.stem != "__init__"
 ]
 
-devices: list["ModuleWithDevice | ModuleType"] = [
-    importlib.import_module(f".{device}", __name__) for device in __all__
-]
+# First 4 bytes of serial number -> device module, has to match `SN_PREFIX` of device.
+# Modules are imported only after device with matching serial number is found, so
+# protobuf descriptors of unrelated models are never loaded.
+SN_PREFIX_TO_MODULE: dict[bytes, str] = {
+    b"F371": "alternator_charger",
+    b"F372": "alternator_charger",
+    b"DC01": "alternator_charger",
+    b"R331": "delta2",
+    b"R335": "delta2",
+    b"D361": "delta2_plus",
+    b"P231": "delta3",
+    b"P321": "delta3_classic",
+    b"D3N1": "delta3_max",
+    b"D3M1": "delta3_max_plus",
+    b"P351": "delta3_plus",
+    b"D751": "delta3_ultra",
+    b"MR51": "delta_pro_3",
+    b"Y711": "dpu",
+    b"R651": "river3",
+    b"R653": "river3",
+    b"R654": "river3",
+    b"R655": "river3",
+    b"R631": "river3_plus",
+    b"R634": "river3_plus",
+    b"R635": "river3_plus",
+    b"HD31": "shp2",
+    b"G371": "smart_generator",
+    b"G351": "smart_generator_4k",
+    b"BK51": "stream_ac",
+    b"BK31": "stream_ac_pro",
+    b"BK41": "stream_max",
+    b"BK12": "stream_pro",
+    b"BK11": "stream_ultra",
+    b"ES11": "stream_ultra",
+    b"BK61": "stream_ultra",
+    b"AC71": "wave3",
+}
+
+
+def module_for_sn(sn: bytes) -> "ModuleWithDevice | ModuleType | None":
+    """Import and return device module that supports provided serial number"""
+    if (module_name := SN_PREFIX_TO_MODULE.get(sn[:4])) is None:
+        return None
+    return importlib.import_module(f".{module_name}", __name__)
+
+
+def __getattr__(name: str):
+    # importing every device module is expensive, so list of all modules is created
+    # only when it is requested
+    if name == "devices":
+        devices: list[ModuleWithDevice | ModuleType] = [
+            importlib.import_module(f".{device}", __name__) for device in __all__
+        ]
+        globals()["devices"] = devices
+        return devices
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
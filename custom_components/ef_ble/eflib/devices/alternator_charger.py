@@ -4,7 +4,7 @@ from math import floor
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
-from ..commands import TimeCommands
+from ..commands import TimeSync
 from ..devicebase import DeviceBase
 from ..packet import Packet
 from ..pb import dc009_apl_comm_pb2
@@ -45,12 +45,15 @@ class ChargerMode(IntFieldValue):
         }[self]
 
 
-class Device(DeviceBase, ProtobufProps):
+class Device(DeviceBase, ProtobufProps, TimeSync):
     """Smart Generator"""
 
     SN_PREFIX = (b"F371", b"F372", b"DC01")
     NAME_PREFIX = "EF-F3"
 
+    PACKET_MESSAGES = {(0x14, 0xFE, 0x15): dc009_apl_comm_pb2.DisplayPropertyUpload}
+    CONFIG_WRITE_DST = 0x14
+
     battery_level = pb_field(pb.cms_batt_soc)
     battery_temperature = pb_field(pb.cms_batt_temp)
     dc_power = pb_field(pb.pow_get_dc_bidi)
@@ -78,7 +81,6 @@ class Device(DeviceBase, ProtobufProps):
         self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
     ) -> None:
         super().__init__(ble_dev, adv_data, sn)
-        self._time_commands = TimeCommands(device=self)
         self.start_voltage_min = 11
         self.start_voltage_max = 31
 
@@ -101,33 +103,12 @@ class Device(DeviceBase, ProtobufProps):
         return Packet.fromBytes(data, is_xor=True)
 
     async def data_parse(self, packet: Packet):
-        processed = False
+        processed = await self.dispatch_packet(packet)
 
-        if packet.src == 0x14 and packet.cmdSet == 0xFE and packet.cmdId == 0x15:
-            self.update_from_bytes(
-                dc009_apl_comm_pb2.DisplayPropertyUpload, packet.payload
-            )
-            processed = True
-        elif (
-            packet.src == 0x35
-            and packet.cmdSet == 0x01
-            and packet.cmdId == Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME
-        ):
-            if len(packet.payload) == 0:
-                self._time_commands.async_send_all()
-            processed = True
-
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        self.publish_updates(self.updated_fields)
 
         return processed
 
-    async def _send_config_packet(self, message: dc009_apl_comm_pb2.ConfigWrite):
-        payload = message.SerializeToString()
-        packet = Packet(0x20, 0x14, 0xFE, 0x11, payload, 0x01, 0x01, 0x13)
-        await self._conn.sendPacket(packet)
-
     async def enable_charger_open(self, enable: bool):
         await self._send_config_packet(
             dc009_apl_comm_pb2.ConfigWrite(cfg_sp_charger_chg_open=enable)
@@ -23,6 +23,15 @@ class Device(DeviceBase, RawDataProps):
     SN_PREFIX = (b"R331", b"R335")
     NAME_PREFIX = "EF-R33"
 
+    PACKET_MESSAGES = {
+        (0x02, 0x20, 0x02): Mr330PdHeart,
+        (0x03, 0x03, 0x0E): AllKitDetailData,
+        (0x03, 0x20, 0x02): DirectEmsDeltaHeartbeatPack,
+        (0x03, 0x20, 0x32): DirectBmsMDeltaHeartbeatPack,
+        # (0x04, _, 0x02): DirectInvDeltaHeartbeatPack,
+        (0x05, 0x20, 0x02): Mr330MpptHeart,
+    }
+
     @property
     def packet_version(self):
         return 2
@@ -69,52 +78,30 @@ class Device(DeviceBase, RawDataProps):
     async def data_parse(self, packet: Packet) -> bool:
         """Process the incoming notifications from the device"""
 
-        processed = False
         self.reset_updated()
+        processed = await self.dispatch_packet(packet)
 
-        match packet.src, packet.cmdSet, packet.cmdId:
-            case 0x02, 0x20, 0x02:
-                self.update_from_bytes(Mr330PdHeart, packet.payload)
-                processed = True
-            case 0x03, 0x03, 0x0E:
-                self.update_from_bytes(AllKitDetailData, packet.payload)
-                processed = True
-            case 0x03, 0x20, 0x02:
-                self.update_from_bytes(DirectEmsDeltaHeartbeatPack, packet.payload)
-                processed = True
-            case 0x03, 0x20, 0x32:
-                self.update_from_bytes(DirectBmsMDeltaHeartbeatPack, packet.payload)
-                processed = True
-            # case 0x04, _, 0x02:
-            #     self.update_from_bytes(DirectInvDeltaHeartbeatPack, packet.payload)
-            #     processed = True
-            case 0x05, 0x20, 0x02:
-                self.update_from_bytes(Mr330MpptHeart, packet.payload)
-                processed = True
-
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        self.publish_updates(self.updated_fields)
 
         return processed
 
     async def set_battery_charge_limit_max(self, limit: int):
         packet = Packet(0x21, 0x03, 0x20, 0x31, limit.to_bytes(), version=0x02)
-        await self._conn.sendPacket(packet)
+        await self._conn.sendCommand(packet)
 
     async def set_battery_charge_limit_min(self, limit: int):
         packet = Packet(0x21, 0x03, 0x20, 0x33, limit.to_bytes(), version=0x02)
-        await self._conn.sendPacket(packet)
+        await self._conn.sendCommand(packet)
 
     async def enable_usb_ports(self, enabled: bool):
         packet = Packet(0x21, 0x02, 0x20, 0x22, enabled.to_bytes(), version=0x02)
-        await self._conn.sendPacket(packet)
+        await self._conn.sendCommand(packet)
 
     async def enable_dc_12v_port(self, enabled: bool):
         packet = Packet(0x21, 0x05, 0x20, 0x51, enabled.to_bytes(), version=0x02)
-        await self._conn.sendPacket(packet)
+        await self._conn.sendCommand(packet)
 
     async def enable_ac_ports(self, enabled: bool):
         payload = bytes([1 if enabled else 0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
         packet = Packet(0x21, 0x05, 0x20, 0x42, payload, version=0x02)
-        await self._conn.sendPacket(packet)
+        await self._conn.sendCommand(packet)
@@ -1,8 +1,7 @@
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
-from google.protobuf.message import Message
 
-from ..commands import TimeCommands
+from ..commands import TimeSync
 from ..devicebase import DeviceBase
 from ..packet import Packet
 from ..pb import pd335_bms_bp_pb2, pd335_sys_pb2
@@ -70,12 +69,14 @@ class DCPortState(IntFieldValue):
     SOLAR = 2
 
 
-class Device(DeviceBase, ProtobufProps):
+class Device(DeviceBase, ProtobufProps, TimeSync):
     """Delta 3 Classic"""
 
     SN_PREFIX = (b"P321",)
     NAME_PREFIX = "EF-P3"
 
+    PACKET_MESSAGES = {(0x02, 0xFE, 0x15): pd335_sys_pb2.DisplayPropertyUpload}
+
     battery_level = pb_field(pb.cms_batt_soc, lambda value: round(value, 2))
     battery_level_main = pb_field(pb.bms_batt_soc, lambda value: round(value, 2))
 
@@ -121,7 +122,6 @@ class Device(DeviceBase, ProtobufProps):
         self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
     ) -> None:
         super().__init__(ble_dev, adv_data, sn)
-        self._time_commands = TimeCommands(self)
         self.max_ac_charging_power = 1500
 
     @classmethod
@@ -132,21 +132,8 @@ class Device(DeviceBase, ProtobufProps):
         return Packet.fromBytes(data, is_xor=True)
 
     async def data_parse(self, packet: Packet):
-        processed = False
         self.reset_updated()
-
-        if packet.src == 0x02 and packet.cmdSet == 0xFE and packet.cmdId == 0x15:
-            self.update_from_bytes(pd335_sys_pb2.DisplayPropertyUpload, packet.payload)
-
-            processed = True
-        elif (
-            packet.src == 0x35
-            and packet.cmdSet == 0x01
-            and packet.cmdId == Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME
-        ):
-            if len(packet.payload) == 0:
-                self._time_commands.async_send_all()
-            processed = True
+        processed = await self.dispatch_packet(packet)
 
         self.solar_input_power = (
             round(self.dc_port_input_power, 2)
@@ -158,20 +145,13 @@ class Device(DeviceBase, ProtobufProps):
         )
         self._after_message_parsed()
 
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        self.publish_updates(self.updated_fields)
 
         return processed
 
     def _after_message_parsed(self):
         pass
 
-    async def _send_config_packet(self, message: Message):
-        payload = message.SerializeToString()
-        packet = Packet(0x20, 0x02, 0xFE, 0x11, payload, 0x01, 0x01, 0x13)
-        await self._conn.sendPacket(packet)
-
     async def set_energy_backup_battery_level(self, value: int):
         config = pd335_sys_pb2.ConfigWrite()
         config.cfg_energy_backup.energy_backup_en = True
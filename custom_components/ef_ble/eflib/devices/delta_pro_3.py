@@ -1,8 +1,4 @@
-from bleak.backends.device import BLEDevice
-from bleak.backends.scanner import AdvertisementData
-from google.protobuf.message import Message
-
-from ..commands import TimeCommands
+from ..commands import TimeSync
 from ..devicebase import DeviceBase
 from ..packet import Packet
 from ..pb import mr521_pb2
@@ -37,12 +33,14 @@ class DCPortState(IntFieldValue):
     DC_CHARGING = 3
 
 
-class Device(DeviceBase, ProtobufProps):
+class Device(DeviceBase, ProtobufProps, TimeSync):
     """Delta Pro 3"""
 
     SN_PREFIX = (b"MR51",)
     NAME_PREFIX = "EF-DP3"
 
+    PACKET_MESSAGES = {(0x02, 0xFE, 0x15): mr521_pb2.DisplayPropertyUpload}
+
     battery_level = pb_field(pb.cms_batt_soc, lambda value: round(value, 2))
     battery_level_main = pb_field(pb.bms_batt_soc, lambda value: round(value, 2))
 
@@ -85,12 +83,6 @@ class Device(DeviceBase, ProtobufProps):
     solar_lv_power = Field[float]()
     solar_hv_power = Field[float]()
 
-    def __init__(
-        self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
-    ) -> None:
-        super().__init__(ble_dev, adv_data, sn)
-        self._time_commands = TimeCommands(self)
-
     @classmethod
     def check(cls, sn):
         return sn[:4] in cls.SN_PREFIX
@@ -99,22 +91,7 @@ class Device(DeviceBase, ProtobufProps):
         return Packet.fromBytes(data, is_xor=True)
 
     async def data_parse(self, packet: Packet):
-        processed = False
-
-        if packet.src == 0x02 and packet.cmdSet == 0xFE and packet.cmdId == 0x15:
-            self.update_from_bytes(mr521_pb2.DisplayPropertyUpload, packet.payload)
-
-            processed = True
-        elif (
-            packet.src == 0x35
-            and packet.cmdSet == 0x01
-            and packet.cmdId == Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME
-        ):
-            # Device requested for time and timezone offset, so responding with that
-            # otherwise it will not be able to send us predictions and config data
-            if len(packet.payload) == 0:
-                self._time_commands.async_send_all()
-            processed = True
+        processed = await self.dispatch_packet(packet)
 
         self.solar_lv_power = self._get_solar_power(
             self.dc_lv_input_power, self.dc_lv_input_state
@@ -123,9 +100,7 @@ class Device(DeviceBase, ProtobufProps):
             self.dc_hv_input_power, self.dc_hv_input_state
         )
 
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        self.publish_updates(self.updated_fields)
 
         return processed
 
@@ -134,11 +109,6 @@ class Device(DeviceBase, ProtobufProps):
             round(power, 2) if state == DCPortState.SOLAR and power is not None else 0
         )
 
-    async def _send_config_packet(self, message: Message):
-        payload = message.SerializeToString()
-        packet = Packet(0x20, 0x02, 0xFE, 0x11, payload, 0x01, 0x01, 0x13)
-        await self._conn.sendPacket(packet)
-
     async def set_energy_backup_battery_level(self, value: int):
         config = mr521_pb2.ConfigWrite()
         config.cfg_energy_backup.energy_backup_en = True
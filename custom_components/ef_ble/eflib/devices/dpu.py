@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
-from ..commands import TimeCommands
-from ..devicebase import AdvertisementData, BLEDevice, DeviceBase
+from ..commands import TimeSync
+from ..devicebase import DeviceBase, packet_handler
 from ..packet import Packet
 from ..pb import yj751_sys_pb2
 from ..props import (
@@ -27,7 +27,7 @@ class _BatteryLevel(
         return item.bp_soc if item.bp_no == self.battery_no else None
 
 
-class Device(DeviceBase, ProtobufProps):
+class Device(DeviceBase, ProtobufProps, TimeSync):
     """Delta Pro Ultra"""
 
     SN_PREFIX = b"Y711"
@@ -59,60 +59,37 @@ class Device(DeviceBase, ProtobufProps):
     def check(sn):
         return sn.startswith(Device.SN_PREFIX)
 
-    def __init__(
-        self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
-    ) -> None:
-        super().__init__(ble_dev, adv_data, sn)
-        self._time_commands = TimeCommands(self)
-
     async def packet_parse(self, data: bytes) -> Packet:
         """Need to override because packet payload is xor-encoded by the first byte of seq"""
         return Packet.fromBytes(data, True)
 
     async def data_parse(self, packet: Packet) -> bool:
         """Processing the incoming notifications from the device"""
-        processed = False
         self.reset_updated()
+        processed = await self.dispatch_packet(packet)
 
-        if packet.src == 0x02 and packet.cmdSet == 0x02:
-            if packet.cmdId == 0x01:  # Ping
-                await self._conn.replyPacket(packet)
-                self._logger.debug(
-                    "%s: %s: Parsed data: %r", self.address, self.name, packet
-                )
-                self.update_from_bytes(
-                    yj751_sys_pb2.AppShowHeartbeatReport, packet.payload
-                )
-                # self._logger.debug("DPU AppShowHeartbeatReport: \n %s", str(p))
-
-                processed = True
-            elif packet.cmdId == 0x04:
-                await self._conn.replyPacket(packet)
-                self.update_from_bytes(yj751_sys_pb2.BpInfoReport, packet.payload)
-                # self._logger.debug("DPU BpInfoReport: \n %s", str(p))
-
-                self.update_from_bytes(
-                    yj751_sys_pb2.AppShowHeartbeatReport, packet.payload
-                )
-                processed = True
-        elif packet.src == 0x35 and packet.cmdSet == 0x35 and packet.cmdId == 0x20:
-            self._logger.debug(
-                "%s: %s: Ping received: %r", self.address, self.name, packet
-            )
-            processed = True
-
-        elif (
-            packet.src == 0x35
-            and packet.cmdSet == 0x01
-            and packet.cmdId == Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME
-        ):
-            # Device requested for time and timezone offset, so responding with that
-            # otherwise it will not be able to send us predictions and config data
-            if len(packet.payload) == 0:
-                self._time_commands.async_send_all()
-            processed = True
-
-        for prop_name in self.updated_fields:
-            self.update_callback(prop_name)
+        self.publish_updates(self.updated_fields)
 
         return processed
+
+    @packet_handler(
+        0x02,
+        0x02,
+        0x01,
+        yj751_sys_pb2.AppShowHeartbeatReport,
+        reply=True,
+        skip_unchanged=True,
+    )  # Ping
+    async def _on_heartbeat(self, packet: Packet):
+        self._logger.debug("%s: %s: Parsed data: %r", self.address, self.name, packet)
+
+    @packet_handler(
+        0x02,
+        0x02,
+        0x04,
+        (yj751_sys_pb2.BpInfoReport, yj751_sys_pb2.AppShowHeartbeatReport),
+        reply=True,
+        skip_unchanged=True,
+    )
+    async def _on_bp_info(self, packet: Packet):
+        self._logger.debug("%s: %s: Parsed data: %r", self.address, self.name, packet)
@@ -1,7 +1,7 @@
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
-from ..commands import TimeCommands
+from ..commands import TimeSync
 from ..devicebase import DeviceBase
 from ..packet import Packet
 from ..pb import pr705_pb2
@@ -48,12 +48,14 @@ def _flow_is_on(x) -> bool:
     return (int(x) & 0b11) in [0b10, 0b11]
 
 
-class Device(DeviceBase, ProtobufProps):
+class Device(DeviceBase, ProtobufProps, TimeSync):
     """River 3"""
 
     SN_PREFIX = (b"R651", b"R653", b"R654", b"R655")
     NAME_PREFIX = "EF-R3"
 
+    PACKET_MESSAGES = {(0x02, 0xFE, 0x15): pr705_pb2.DisplayPropertyUpload}
+
     battery_level = pb_field(pb.cms_batt_soc)
 
     ac_input_power = pb_field(pb.pow_get_ac_in)
@@ -105,7 +107,6 @@ class Device(DeviceBase, ProtobufProps):
         self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
     ) -> None:
         super().__init__(ble_dev, adv_data, sn)
-        self._time_commands = TimeCommands(self)
         self.dc_charging_current_max = 8
 
     @classmethod
@@ -130,22 +131,8 @@ class Device(DeviceBase, ProtobufProps):
         return Packet.fromBytes(data, is_xor=True)
 
     async def data_parse(self, packet: Packet):
-        processed = False
         self.reset_updated()
-
-        if packet.src == 0x02 and packet.cmdSet == 0xFE and packet.cmdId == 0x15:
-            self.update_from_bytes(pr705_pb2.DisplayPropertyUpload, packet.payload)
-            processed = True
-        elif (
-            packet.src == 0x35
-            and packet.cmdSet == 0x01
-            and packet.cmdId == Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME
-        ):
-            # Device requested for time and timezone offset, so responding with that
-            # otherwise it will not be able to send us predictions and config data
-            if len(packet.payload) == 0:
-                self._time_commands.async_send_all()
-            processed = True
+        processed = await self.dispatch_packet(packet)
 
         if self.ac_input_energy is not None and self.dc_input_energy is not None:
             self.input_energy = self.ac_input_energy + self.dc_input_energy
@@ -163,17 +150,10 @@ class Device(DeviceBase, ProtobufProps):
                 + self.dc12v_output_energy
             )
 
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        self.publish_updates(self.updated_fields)
 
         return processed
 
-    async def _send_config_packet(self, message):
-        payload = message.SerializeToString()
-        packet = Packet(0x20, 0x02, 0xFE, 0x11, payload, 0x01, 0x01, 0x13)
-        await self._conn.sendPacket(packet)
-
     async def set_energy_backup_battery_level(self, value: int):
         config = pr705_pb2.ConfigWrite()
         config.cfg_energy_backup.energy_backup_en = True
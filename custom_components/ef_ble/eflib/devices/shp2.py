@@ -1,11 +1,12 @@
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import KW_ONLY, dataclass
 
-from ..commands import TimeCommands
-from ..devicebase import AdvertisementData, BLEDevice, DeviceBase
+from ..commands import TimeSync
+from ..devicebase import DeviceBase, packet_handler
 from ..packet import Packet
 from ..pb import pd303_pb2
 from ..props import (
+    ChangePolicy,
     Field,
     ProtobufProps,
     pb_field,
@@ -60,6 +61,9 @@ class CircuitCurrentField(
     repeated_pb_field_type(list_field=pb_time.load_info.hall1_curr)
 ):
     idx: int
+    _: KW_ONLY
+    # current sensors are noisy, ignore changes below sensor resolution
+    change_policy: ChangePolicy | None = ChangePolicy(absolute=0.05, max_silence=60)
 
     def get_item(self, value: Sequence[float]) -> float | None:
         return round(value[self.idx], 4) if value and len(value) > self.idx else None
@@ -77,7 +81,7 @@ def _errors(error_codes: pd303_pb2.ErrCode):
     return [e for e in error_codes.err_code if e != b"\x00\x00\x00\x00\x00\x00\x00\x00"]
 
 
-class Device(DeviceBase, ProtobufProps):
+class Device(DeviceBase, ProtobufProps, TimeSync):
     """Smart Home Panel 2"""
 
     SN_PREFIX = b"HD31"
@@ -373,69 +377,13 @@ class Device(DeviceBase, ProtobufProps):
     def check(sn):
         return sn.startswith(Device.SN_PREFIX)
 
-    def __init__(
-        self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
-    ) -> None:
-        super().__init__(ble_dev, adv_data, sn)
-
-        self._time_commands = TimeCommands(self)
-
     async def data_parse(self, packet: Packet) -> bool:
         """Processing the incoming notifications from the device"""
-        processed = False
         self.reset_updated()
 
         prev_error_count = self.error_count
 
-        if packet.src == 0x0B and packet.cmdSet == 0x0C:
-            if (
-                packet.cmdId == 0x01
-            ):  # master_info, load_info, backup_info, watt_info, master_ver_info
-                self._logger.debug(
-                    "%s: %s: Parsed data: %r", self.address, self.name, packet
-                )
-
-                await self._conn.replyPacket(packet)
-                self.update_from_bytes(pd303_pb2.ProtoTime, packet.payload)
-                processed = True
-            elif packet.cmdId == 0x20:  # backup_incre_info
-                self._logger.debug(
-                    "%s: %s: Parsed data: %r", self.address, self.name, packet
-                )
-
-                await self._conn.replyPacket(packet)
-                self.update_from_bytes(pd303_pb2.ProtoPushAndSet, packet.payload)
-
-                processed = True
-
-            elif packet.cmdId == 0x21:  # is_get_cfg_flag
-                self._logger.debug(
-                    "%s: %s: Parsed data: %r", self.address, self.name, packet
-                )
-                self.update_from_bytes(pd303_pb2.ProtoPushAndSet, packet.payload)
-                processed = True
-
-        elif packet.src == 0x35 and packet.cmdSet == 0x35 and packet.cmdId == 0x20:
-            self._logger.debug(
-                "%s: %s: Ping received: %r", self.address, self.name, packet
-            )
-            processed = True
-
-        elif (
-            packet.src == 0x35
-            and packet.cmdSet == 0x01
-            and packet.cmdId == Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME
-        ):
-            # Device requested for time and timezone offset, so responding with that
-            # otherwise it will not be able to send us predictions and config data
-            if len(packet.payload) == 0:
-                self._time_commands.async_send_all()
-            processed = True
-
-        elif packet.src == 0x0B and packet.cmdSet == 0x01 and packet.cmdId == 0x55:
-            # Device reply that it's online and ready
-            self._conn._add_task(self.set_config_flag(True))
-            processed = True
+        processed = await self.dispatch_packet(packet)
 
         self.error_count = len(self.errors) if self.errors is not None else None
 
@@ -452,21 +400,47 @@ class Device(DeviceBase, ProtobufProps):
                 self.errors,
             )
 
-        for field_name in self.updated_fields:
-            try:
-                self.update_callback(field_name)
-                self.update_state(field_name, getattr(self, field_name))
-            except Exception as e:  # noqa: BLE001
-                self._logger.warning(
-                    "%s: %s: Error happened while updating field %s: %s",
-                    self.address,
-                    self.name,
-                    field_name,
-                    e,
-                )
+        self.publish_updates(self.updated_fields, on_error=self._on_update_error)
 
         return processed
 
+    def _on_update_error(self, field_name: str, e: Exception):
+        self._logger.warning(
+            "%s: %s: Error happened while updating field %s: %s",
+            self.address,
+            self.name,
+            field_name,
+            e,
+        )
+
+    # master_info, load_info, backup_info, watt_info, master_ver_info
+    @packet_handler(
+        0x0B, 0x0C, 0x01, pd303_pb2.ProtoTime, reply=True, skip_unchanged=True
+    )
+    async def _on_time_info(self, packet: Packet):
+        self._logger.debug("%s: %s: Parsed data: %r", self.address, self.name, packet)
+
+    # backup_incre_info
+    @packet_handler(
+        0x0B, 0x0C, 0x20, pd303_pb2.ProtoPushAndSet, reply=True, skip_unchanged=True
+    )
+    async def _on_push_and_set(self, packet: Packet):
+        self._logger.debug("%s: %s: Parsed data: %r", self.address, self.name, packet)
+
+    # is_get_cfg_flag
+    @packet_handler(0x0B, 0x0C, 0x21, pd303_pb2.ProtoPushAndSet, skip_unchanged=True)
+    async def _on_config_flag(self, packet: Packet):
+        self._logger.debug("%s: %s: Parsed data: %r", self.address, self.name, packet)
+
+    @packet_handler(0x0B, 0x01, 0x55)
+    async def _on_ready(self, packet: Packet):
+        # Device reply that it's online and ready
+        self._conn._add_task(self.set_config_flag(True))
+
+    async def request_data(self) -> bool:
+        await self.set_config_flag(True)
+        return True
+
     async def set_config_flag(self, enable):
         """Send command to enable/disable sending config data from device to the host"""
         self._logger.debug("%s: setConfigFlag: %s", self._address, enable)
@@ -476,7 +450,7 @@ class Device(DeviceBase, ProtobufProps):
         payload = ppas.SerializeToString()
         packet = Packet(0x21, 0x0B, 0x0C, 0x21, payload, 0x01, 0x01, 0x13)
 
-        await self._conn.sendPacket(packet)
+        await self._conn.sendCommand(packet)
 
     async def set_circuit_power(self, circuit_id, enable):
         """Send command to power on / off the specific circuit of the panel"""
@@ -495,4 +469,4 @@ class Device(DeviceBase, ProtobufProps):
         payload = ppas.SerializeToString()
         packet = Packet(0x21, 0x0B, 0x0C, 0x21, payload, 0x01, 0x01, 0x13)
 
-        await self._conn.sendPacket(packet)
+        await self._conn.sendCommand(packet)
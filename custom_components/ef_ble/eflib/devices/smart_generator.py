@@ -1,7 +1,4 @@
-from bleak.backends.device import BLEDevice
-from bleak.backends.scanner import AdvertisementData
-
-from ..commands import TimeCommands
+from ..commands import TimeSync
 from ..devicebase import DeviceBase
 from ..packet import Packet
 from ..pb import ge305_sys_pb2
@@ -73,12 +70,15 @@ class AbnormalState(IntFieldValue):
     GASOLINE_LOW = 1  # original name: OIL_LOW
 
 
-class Device(DeviceBase, ProtobufProps):
+class Device(DeviceBase, ProtobufProps, TimeSync):
     """Smart Generator 3000 (Dual Fuel)"""
 
     SN_PREFIX = (b"G371",)
     NAME_PREFIX = "EF-GE"
 
+    PACKET_MESSAGES = {(0x08, 0xFE, 0x15): ge305_sys_pb2.DisplayPropertyUpload}
+    CONFIG_WRITE_DST = 0x08
+
     output_power = pb_field(pb.pow_out_sum_w)
     ac_output_power = pb_field(pb.pow_get_ac)
 
@@ -112,12 +112,6 @@ class Device(DeviceBase, ProtobufProps):
 
     ac_port = pb_field(pb.ac_out_open)
 
-    def __init__(
-        self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
-    ) -> None:
-        super().__init__(ble_dev, adv_data, sn)
-        self._time_commands = TimeCommands(self)
-
     @classmethod
     def check(cls, sn):
         return sn.startswith(cls.SN_PREFIX)
@@ -126,30 +120,11 @@ class Device(DeviceBase, ProtobufProps):
         return Packet.fromBytes(data, is_xor=True)
 
     async def data_parse(self, packet: Packet):
-        processed = False
-
-        if packet.src == 0x08 and packet.cmdSet == 0xFE and packet.cmdId == 0x15:
-            self.update_from_bytes(ge305_sys_pb2.DisplayPropertyUpload, packet.payload)
-            processed = True
-        elif (
-            packet.src == 0x35
-            and packet.cmdSet == 0x01
-            and packet.cmdId == Packet.NET_BLE_COMMAND_CMD_SET_RET_TIME
-        ):
-            if len(packet.payload) == 0:
-                self._time_commands.async_send_all()
-            processed = True
-
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        processed = await self.dispatch_packet(packet)
 
-        return processed
+        self.publish_updates(self.updated_fields)
 
-    async def _send_config_packet(self, message: ge305_sys_pb2.ConfigWrite):
-        payload = message.SerializeToString()
-        packet = Packet(0x20, 0x08, 0xFE, 0x11, payload, 0x01, 0x01, 0x13)
-        await self._conn.sendPacket(packet)
+        return processed
 
     async def enable_ac_port(self, enabled: bool):
         await self._send_config_packet(
@@ -1,3 +1,4 @@
+from ..devicebase import AdvertisementData, BLEDevice
 from ..pb import ge305_sys_pb2
 from ..props import ProtobufProps, pb_field
 from ..props.enums import IntFieldValue
@@ -21,10 +22,7 @@ class Device(smart_generator.Device, ProtobufProps):
     SN_PREFIX = (b"G351",)
 
     def __init__(
-        self,
-        ble_dev: smart_generator.BLEDevice,
-        adv_data: smart_generator.AdvertisementData,
-        sn: str,
+        self, ble_dev: BLEDevice, adv_data: AdvertisementData, sn: str
     ) -> None:
         super().__init__(ble_dev, adv_data, sn)
         self.dc_output_power_max = 3200
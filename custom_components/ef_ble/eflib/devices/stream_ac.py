@@ -1,10 +1,12 @@
 import time
 from collections.abc import Sequence
 
+from ..command_tracker import CONFIG_WRITE_ACK
 from ..devicebase import DeviceBase
 from ..packet import Packet
 from ..pb import bk_series_pb2
 from ..props import (
+    ChangePolicy,
     Field,
     ProtobufProps,
     pb_field,
@@ -20,6 +22,11 @@ def _round(value: float):
     return round(value, 2)
 
 
+# grid measurements jitter in every packet, publish them only when they really change
+_GRID_VOLTAGE_POLICY = ChangePolicy(absolute=0.5, max_silence=60)
+_GRID_FREQUENCY_POLICY = ChangePolicy(absolute=0.05, max_silence=60)
+
+
 class ResidentLoad(repeated_pb_field_type(pb.day_resident_load_list.load)):
     def get_item(
         self, value: Sequence[bk_series_pb2.ResidentLoad]
@@ -79,12 +86,18 @@ class Device(DeviceBase, ProtobufProps):
     SN_PREFIX = (b"BK51",)
     NAME_PREFIX = "EF-6"
 
+    PACKET_MESSAGES = {(0x02, 0xFE, 0x15): bk_series_pb2.DisplayPropertyUpload}
+
     battery_level = pb_field(pb.cms_batt_soc)
     cell_temperature = pb_field(pb.bms_max_cell_temp)
 
     grid_power = pb_field(pb.grid_connection_power)
-    grid_voltage = pb_field(pb.grid_connection_vol, _round)
-    grid_frequency = pb_field(pb.grid_connection_freq, _round)
+    grid_voltage = pb_field(
+        pb.grid_connection_vol, _round, change_policy=_GRID_VOLTAGE_POLICY
+    )
+    grid_frequency = pb_field(
+        pb.grid_connection_freq, _round, change_policy=_GRID_FREQUENCY_POLICY
+    )
 
     battery_charge_limit_min = pb_field(pb.cms_min_dsg_soc)
     battery_charge_limit_max = pb_field(pb.cms_max_chg_soc)
@@ -114,26 +127,21 @@ class Device(DeviceBase, ProtobufProps):
         return Packet.fromBytes(data, is_xor=True)
 
     async def data_parse(self, packet: Packet):
-        processed = False
-        if packet.src == 0x02 and packet.cmdSet == 0xFE and packet.cmdId == 0x15:
-            self.update_from_bytes(bk_series_pb2.DisplayPropertyUpload, packet.payload)
-            processed = True
+        processed = await self.dispatch_packet(packet)
 
         self._load_power_enabled = self._resident_load is not None
         if self._resident_load is not None:
             self.base_load_power = self._resident_load.load_power
 
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        self.publish_updates(self.updated_fields)
 
         return processed
 
-    async def _send_config_packet(self, message: bk_series_pb2.ConfigWrite):
+    async def _write_config_packet(self, message: bk_series_pb2.ConfigWrite):
         payload = message.SerializeToString()
         message.cfg_utc_time = round(time.time())
         packet = Packet(0x20, 0x02, 0xFE, 0x11, payload, 0x01, 0x01, 0x13)
-        await self._conn.sendPacket(packet)
+        return await self._conn.sendCommand(packet, reply=CONFIG_WRITE_ACK)
 
     async def set_battery_charge_limit_max(self, limit: int):
         await self._send_config_packet(bk_series_pb2.ConfigWrite(cfg_max_chg_soc=limit))
@@ -3,7 +3,7 @@ import logging
 from ..devicebase import DeviceBase
 from ..packet import Packet
 from ..pb import ac517_apl_comm_pb2
-from ..props import ProtobufProps, pb_field
+from ..props import ChangePolicy, ProtobufProps, pb_field
 from ..props.enums import IntFieldValue
 from ..props.protobuf_field import proto_attr_mapper
 from ..props.utils import pround
@@ -14,6 +14,13 @@ pb_run = proto_attr_mapper(ac517_apl_comm_pb2.RuntimePropertyUpload)
 
 _LOGGER = logging.getLogger(__name__)
 
+# temperatures flicker between neighbouring rounded values, ignore single step changes
+_TEMPERATURE_POLICY = ChangePolicy(absolute=0.15, max_silence=60)
+
+
+def _temperature_field(attr: float):
+    return pb_field(attr, pround(1), change_policy=_TEMPERATURE_POLICY)
+
 
 class OperatingMode(IntFieldValue):
     UNKNOWN = -1
@@ -62,6 +69,12 @@ class Device(DeviceBase, ProtobufProps):
     SN_PREFIX = (b"AC71",)
     NAME_PREFIX = "EF-AC"
 
+    PACKET_MESSAGES = {
+        (0x42, 0xFE, 0x15): ac517_apl_comm_pb2.DisplayPropertyUpload,
+        (0x42, 0xFE, 0x16): ac517_apl_comm_pb2.RuntimePropertyUpload,
+    }
+    CONFIG_WRITE_DST = 0x14
+
     battery_level = pb_field(pb_disp.cms_batt_soc, pround(2))
     ambient_temperature = pb_field(pb_disp.temp_ambient, pround(2))
     ambient_humidity = pb_field(pb_disp.humi_ambient, pround(2))
@@ -77,12 +90,12 @@ class Device(DeviceBase, ProtobufProps):
     input_power = pb_field(pb_disp.pow_in_sum_w, pround(1))
     output_power = pb_field(pb_disp.pow_out_sum_w, pround(1))
 
-    temp_indoor_supply_air = pb_field(pb_disp.temp_indoor_supply_air, pround(1))
-    temp_indoor_return_air = pb_field(pb_run.temp_indoor_return_air, pround(1))
-    temp_outdoor_ambient = pb_field(pb_run.temp_outdoor_ambient, pround(1))
-    temp_condenser = pb_field(pb_run.temp_condenser, pround(1))
-    temp_evaporator = pb_field(pb_run.temp_evaporator, pround(1))
-    temp_compressor_discharge = pb_field(pb_run.temp_compressor_discharge, pround(1))
+    temp_indoor_supply_air = _temperature_field(pb_disp.temp_indoor_supply_air)
+    temp_indoor_return_air = _temperature_field(pb_run.temp_indoor_return_air)
+    temp_outdoor_ambient = _temperature_field(pb_run.temp_outdoor_ambient)
+    temp_condenser = _temperature_field(pb_run.temp_condenser)
+    temp_evaporator = _temperature_field(pb_run.temp_evaporator)
+    temp_compressor_discharge = _temperature_field(pb_run.temp_compressor_discharge)
 
     temp_unit = pb_field(pb_disp.user_temp_unit, TemperatureUnit.from_mode)
 
@@ -100,32 +113,13 @@ class Device(DeviceBase, ProtobufProps):
         return Packet.fromBytes(data, is_xor=True)
 
     async def data_parse(self, packet: Packet):
-        processed = False
+        processed = await self.dispatch_packet(packet)
 
-        if packet.src == 0x42 and packet.cmdSet == 0xFE and packet.cmdId == 0x15:
-            self.update_from_bytes(
-                ac517_apl_comm_pb2.DisplayPropertyUpload, packet.payload
-            )
-            processed = True
-
-        if packet.src == 0x42 and packet.cmdSet == 0xFE and packet.cmdId == 0x16:
-            self.update_from_bytes(
-                ac517_apl_comm_pb2.RuntimePropertyUpload, packet.payload
-            )
-            processed = True
-
-        for field_name in self.updated_fields:
-            self.update_callback(field_name)
-            self.update_state(field_name, getattr(self, field_name))
+        self.publish_updates(self.updated_fields)
 
         self.update_state("power", self.power)
         return processed
 
-    async def _send_config_packet(self, message: ac517_apl_comm_pb2.ConfigWrite):
-        payload = message.SerializeToString()
-        packet = Packet(0x20, 0x14, 0xFE, 0x11, payload, 0x01, 0x01, 0x13)
-        await self._conn.sendPacket(packet)
-
     async def set_battery_charge_limit_min(self, limit: int):
         if (
             self.battery_charge_limit_max is not None
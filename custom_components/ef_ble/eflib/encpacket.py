@@ -1,9 +1,12 @@
 import struct
+from collections.abc import Callable, Iterator
 
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
 
-from .crc import crc16
+from .cipher import SessionCipher
+from .crc import Buffer, crc16
+from .exceptions import EncPacketParseError, PacketParseError
 
 
 class EncPacket:
@@ -27,6 +30,7 @@ class EncPacket:
         version=0,
         enc_key=None,
         iv=None,
+        cipher: SessionCipher | None = None,
     ):
         self._frame_type = frame_type
         self._payload_type = payload_type
@@ -35,8 +39,12 @@ class EncPacket:
         self._version = version
         self._enc_key = enc_key
         self._iv = iv
+        self._cipher = cipher
 
     def encryptPayload(self):
+        if self._cipher is not None:
+            return self._cipher.encrypt(self._payload)
+
         if self._enc_key is None and self._iv is None:
             return self._payload  # Not encrypted
 
@@ -55,3 +63,114 @@ class EncPacket:
         data += struct.pack("<H", crc16(data))
 
         return data
+
+
+class FrameDecoder:
+    """
+    Incremental decoder splitting BLE notifications into EncPacket frames
+
+    Notifications can carry several frames or only a part of one, so received data is
+    appended to a growable buffer and every complete frame is returned as a `memoryview`
+    of its payload (without header and CRC16) without copying. Consumed data is only
+    skipped by moving the read offset and the buffer is compacted lazily.
+
+    When the prefix or CRC16 of a frame is incorrect, `on_error` is called and the
+    decoder resyncs on the next frame prefix instead of dropping the rest of the data.
+    """
+
+    HEADER_SIZE = 6
+    CRC_SIZE = 2
+
+    # compact the buffer only when at least this many bytes were already consumed
+    _COMPACT_THRESHOLD = 512
+
+    def __init__(self, on_error: Callable[[Exception], None] = lambda _: None) -> None:
+        self._buffer = bytearray()
+        self._offset = 0
+        self._on_error = on_error
+
+    @property
+    def pending(self) -> int:
+        """Number of received bytes that are not part of any yielded frame yet"""
+        return len(self._buffer) - self._offset
+
+    def reset(self):
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def feed(self, data: Buffer) -> list[memoryview]:
+        """
+        Add received data and return payloads of all complete frames
+
+        Parameters
+        ----------
+        data
+            Data received from notification characteristic
+
+        Returns
+        -------
+        List of frame payloads as views into the internal buffer
+        """
+        self._append(data)
+        return list(self._frames())
+
+    def _frames(self) -> Iterator[memoryview]:
+        buffer = self._buffer
+        while len(buffer) - self._offset >= self.HEADER_SIZE:
+            start = self._offset
+            if not buffer.startswith(EncPacket.PREFIX, start):
+                self._on_error(
+                    EncPacketParseError(
+                        "Unable to parse encrypted packet - prefix is incorrect: "
+                        f"{buffer[start:].hex()}"
+                    )
+                )
+                self._resync(start)
+                continue
+
+            frame_len = buffer[start + 4] | buffer[start + 5] << 8
+            frame_end = start + self.HEADER_SIZE + frame_len
+            if frame_end > len(buffer):
+                break
+
+            payload_end = frame_end - self.CRC_SIZE
+            frame_crc = int.from_bytes(buffer[payload_end:frame_end], "little")
+            if (
+                frame_len < self.CRC_SIZE
+                or crc16(memoryview(buffer)[start:payload_end]) != frame_crc
+            ):
+                self._on_error(
+                    PacketParseError(
+                        "Unable to parse encrypted packet - incorrect CRC16: "
+                        f"{buffer[start:frame_end].hex()}"
+                    )
+                )
+                self._resync(start)
+                continue
+
+            self._offset = frame_end
+            yield memoryview(buffer)[start + self.HEADER_SIZE : payload_end]
+
+    def _append(self, data: Buffer):
+        if self._offset == len(self._buffer) or self._offset >= self._COMPACT_THRESHOLD:
+            try:
+                del self._buffer[: self._offset]
+            except BufferError:
+                # previously yielded payloads are still referenced, leave them intact
+                self._buffer = self._buffer[self._offset :]
+            self._offset = 0
+
+        try:
+            self._buffer += data
+        except BufferError:
+            self._buffer = self._buffer + data
+
+    def _resync(self, start: int):
+        next_prefix = self._buffer.find(EncPacket.PREFIX, start + 1)
+        if next_prefix != -1:
+            self._offset = next_prefix
+            return
+
+        # keep the last byte in case it is the first half of a split prefix
+        end = len(self._buffer)
+        self._offset = end - 1 if self._buffer.endswith(EncPacket.PREFIX[:1]) else end
@@ -10,6 +10,18 @@ class PacketReceiveError(Exception):
     """Error during receiving packet"""
 
 
+class PacketDropped(Exception):
+    """Packet was dropped from send queue before it was sent"""
+
+
+class CommandTimeout(TimeoutError):
+    """Device did not reply to command in time"""
+
+
+class CommandAborted(Exception):
+    """Connection was lost before device replied to command"""
+
+
 class AuthFailedError(Exception):
     """Error during authentificating"""
 
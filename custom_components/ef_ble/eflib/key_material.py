@@ -0,0 +1,77 @@
+import asyncio
+from collections import deque
+
+import ecdsa
+
+CURVE = ecdsa.SECP160r1
+
+
+def _generate_private_key() -> ecdsa.SigningKey:
+    # the first multiplication by generator also builds its precompute table (shared by
+    # the whole process), so this is the slowest call and it runs in executor too
+    return ecdsa.SigningKey.generate(curve=CURVE)
+
+
+def _generate_shared_secret(
+    private_key: ecdsa.SigningKey, public_key: ecdsa.VerifyingKey
+) -> bytes:
+    return ecdsa.ECDH(CURVE, private_key, public_key).generate_sharedsecret_bytes()
+
+
+class KeyMaterialProvider:
+    """
+    Provider of SECP160r1 key material that keeps elliptic curve math off the event loop
+
+    Key generation and ECDH are pure-python and would block the event loop for tens of
+    milliseconds on slower hardware, so both are run in the default executor. Provider
+    also keeps a small pool of pre-generated private keys, so handshakes can start
+    immediately. Every key from the pool is handed out only once.
+    """
+
+    def __init__(self, pool_size: int = 4) -> None:
+        self._pool_size = pool_size
+        self._pool: deque[ecdsa.SigningKey] = deque()
+        self._refill_task: asyncio.Task | None = None
+
+    @property
+    def available(self) -> int:
+        """Number of pre-generated keys ready to be used"""
+        return len(self._pool)
+
+    def prefill(self):
+        """Start filling the pool in the background if it is not full"""
+        if len(self._pool) >= self._pool_size:
+            return
+
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+
+        self._refill_task = asyncio.get_running_loop().create_task(self._refill())
+
+    async def private_key(self) -> ecdsa.SigningKey:
+        """Get new private key, from the pool if available"""
+        if self._pool:
+            key = self._pool.popleft()
+        else:
+            key = await asyncio.get_running_loop().run_in_executor(
+                None, _generate_private_key
+            )
+
+        self.prefill()
+        return key
+
+    async def shared_secret(
+        self, private_key: ecdsa.SigningKey, public_key: ecdsa.VerifyingKey
+    ) -> bytes:
+        """Derive ECDH shared secret in executor"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _generate_shared_secret, private_key, public_key
+        )
+
+    async def _refill(self):
+        loop = asyncio.get_running_loop()
+        while len(self._pool) < self._pool_size:
+            self._pool.append(await loop.run_in_executor(None, _generate_private_key))
+
+
+default_provider = KeyMaterialProvider()
@@ -1,7 +1,8 @@
 import struct
+from bisect import bisect_right
 from dataclasses import dataclass
-from functools import cache
 from inspect import get_annotations
+from itertools import accumulate, islice
 from typing import Annotated, ClassVar, Self, dataclass_transform, get_args, get_origin
 
 
@@ -17,8 +18,9 @@ class RawData:
     is the name from the original decompiled source code (optional).
 
     This class is also able to decode binary streams partially in case the data uses
-    optional extensions. This works by going through the format in reverse and removing
-    bytes from struct string one by one until the size matches the data size.
+    optional extensions. Sizes of all field prefixes are computed when the class is
+    created, so the longest prefix of fields that fits the data is found with a single
+    lookup and its compiled struct is reused for all messages of the same size.
 
     Examples
     --------
@@ -41,12 +43,17 @@ class RawData:
     """
 
     _STRUCT_FMT: ClassVar[str]
+    _STRUCT: ClassVar[struct.Struct]
+    # format of every field, subclasses extend format of their parent
+    _FIELD_FMTS: ClassVar[tuple[str, ...]] = ()
+    # _PREFIX_SIZES[n] is size of first n fields
+    _PREFIX_SIZES: ClassVar[tuple[int, ...]]
+    # structs for partial data keyed by data length
+    _PREFIX_STRUCTS: ClassVar[dict[int, struct.Struct]]
     SIZE: int
 
     def __init_subclass__(cls) -> None:
-        # set byte order to litte-endian (or for subclasses, get the full format str
-        # from parent)
-        format_str = getattr(cls, "_STRUCT_FMT", ["<"])
+        field_fmts = list(cls._FIELD_FMTS)
 
         for name, annotation in get_annotations(cls).items():
             if get_origin(annotation) is Annotated:
@@ -55,7 +62,7 @@ class RawData:
                 _, *metadata = get_args(annotation)
                 if not metadata:
                     continue
-                format_str += metadata[0]
+                field_fmts.append(metadata[0])
 
                 # by setting all defaults to None, we can construct the class only
                 # partially - messages can be defined with optional extensions depending
@@ -65,12 +72,19 @@ class RawData:
         # make this a dataclass (dataclass is an inline operation)
         dataclass(cls)
 
-        cls._FULL_STRUCT_FMT = format_str
-        cls._STRUCT_FMT = "".join(format_str)
-        cls.SIZE = struct.calcsize(cls._STRUCT_FMT)
+        # all formats are little-endian without alignment, so size of a prefix is just
+        # a sum of field sizes
+        cls._FIELD_FMTS = tuple(field_fmts)
+        cls._PREFIX_SIZES = tuple(
+            accumulate((struct.calcsize(f"<{fmt}") for fmt in field_fmts), initial=0)
+        )
+        cls._PREFIX_STRUCTS = {}
+        cls._STRUCT_FMT = "<" + "".join(field_fmts)
+        cls._STRUCT = struct.Struct(cls._STRUCT_FMT)
+        cls.SIZE = cls._STRUCT.size
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Self:
+    def from_bytes(cls, data: bytes, offset: int = 0) -> Self:
         """
         Unpack bytes to an instance of this class
 
@@ -78,15 +92,17 @@ class RawData:
         ----------
         data
             Bytes to decode
+        offset, optional
+            Position in data where the structure starts
 
         Returns
         -------
         Instance of this class decoded from data
         """
-        return cls(*cls.unpack(data))
+        return cls(*cls.unpack(data, offset))
 
     @classmethod
-    def unpack(cls, data: bytes):
+    def unpack(cls, data: bytes, offset: int = 0):
         """
         Unpack binary data according to the fields defined in this class
 
@@ -94,61 +110,70 @@ class RawData:
         ----------
         data
             Bytes to decode
+        offset, optional
+            Position in data where the structure starts
 
         Returns
         -------
         Tuple of unpacked data types
         """
-        struct_fmt = cls._STRUCT_FMT
-        size = cls.SIZE
+        # data may not contain all of the extensions, in that case only fields that fit
+        # the data are unpacked
+        if (data_len := len(data) - offset) < cls.SIZE:
+            if (prefix_struct := cls._PREFIX_STRUCTS.get(data_len)) is None:
+                prefix_struct = cls._prefix_struct(data_len)
+            return prefix_struct.unpack_from(data, offset)
 
-        # data may not contain all of the extensions so if the size is less than we
-        # expect, we try to remove format characters from the end of the format string
-        # until it matches
-        if (data_len := len(data)) < cls.SIZE:
-            struct_fmt, size = cls._fit_struct_to_data(data_len)
-
-        return struct.unpack(struct_fmt, data[:size])
+        return cls._STRUCT.unpack_from(data, offset)
 
     @classmethod
-    def list_from_bytes(cls, data: bytes) -> list[Self]:
+    def list_from_bytes(
+        cls, data: bytes, offset: int = 0, count: int | None = None
+    ) -> list[Self]:
         """
         Decode data into a list of instances of this class
 
         This method can be used to construct list of instances if the data contains
-        multiple concatenated structures. It does not check whether the sizes match so
-        check the caller has to it is the caller's responsibility.
+        multiple concatenated structures. All complete structures are decoded in one
+        pass, incomplete structure at the end of data is decoded partially.
 
         Parameters
         ----------
         data
             Bytes to decode into a list of instances
+        offset, optional
+            Position in data where the first structure starts
+        count, optional
+            Maximum number of structures to decode, all structures in data if None
 
+        Returns
+        -------
+        List of instances decoded from data
         """
-        obj_1 = cls.from_bytes(data)
-        obj_size = obj_1.SIZE
-        ret_list = [obj_1]
-
-        offset = obj_size
-
-        if len(data[offset:]) > obj_1.SIZE:
-            ret_list.append(cls.from_bytes(data[offset:]))
-            offset += obj_size
-        return ret_list
+        available, remainder = divmod(max(len(data) - offset, 0), cls.SIZE)
+        complete = available if count is None else min(count, available)
+        end = offset + complete * cls.SIZE
+
+        items = [
+            cls(*values)
+            for values in cls._STRUCT.iter_unpack(memoryview(data)[offset:end])
+        ]
+        if remainder and (count is None or count > complete):
+            items.append(cls.from_bytes(data, end))
+        return items
 
     @classmethod
-    @cache
-    def _fit_struct_to_data(cls, data_len: int):
-        size = cls.SIZE
-        i = 0
-        reduced_fmt = "".join(cls._FULL_STRUCT_FMT)
-
-        # here, we remove one byte at a time and check if the calculated size fits the
-        # binary data for each loop - if it does, we return the reduced format that is
-        # compatible with the data size and the resulting size
-        while size > data_len:
-            i += 1
-            reduced_fmt = "".join(cls._FULL_STRUCT_FMT[:-i])
-            size = struct.calcsize(reduced_fmt)
-
-        return "".join(cls._FULL_STRUCT_FMT[:-i]), size
+    def _prefix_struct(cls, data_len: int) -> struct.Struct:
+        # number of leading fields that fit into the data
+        num_fields = bisect_right(cls._PREFIX_SIZES, max(data_len, 0)) - 1
+        prefix_size = cls._PREFIX_SIZES[num_fields]
+
+        # all lengths between two field boundaries share the same struct
+        if (prefix_struct := cls._PREFIX_STRUCTS.get(prefix_size)) is None:
+            prefix_struct = struct.Struct(
+                "<" + "".join(islice(cls._FIELD_FMTS, num_fields))
+            )
+            cls._PREFIX_STRUCTS[prefix_size] = prefix_struct
+
+        cls._PREFIX_STRUCTS[data_len] = prefix_struct
+        return prefix_struct
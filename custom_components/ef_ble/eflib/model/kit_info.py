@@ -25,13 +25,9 @@ class AllKitDetailData(RawData):
     kit_base_info: list[KitBaseInfo] = field(default_factory=list)
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Self:
-        parsed = super().from_bytes(data)
-
-        offset = parsed.SIZE
-
-        for _ in range(parsed.support_kit_max_num):
-            base_info = KitBaseInfo.from_bytes(data[offset:])
-            parsed.kit_base_info.append(base_info)
-            offset += base_info.SIZE
+    def from_bytes(cls, data: bytes, offset: int = 0) -> Self:
+        parsed = super().from_bytes(data, offset)
+        parsed.kit_base_info = KitBaseInfo.list_from_bytes(
+            data, offset=offset + parsed.SIZE, count=parsed.support_kit_max_num
+        )
         return parsed
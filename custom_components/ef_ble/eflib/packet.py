@@ -1,14 +1,52 @@
 import logging
 import struct
+from functools import cache
 
-from .crc import crc8, crc16
+from .crc import Buffer, crc8, crc16
 
 _LOGGER = logging.getLogger(__name__)
 
+# prefix, version, payload length, header crc8, product byte, seq, 2 static zeroes, src,
+# dst, [dsrc, ddst,] cmd_set, cmd_id
+_HEADER_V2 = struct.Struct("<BBHBB4s2xBBBB")
+_HEADER_V3 = struct.Struct("<BBHBB4s2xBBBBBB")
+_CRC16 = struct.Struct("<H")
+
+_HEADERS = {
+    0x02: _HEADER_V2,
+    0x03: _HEADER_V3,
+    0x13: _HEADER_V3,
+}
+
+
+@cache
+def _xor_table(key: int) -> bytes:
+    return bytes(byte ^ key for byte in range(256))
+
+
+def _xor_payload(payload: Buffer, key: int) -> bytes:
+    """Xor every byte of payload with key using translation table"""
+    if key == 0:
+        return bytes(payload)
+    return bytes(payload).translate(_xor_table(key))
+
 
 class Packet:
     """Needed to parse and make the internal packet structure"""
 
+    __slots__ = (
+        "cmdId",
+        "cmdSet",
+        "ddst",
+        "dsrc",
+        "dst",
+        "payload",
+        "productId",
+        "seq",
+        "src",
+        "version",
+    )
+
     PREFIX = b"\xaa"
 
     NET_BLE_COMMAND_CMD_CHECK_RET_TIME = 0x53
@@ -16,77 +54,35 @@ class Packet:
 
     def __init__(
         self,
-        src,
-        dst,
-        cmd_set,
-        cmd_id,
-        payload=b"",
-        dsrc=1,
-        ddst=1,
-        version=3,
-        seq=None,
-        product_id=0,
+        src: int,
+        dst: int,
+        cmd_set: int,
+        cmd_id: int,
+        payload: Buffer = b"",
+        dsrc: int = 1,
+        ddst: int = 1,
+        version: int = 3,
+        seq: bytes | None = None,
+        product_id: int = 0,
     ):
-        self._src = src
-        self._dst = dst
-        self._cmd_set = cmd_set
-        self._cmd_id = cmd_id
-        self._payload = payload
-        self._dsrc = dsrc
-        self._ddst = ddst
-        self._version = version
-        self._seq = seq if seq is not None else b"\x00\x00\x00\x00"
-        self._product_id = product_id
-
-        # For representation
-        self._payload_hex = bytearray(self._payload).hex()
-
-    @property
-    def src(self):
-        return self._src
-
-    @property
-    def dst(self):
-        return self._dst
-
-    @property
-    def cmdSet(self):
-        return self._cmd_set
-
-    @property
-    def cmdId(self):
-        return self._cmd_id
-
-    @property
-    def payload(self):
-        return self._payload
+        self.src = src
+        self.dst = dst
+        self.cmdSet = cmd_set
+        self.cmdId = cmd_id
+        # payload can be a memoryview into the decrypted frame
+        self.payload = payload
+        self.dsrc = dsrc
+        self.ddst = ddst
+        self.version = version
+        self.seq = seq if seq is not None else b"\x00\x00\x00\x00"
+        self.productId = product_id
 
     @property
     def payloadHex(self):
-        return self._payload_hex
-
-    @property
-    def dsrc(self):
-        return self._dsrc
-
-    @property
-    def ddst(self):
-        return self._ddst
-
-    @property
-    def version(self):
-        return self._version
-
-    @property
-    def seq(self):
-        return self._seq
-
-    @property
-    def productId(self):
-        return self._product_id
+        return self.payload.hex()
 
     @staticmethod
-    def fromBytes(data, is_xor=False):
+    def fromBytes(data: Buffer, is_xor: bool = False):
         """Deserializes bytes stream into internal data"""
         if not data.startswith(Packet.PREFIX):
             _LOGGER.error(
@@ -96,18 +92,20 @@ class Packet:
             return None
 
         version = data[1]
-        if (version == 2 and len(data) < 18) or (version == 3 and len(data) < 20):
+        header = _HEADERS.get(version, _HEADER_V3)
+
+        # there are also version 19 packets that do not contain crc16 checksum
+        has_crc16 = version in (2, 3)
+        if len(data) < header.size + (_CRC16.size if has_crc16 else 0):
             _LOGGER.error(
                 "Unable to parse packet - too small: %s", bytearray(data).hex()
             )
             return None
 
-        payload_length = struct.unpack("<H", data[2:4])[0]
-
-        # there are also version 19 packets that do not contain crc16 checksum
-        if version in [2, 3]:
+        view = memoryview(data)
+        if has_crc16:
             # Check whole packet CRC16
-            if crc16(data[:-2]) != struct.unpack("<H", data[-2:])[0]:
+            if crc16(view[:-2]) != _CRC16.unpack_from(data, len(data) - 2)[0]:
                 _LOGGER.error(
                     "Unable to parse packet - incorrect CRC16: %s",
                     bytearray(data).hex(),
@@ -115,37 +113,33 @@ class Packet:
                 return None
 
         # Check header CRC8
-        if crc8(data[:4]) != data[4]:
+        if crc8(view[:4]) != data[4]:
             _LOGGER.error(
                 "Unable to parse packet - incorrect header CRC8: %s",
                 bytearray(data).hex(),
             )
             return None
 
-        # data[4] # crc8 of header
-        # product_id = data[5] # We can't determine the product id from the bytestream
-
-        # Seq is used for multiple purposes, so leaving as is
-        seq = data[6:10]
-        # data[10:12] # static zeroes?
-        src = data[12]
-        dst = data[13]
-
+        # product_id can't be determined from the product byte in the bytestream
+        # seq is used for multiple purposes, so leaving as is
         dsrc = ddst = 0
-        payload_start = 16 if version == 2 else 18
-
-        if version == 2:
-            cmd_set, cmd_id = data[14:payload_start]
+        if header is _HEADER_V2:
+            _, _, payload_length, _, _, seq, src, dst, cmd_set, cmd_id = (
+                header.unpack_from(data)
+            )
         else:
-            dsrc, ddst, cmd_set, cmd_id = data[14:payload_start]
+            _, _, payload_length, _, _, seq, src, dst, dsrc, ddst, cmd_set, cmd_id = (
+                header.unpack_from(data)
+            )
 
         payload = b""
         if payload_length > 0:
-            payload = data[payload_start : payload_start + payload_length]
+            payload_start = header.size
+            payload = view[payload_start : payload_start + payload_length]
 
             # If first byte of seq is set - we need to xor payload with it to get the real data
-            if is_xor is True and seq[0] != b"\x00":
-                payload = bytes([c ^ seq[0] for c in payload])
+            if is_xor is True and seq[0] != 0:
+                payload = _xor_payload(payload, seq[0])
 
             if version == 19 and payload[-2:] == b"\xbb\xbb":
                 payload = payload[:-2]
@@ -154,47 +148,59 @@ class Packet:
 
     def toBytes(self):
         """Will serialize the internal data to bytes stream"""
-        # Header
-        data = Packet.PREFIX
-        data += struct.pack("<B", self._version) + struct.pack("<H", len(self._payload))
-        # Header crc
-        data += struct.pack("<B", crc8(data))
-        # Additional data
-        data += self.productByte() + self._seq
-        data += b"\x00\x00"  # Unknown static zeroes, no strings attached right now
-
-        data += struct.pack("<B", self._src) + struct.pack("<B", self._dst)
+        payload_len = len(self.payload)
 
         # V3+ includes dsrc/ddst fields, V2 does not
-        if self._version >= 0x03:
-            data += struct.pack("<B", self._dsrc) + struct.pack("<B", self._ddst)
-
-        data += struct.pack("<B", self._cmd_set) + struct.pack("<B", self._cmd_id)
+        if self.version >= 0x03:
+            header = _HEADER_V3
+            addresses = (self.src, self.dst, self.dsrc, self.ddst)
+        else:
+            header = _HEADER_V2
+            addresses = (self.src, self.dst)
+
+        data = bytearray(header.size + payload_len + _CRC16.size)
+        header.pack_into(
+            data,
+            0,
+            Packet.PREFIX[0],
+            self.version,
+            payload_len,
+            0,  # header crc8, filled below
+            self.productByte()[0],
+            self.seq,
+            *addresses,
+            self.cmdSet,
+            self.cmdId,
+        )
+        view = memoryview(data)
+        # Header crc
+        data[4] = crc8(view[:4])
         # Payload
-        data += self._payload
+        data[header.size : header.size + payload_len] = self.payload
         # Packet crc
-        data += struct.pack("<H", crc16(data))
+        _CRC16.pack_into(data, len(data) - _CRC16.size, crc16(view[: -_CRC16.size]))
+        view.release()
 
-        return data
+        return bytes(data)
 
     def productByte(self):
         """Returns magics depends on product id"""
-        if self._product_id >= 0:
+        if self.productId >= 0:
             return b"\x0d"
         return b"\x0c"
 
     def __repr__(self):
         return (
             "Packet("
-            f"src=0x{self._src:02X}, "
-            f"dst=0x{self._dst:02X}, "
-            f"cmd_set=0x{self._cmd_set:02X}, "
-            f"cmd_id=0x{self._cmd_id:02X}, "
-            f"payload=bytes.fromhex('{self._payload_hex}'), "
-            f"dsrc=0x{self._dsrc:02X}, "
-            f"ddst=0x{self._ddst:02X}, "
-            f"version=0x{self._version:02X}, "
-            f"seq={self._seq}, "
-            f"product_id=0x{self._product_id:02X}"
+            f"src=0x{self.src:02X}, "
+            f"dst=0x{self.dst:02X}, "
+            f"cmd_set=0x{self.cmdSet:02X}, "
+            f"cmd_id=0x{self.cmdId:02X}, "
+            f"payload=bytes.fromhex('{self.payloadHex}'), "
+            f"dsrc=0x{self.dsrc:02X}, "
+            f"ddst=0x{self.ddst:02X}, "
+            f"version=0x{self.version:02X}, "
+            f"seq={self.seq}, "
+            f"product_id=0x{self.productId:02X}"
             ")"
         )
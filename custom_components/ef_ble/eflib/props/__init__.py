@@ -1,9 +1,10 @@
 from .protobuf_field import pb_field, proto_attr_mapper, proto_has_attr
 from .protobuf_props import ProtobufProps
 from .repeated_protobuf_field import repeated_pb_field_type
-from .updatable_props import Field, UpdatableProps
+from .updatable_props import ChangePolicy, Field, UpdatableProps
 
 __all__ = [
+    "ChangePolicy",
     "Field",
     "ProtobufProps",
     "UpdatableProps",
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, overload
 
 from google.protobuf.message import Message
 
-from .updatable_props import Field
+from .updatable_props import ChangePolicy, Field
 
 if TYPE_CHECKING:
     from .protobuf_props import ProtobufProps
@@ -78,6 +78,7 @@ class ProtobufField[T](Field[T]):
         pb_field: _ProtoAttr,
         transform_value: Callable[[Any], T] = lambda x: x,
         process_if_missing: bool = False,
+        change_policy: ChangePolicy | None = None,
     ):
         """
         Create protobuf field that allows value assignment from protobuf message
@@ -90,10 +91,17 @@ class ProtobufField[T](Field[T]):
             Function that takes protobuf attribute value
         process_if_missing, optional
             If True, transform function receives None
+        change_policy, optional
+            Policy that decides which value changes are published
         """
         self.pb_field = pb_field
         self.transform_value = transform_value
         self.process_if_missing = process_if_missing
+        self.change_policy = change_policy
+
+    @property
+    def message_type(self) -> type[Message]:
+        return self.pb_field.message_type
 
     def _get_value(self, value: Message | Any):
         if not isinstance(value, Message):
@@ -112,6 +120,9 @@ class ProtobufField[T](Field[T]):
         if (value := self._get_value(value)) is Skip:
             return
 
+        self._set_from_pb_value(instance, value)
+
+    def _set_from_pb_value(self, instance: "ProtobufProps", value: Any):
         value = self.transform_value(value)
         if value is Skip:
             return
@@ -123,6 +134,8 @@ class ProtobufField[T](Field[T]):
 def pb_field[T_ATTR](
     attr: T_ATTR,
     transform: None = None,
+    *,
+    change_policy: ChangePolicy | None = None,
 ) -> "ProtobufField[T_ATTR]": ...
 
 
@@ -130,12 +143,16 @@ def pb_field[T_ATTR](
 def pb_field[T_ATTR, T_OUT](
     attr: T_ATTR,
     transform: Callable[[T_ATTR], T_OUT | type[Skip]],
+    *,
+    change_policy: ChangePolicy | None = None,
 ) -> "ProtobufField[T_OUT]": ...
 
 
 def pb_field(
     attr: Any,
     transform: Callable[[Any], Any] | None = None,
+    *,
+    change_policy: ChangePolicy | None = None,
 ) -> "ProtobufField[Any]":
     """
     Create field that allows value assignment from protocol buffer messages
@@ -146,6 +163,8 @@ def pb_field(
         Protobuf field attribute of instance returned from `proto_attr_mapper`
     transform, optional
         Function that is applied to raw protobuf value
+    change_policy, optional
+        Policy that decides which value changes are published
     """
     if not isinstance(attr, _ProtoAttr):
         raise TypeError(
@@ -156,6 +175,7 @@ def pb_field(
         pb_field=attr,
         transform_value=transform if transform is not None else lambda x: x,
         process_if_missing=isinstance(transform, TransformIfMissing),
+        change_policy=change_policy,
     )
 
 
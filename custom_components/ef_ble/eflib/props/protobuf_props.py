@@ -1,6 +1,6 @@
 from collections import defaultdict
 from collections.abc import Callable
-from functools import cached_property
+from functools import cache, cached_property
 
 from google.protobuf.message import Message
 
@@ -11,6 +11,93 @@ from .repeated_protobuf_field import ProtobufRepeatedField
 from .updatable_props import UpdatableProps
 
 
+class _MessagePlanNode:
+    """
+    Node of attribute path trie built from protobuf fields of single message type
+
+    Each node represents one attribute on path from the root message and holds fields
+    whose path ends at that attribute. Walking the trie accesses every sub-message only
+    once and skips whole subtrees if their parent message is not present.
+
+    Sparse messages with many bound attributes are walked from fields that are
+    actually present instead, so the cost scales with message content rather than with
+    number of fields declared on device.
+    """
+
+    __slots__ = ("children", "fields", "missing_handlers")
+
+    # ByteSize call is worth it only for nodes with enough children
+    _MIN_CHILDREN_FOR_PRESENT_WALK = 8
+
+    def __init__(self):
+        self.children: dict[str, _MessagePlanNode] = {}
+        self.fields: list[ProtobufField] = []
+        # children with fields that process missing values, by attribute name
+        self.missing_handlers: dict[str, _MessagePlanNode] = {}
+
+    def add(self, field: ProtobufField):
+        parent = node = self
+        for attr in field.pb_field.attrs:
+            parent = node
+            node = node.children.setdefault(attr, _MessagePlanNode())
+        node.fields.append(field)
+        if field.process_if_missing:
+            parent.missing_handlers[field.pb_field.attrs[-1]] = node
+
+    def apply(
+        self, instance: "ProtobufProps", message: Message, size: int | None = None
+    ):
+        n_children = len(self.children)
+        if n_children < self._MIN_CHILDREN_FOR_PRESENT_WALK:
+            self._apply_bound(instance, message)
+            return
+
+        if size is None:
+            size = message.ByteSize()
+
+        # every present field takes at least two bytes, so the message is guaranteed
+        # to have at most half as many present fields as there are bound attributes
+        if size <= n_children:
+            self._apply_present(instance, message)
+        else:
+            self._apply_bound(instance, message)
+
+    def _apply_present(self, instance: "ProtobufProps", message: Message):
+        children = self.children
+        for descriptor, value in message.ListFields():
+            if (node := children.get(descriptor.name)) is None:
+                continue
+
+            for field in node.fields:
+                field._set_from_pb_value(instance, value)
+
+            if node.children:
+                node.apply(instance, value)
+
+        for attr, node in self.missing_handlers.items():
+            if not message.HasField(attr):
+                node.set_missing(instance)
+
+    def _apply_bound(self, instance: "ProtobufProps", message: Message):
+        for attr, node in self.children.items():
+            if not message.HasField(attr):
+                if attr in self.missing_handlers:
+                    node.set_missing(instance)
+                continue
+
+            value = getattr(message, attr)
+            for field in node.fields:
+                field._set_from_pb_value(instance, value)
+
+            if node.children:
+                node.apply(instance, value)
+
+    def set_missing(self, instance: "ProtobufProps"):
+        for field in self.fields:
+            if field.process_if_missing:
+                field._set_from_pb_value(instance, None)
+
+
 class ProtobufProps(UpdatableProps):
     """
     Mixin for augmenting device classes with properties parsed from protobuf messages
@@ -50,24 +137,26 @@ class ProtobufProps(UpdatableProps):
         ].append(repeated_field)
         cls._repeated_field_map = updated_field_map
 
-    @cached_property
-    def message_to_field(self) -> dict[type[Message], list[ProtobufField]]:
-        field_map = defaultdict(list)
-        for field in self._fields:
+    @classmethod
+    @cache
+    def _message_plans(cls) -> dict[type[Message], _MessagePlanNode]:
+        plans: dict[type[Message], _MessagePlanNode] = {}
+        for name in dict.fromkeys(field.public_name for field in cls._fields):
+            # subclasses can redefine fields, only the one visible on class is updated
+            field = getattr(cls, name, None)
             if isinstance(field, ProtobufRepeatedField):
                 continue
 
             if not isinstance(field, ProtobufField):
                 continue
 
-            field_map[field.pb_field.message_type].append(field)
-        return field_map
-
-    def reset_updated(self):
-        self._processed_fields = []
-        return super().reset_updated()
+            message_type = field.pb_field.message_type
+            plans.setdefault(message_type, _MessagePlanNode()).add(field)
+        return plans
 
-    def update_from_message(self, message: Message, reset: bool = False):
+    def update_from_message(
+        self, message: Message, reset: bool = False, size: int | None = None
+    ):
         """
         Update defined fields values from provided message
 
@@ -75,12 +164,16 @@ class ProtobufProps(UpdatableProps):
         ----------
         message
             Protocol buffer message to update fields from
+        reset, optional
+            If True, updated fields are reset before update
+        size, optional
+            Serialized size of message if known, computed only when needed otherwise
         """
         if reset:
             self.reset_updated()
 
-        for field in self.message_to_field[type(message)]:
-            setattr(self, field.public_name, message)
+        if (plan := self._message_plans().get(type(message))) is not None:
+            plan.apply(self, message, size)
 
         for repeated_fields in self._repeated_field_map[type(message)].values():
             field_list = repeated_fields[0].get_list(message)
@@ -114,6 +207,6 @@ class ProtobufProps(UpdatableProps):
     ) -> T_MSG:
         msg = message_type()
         msg.ParseFromString(serialized_message)
-        self.update_from_message(msg, reset=reset)
+        self.update_from_message(msg, reset=reset, size=len(serialized_message))
         self._log_message(msg)
         return msg
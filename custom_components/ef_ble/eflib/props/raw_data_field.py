@@ -4,7 +4,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any, overload
 
 from ..model.base import RawData
-from .updatable_props import Field
+from .updatable_props import ChangePolicy, Field
 
 if TYPE_CHECKING:
     from .raw_data_props import RawDataProps
@@ -50,10 +50,16 @@ class RawDataField[T](Field[T]):
         data_attr: _DataclassAttr,
         identifier: str = "",
         transform_value: Callable[[Any], T] = lambda x: x,
+        change_policy: ChangePolicy | None = None,
     ):
         self.data_attr = data_attr
         self.identifier = identifier
         self._transform_value = transform_value
+        self.change_policy = change_policy
+
+    @property
+    def message_type(self) -> type[Any]:
+        return self.data_attr.message_type
 
     def _get_value(self, value: Any):
         if not isinstance(value, RawData):
@@ -71,6 +77,8 @@ class RawDataField[T](Field[T]):
 def raw_field[T_ATTR](
     attr: T_ATTR,
     transform: None = None,
+    *,
+    change_policy: ChangePolicy | None = None,
 ) -> RawDataField[T_ATTR]: ...
 
 
@@ -78,11 +86,16 @@ def raw_field[T_ATTR](
 def raw_field[T_ATTR, T_OUT](
     attr: T_ATTR,
     transform: Callable[[T_ATTR], T_OUT],
+    *,
+    change_policy: ChangePolicy | None = None,
 ) -> RawDataField[T_OUT]: ...
 
 
 def raw_field(
-    attr: Any, transform: Callable[[Any], Any] | None = None
+    attr: Any,
+    transform: Callable[[Any], Any] | None = None,
+    *,
+    change_policy: ChangePolicy | None = None,
 ) -> RawDataField[Any]:
     if not isinstance(attr, _DataclassAttr):
         raise TypeError(
@@ -93,4 +106,5 @@ def raw_field(
     return RawDataField(
         data_attr=attr,
         transform_value=transform if transform is not None else lambda x: x,
+        change_policy=change_policy,
     )
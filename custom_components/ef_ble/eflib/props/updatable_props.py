@@ -1,3 +1,6 @@
+import time
+from collections.abc import Iterable, Iterator
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from typing import Any, ClassVar, Self, overload
 
@@ -6,46 +9,190 @@ class UpdatableProps:
     """
     Mixin for augmenting device classes with advanced properties
 
-    If any property changed its value after calling `reset_updated`, attribute
-    `updated` is set to True and all updated field names are added to
-    `updated_fields`.
+    Values of all fields are kept in a single list indexed by slot of the field and
+    fields updated after calling `reset_updated` are tracked as bits of an integer
+    mask, so neither storing values nor tracking updates allocates per field. Slots of
+    updated fields are also kept in a list, so iterating them does not walk the mask.
 
     Attributes
     ----------
     updated
         Holds True if any fields are updated after calling `reset_updated`
+    updated_fields
+        Names of fields that were updated after calling `reset_updated`
     """
 
-    updated: bool = False
-    _updated_fields: list[str] | None = None
+    _fields: ClassVar[list["Field[Any]"]] = []
 
-    @property
-    def updated_fields(self):
-        """List of field names that were updated after calling `reset_updated`"""
-        if self._updated_fields is None:
-            self._updated_fields = []
-        return self._updated_fields
+    _field_values: list[Any]
+    _field_published_at: dict[int, float]
+    _field_deferred: set[int]
+    _dirty_mask: int = 0
+    _dirty_slots: list[int]
+    _updated_fields_view: "UpdatedFields | None" = None
 
-    @updated_fields.setter
-    def updated_fields(self, value: list[str]):
-        self._updated_fields = value
+    @property
+    def updated(self) -> bool:
+        return self._dirty_mask != 0
 
-    _fields: ClassVar[list["Field[Any]"]] = []
+    @property
+    def updated_fields(self) -> "UpdatedFields":
+        if self._updated_fields_view is None:
+            self._updated_fields_view = UpdatedFields(self)
+        return self._updated_fields_view
 
     def reset_updated(self):
-        self.updated = False
-        self.updated_fields = []
+        if self._dirty_mask:
+            self._dirty_mask = 0
+            self._dirty_slots.clear()
+
+    def _init_field_values(self) -> list[Any]:
+        self._field_values = values = [None] * len(self._fields)
+        self._field_published_at = {}
+        self._field_deferred = set()
+        self._dirty_slots = []
+        return values
+
+    def _change_pending(self, fields: Iterable["Field[Any]"]) -> bool:
+        """
+        Return True if value of any field with change policy would be published again
+
+        That is the case when its `max_silence` elapsed or its change was only held
+        back by `min_interval`, even if the same value is received again.
+        """
+        try:
+            published = self._field_published_at
+        except AttributeError:
+            return False
+
+        now = time.monotonic()
+        for field in fields:
+            if field.slot in self._field_deferred:
+                return True
+            if (policy := field.change_policy) is None or policy.max_silence is None:
+                continue
+            if (published_at := published.get(field.slot)) is not None and (
+                now - published_at >= policy.max_silence
+            ):
+                return True
+        return False
+
+
+class UpdatedFields(AbstractSet[str]):
+    """
+    Live view of field names that were updated after calling `reset_updated`
+
+    Names are yielded in order of field definition. View is created once per instance
+    and reads the dirty mask when iteration starts, so fields updated while iterating
+    are not included.
+    """
+
+    __slots__ = ("_props",)
+
+    def __init__(self, props: UpdatableProps):
+        self._props = props
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._props._dirty_mask:
+            return
+        fields = self._props._fields
+        for slot in sorted(self._props._dirty_slots):
+            yield fields[slot].public_name
+
+    def __len__(self) -> int:
+        return self._props._dirty_mask.bit_count()
+
+    def __contains__(self, name: object) -> bool:
+        field = (
+            getattr(type(self._props), name, None) if isinstance(name, str) else None
+        )
+        return isinstance(field, Field) and bool(self._props._dirty_mask & field.mask)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChangePolicy:
+    """
+    Policy that decides if new field value is significant enough to be published
+
+    Attributes
+    ----------
+    absolute
+        Numeric changes smaller or equal to this value are ignored
+    relative
+        Numeric changes smaller or equal to this fraction of previous value are ignored
+    min_interval
+        Minimum time in seconds between published changes
+    max_silence
+        Value is published even if it did not change significantly when this many
+        seconds passed since it was last published
+    """
+
+    absolute: float = 0
+    relative: float = 0
+    min_interval: float = 0
+    max_silence: float | None = None
+
+    def is_significant(self, old: Any, new: Any, elapsed: float | None) -> bool:
+        """
+        Return True if new value should replace old value
+
+        Parameters
+        ----------
+        old
+            Currently published value
+        new
+            Newly received value
+        elapsed
+            Time in seconds since value was last published, None if it never was
+        """
+        if elapsed is None:
+            return new != old
+
+        if self.max_silence is not None and elapsed >= self.max_silence:
+            return True
+
+        if new == old or elapsed < self.min_interval:
+            return False
+
+        if not (_is_number(old) and _is_number(new)):
+            return True
+
+        return abs(new - old) > max(self.absolute, self.relative * abs(old))
+
+    def is_deferred(self, old: Any, new: Any, elapsed: float | None) -> bool:
+        """Return True if new value is significant but held back by `min_interval`"""
+        return (
+            elapsed is not None
+            and elapsed < self.min_interval
+            and self.is_significant(old, new, self.min_interval)
+        )
+
+
+def _is_number(value: Any):
+    return isinstance(value, int | float) and not isinstance(value, bool)
 
 
 @dataclass(kw_only=True)
 class Field[T]:
     """Descriptor for updating values only if they changed"""
 
+    change_policy: ChangePolicy | None = None
+
     def __set_name__[T_PROPS: UpdatableProps](self, owner: type[T_PROPS], name: str):
         self.public_name = name
-        self.private_name = f"_{name}"
+        # fields of subclasses are appended, so slots of inherited fields stay valid
+        self.slot = len(owner._fields)
+        self.mask = 1 << self.slot
         owner._fields = [*owner._fields, self]
 
+    @property
+    def message_type(self) -> type | None:
+        """Type of the message the value is read from, if it is known"""
+        return None
+
     def __set__(self, instance: UpdatableProps, value: Any):
         self._set_value(instance, value)
 
@@ -56,12 +203,31 @@ class Field[T]:
                 f"of {UpdatableProps.__name__}"
             )
 
-        if value == getattr(instance, self.public_name):
-            return
-
-        setattr(instance, self.private_name, value)
-        instance.updated = True
-        instance.updated_fields.append(self.public_name)
+        try:
+            values = instance._field_values
+        except AttributeError:
+            values = instance._init_field_values()
+
+        if (policy := self.change_policy) is None:
+            if value == values[self.slot]:
+                return
+        else:
+            now = time.monotonic()
+            published_at = instance._field_published_at.get(self.slot)
+            elapsed = None if published_at is None else now - published_at
+            if not policy.is_significant(values[self.slot], value, elapsed):
+                if policy.is_deferred(values[self.slot], value, elapsed):
+                    instance._field_deferred.add(self.slot)
+                else:
+                    instance._field_deferred.discard(self.slot)
+                return
+            instance._field_published_at[self.slot] = now
+            instance._field_deferred.discard(self.slot)
+
+        values[self.slot] = value
+        if not instance._dirty_mask & self.mask:
+            instance._dirty_mask |= self.mask
+            instance._dirty_slots.append(self.slot)
 
     @overload
     def __get__(self, instance: None, owner: type[UpdatableProps]) -> Self: ...
@@ -76,4 +242,7 @@ class Field[T]:
     ) -> T | Self | None:
         if instance is None:
             return self
-        return getattr(instance, self.private_name, None)
+        try:
+            return instance._field_values[self.slot]
+        except AttributeError:
+            return None
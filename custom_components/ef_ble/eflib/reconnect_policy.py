@@ -0,0 +1,114 @@
+import random
+import time
+from dataclasses import asdict, dataclass
+from enum import StrEnum, auto
+
+
+@dataclass(frozen=True, kw_only=True)
+class ReconnectPolicy:
+    """
+    Delays between attempts to restore lost connection
+
+    Delay before every attempt is chosen randomly between 0 and exponentially growing
+    limit (full jitter), so devices that lost connection at the same time do not retry
+    together. After `max_attempts` failed attempts, circuit breaker opens and only one
+    attempt is made every `cooldown` seconds until connection is restored.
+
+    Attributes
+    ----------
+    base_delay
+        Limit of the delay before first attempt in seconds, doubled after every attempt
+    max_delay
+        Maximum limit of the delay in seconds
+    max_attempts
+        Number of failed attempts after which circuit breaker opens
+    cooldown
+        Time in seconds between attempts while circuit breaker is open, if None,
+        reconnect gives up instead
+    max_connect_attempts
+        Number of failed attempts of initial connection before it gives up
+    """
+
+    base_delay: float = 5.0
+    max_delay: float = 300.0
+    max_attempts: int = 10
+    cooldown: float | None = 900.0
+    max_connect_attempts: int = 10
+
+    def delay(self, attempt: int) -> float:
+        """Randomized delay in seconds before attempt, first attempt is 1"""
+        limit = min(self.max_delay, self.base_delay * 2 ** min(attempt - 1, 32))
+        return random.uniform(0, limit)
+
+
+class CircuitState(StrEnum):
+    CLOSED = auto()
+    """Reconnect attempts are made with backoff"""
+
+    OPEN = auto()
+    """Too many failed attempts, waiting for cooldown"""
+
+    HALF_OPEN = auto()
+    """Single attempt after cooldown, failure opens circuit again"""
+
+
+class ReconnectBackoff:
+    """Reconnect attempts of single connection driven by `ReconnectPolicy`"""
+
+    def __init__(self, policy: ReconnectPolicy | None = None):
+        self.policy = policy if policy is not None else ReconnectPolicy()
+        self.attempt = 0
+        self.state = CircuitState.CLOSED
+        self.opened_at: float | None = None
+        self.last_delay = 0.0
+        self.reconnects = 0
+
+    def next_delay(self) -> float | None:
+        """
+        Register new attempt and return delay before it
+
+        Returns
+        -------
+            Delay in seconds or None if policy gives up
+        """
+        self.attempt += 1
+        # also reopens circuit after failed attempt in half-open state
+        if self.attempt > self.policy.max_attempts:
+            self._open()
+
+        if self.state is CircuitState.OPEN:
+            if self.policy.cooldown is None:
+                return None
+            self.state = CircuitState.HALF_OPEN
+            self.last_delay = self.policy.cooldown
+        else:
+            self.last_delay = self.policy.delay(self.attempt)
+        return self.last_delay
+
+    def succeeded(self):
+        """Reset backoff after connection was restored"""
+        if self.attempt:
+            self.reconnects += 1
+        self.attempt = 0
+        self.state = CircuitState.CLOSED
+        self.opened_at = None
+
+    def reset(self):
+        self.attempt = 0
+        self.state = CircuitState.CLOSED
+        self.opened_at = None
+
+    def as_dict(self):
+        return {
+            "policy": asdict(self.policy),
+            "state": self.state.value,
+            "attempt": self.attempt,
+            "last_delay": self.last_delay,
+            "opened_at": self.opened_at,
+            "reconnects": self.reconnects,
+        }
+
+    def _open(self):
+        self.state = CircuitState.OPEN
+        if self.opened_at is None:
+            self.opened_at = time.time()
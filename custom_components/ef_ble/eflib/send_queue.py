@@ -0,0 +1,257 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import IntEnum, StrEnum, auto
+
+from .exceptions import PacketDropped
+
+DEFAULT_MAX_DEPTH = 64
+
+
+class SendPriority(IntEnum):
+    """Priority of queued frame, frames with lower value are written first"""
+
+    COMMAND = 0
+    NORMAL = 1
+    ACK = 2
+
+
+class DropPolicy(StrEnum):
+    """What happens with new frame when queue is full of frames with same priority"""
+
+    BLOCK = auto()
+    """Sender waits until there is space, frames queued without waiting are dropped"""
+
+    DROP_OLDEST = auto()
+    """Oldest queued frame is dropped"""
+
+    DROP_NEWEST = auto()
+    """New frame is dropped"""
+
+
+class _QueuedFrame:
+    __slots__ = ("data", "future")
+
+    def __init__(self, data: bytes, future: asyncio.Future[None]):
+        self.data = data
+        self.future = future
+
+
+class SendQueue:
+    """
+    Priority queue of encrypted frames written to device by a single writer task
+
+    Writes are never done concurrently, so frames reach the device in order of their
+    priority and commands are not stuck behind acks of pushed messages. When the queue
+    is full, frames with lower priority are dropped first to make space for frames with
+    higher priority, otherwise `DropPolicy` decides what to do.
+
+    If coalescing is enabled, multiple small frames are concatenated into a single
+    write up to the size returned by `max_write_size`.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], Awaitable[None]],
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+        max_write_size: Callable[[], int] | None = None,
+    ):
+        """
+        Create send queue
+
+        Parameters
+        ----------
+        write
+            Coroutine function that writes data to the device
+        max_depth, optional
+            Maximum number of queued frames
+        drop_policy, optional
+            Policy used when queue is full of frames with the same or higher priority
+        max_write_size, optional
+            Function returning maximum size of single write, if set, multiple frames
+            are coalesced into one write
+        """
+        self._write = write
+        self._max_depth = max_depth
+        self._drop_policy = drop_policy
+        self._max_write_size = max_write_size
+
+        self._queues: tuple[deque[_QueuedFrame], ...] = tuple(
+            deque() for _ in SendPriority
+        )
+        self._size = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._writer: asyncio.Task[None] | None = None
+        self._in_flight: list[_QueuedFrame] = []
+
+        self.dropped = 0
+        self.writes = 0
+        self.frames = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def configure(
+        self, max_depth: int | None = None, drop_policy: DropPolicy | None = None
+    ):
+        if max_depth is not None:
+            self._max_depth = max_depth
+        if drop_policy is not None:
+            self._drop_policy = drop_policy
+        self._update_not_full()
+        return self
+
+    def put(
+        self, data: bytes, priority: SendPriority = SendPriority.COMMAND
+    ) -> asyncio.Future[None]:
+        """
+        Queue frame without waiting for space
+
+        Returns
+        -------
+            Future that is resolved when frame is written, if frame is dropped,
+            `PacketDropped` is set as its exception
+        """
+        future = asyncio.get_running_loop().create_future()
+        frame = _QueuedFrame(data, future)
+
+        if self._size >= self._max_depth and not self._make_space(priority):
+            self._drop(frame)
+            return future
+
+        self._append(frame, priority)
+        return future
+
+    async def send(
+        self, data: bytes, priority: SendPriority = SendPriority.COMMAND
+    ) -> None:
+        """
+        Queue frame and wait until it is written
+
+        With `DropPolicy.BLOCK`, sender waits for free space in the queue before frame
+        is queued.
+
+        Raises
+        ------
+        PacketDropped
+            If frame was dropped from the queue before it was written
+        """
+        while (
+            self._drop_policy is DropPolicy.BLOCK
+            and self._size >= self._max_depth
+            and not self._has_lower_priority(priority)
+        ):
+            await self._not_full.wait()
+
+        # shielded so cancelled sender does not cancel write of frames coalesced with
+        # this one
+        await asyncio.shield(self.put(data, priority))
+
+    def clear(self):
+        """Drop all queued frames and stop the writer"""
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+
+        for frame in self._in_flight:
+            self._drop(frame)
+        self._in_flight = []
+
+        for queue in self._queues:
+            while queue:
+                self._drop(queue.popleft())
+        self._size = 0
+        self._not_empty.clear()
+        self._update_not_full()
+
+    def _append(self, frame: _QueuedFrame, priority: SendPriority):
+        self._queues[priority].append(frame)
+        self._size += 1
+        self._not_empty.set()
+        self._update_not_full()
+
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.get_running_loop().create_task(self._run())
+
+    def _has_lower_priority(self, priority: SendPriority) -> bool:
+        return any(self._queues[p] for p in SendPriority if p > priority)
+
+    def _make_space(self, priority: SendPriority) -> bool:
+        # frames with lower priority are always dropped first
+        for queue_priority in reversed(SendPriority):
+            if queue_priority < priority:
+                break
+            if queue_priority == priority and self._drop_policy is not (
+                DropPolicy.DROP_OLDEST
+            ):
+                break
+            if queue := self._queues[queue_priority]:
+                self._drop(queue.popleft())
+                self._size -= 1
+                return True
+        return False
+
+    def _drop(self, frame: _QueuedFrame):
+        self.dropped += 1
+        self._resolve(frame, PacketDropped())
+
+    @staticmethod
+    def _resolve(frame: _QueuedFrame, exc: Exception | None = None):
+        if frame.future.done():
+            return
+
+        if exc is None:
+            frame.future.set_result(None)
+            return
+
+        frame.future.set_exception(exc)
+        # nobody may be waiting for acks, do not log unretrieved exception
+        frame.future.exception()
+
+    def _pop_batch(self) -> list[_QueuedFrame]:
+        limit = self._max_write_size() if self._max_write_size is not None else 0
+        batch: list[_QueuedFrame] = []
+        size = 0
+        for queue in self._queues:
+            while queue:
+                frame_size = len(queue[0].data)
+                if batch and size + frame_size > limit:
+                    return batch
+                batch.append(queue.popleft())
+                size += frame_size
+        return batch
+
+    async def _run(self):
+        while True:
+            await self._not_empty.wait()
+
+            self._in_flight = batch = self._pop_batch()
+            self._size -= len(batch)
+            if not self._size:
+                self._not_empty.clear()
+            self._update_not_full()
+
+            error = None
+            try:
+                await self._write(
+                    batch[0].data
+                    if len(batch) == 1
+                    else b"".join(frame.data for frame in batch)
+                )
+            except Exception as e:  # noqa: BLE001
+                error = e
+
+            self._in_flight = []
+            self.writes += 1
+            self.frames += len(batch)
+            for frame in batch:
+                self._resolve(frame, error)
+
+    def _update_not_full(self):
+        if self._size < self._max_depth:
+            self._not_full.set()
+        else:
+            self._not_full.clear()
@@ -0,0 +1,153 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+DEFAULT_STALL_FACTOR = 4.0
+DEFAULT_MIN_STALL_TIMEOUT = 30.0
+DEFAULT_MAX_STALL_TIMEOUT = 180.0
+
+type StreamKey = tuple[int, int, int]
+
+# packets closer than this are considered part of the same push
+_MIN_INTERVAL = 0.5
+_SMOOTHING = 0.2
+_MIN_SAMPLES = 3
+
+
+class _Stream:
+    __slots__ = ("interval", "last", "samples")
+
+    def __init__(self, now: float):
+        self.last = now
+        self.interval: float | None = None
+        self.samples = 0
+
+
+class StallWatchdog:
+    """
+    Detects notification stream that went silent while connection is still up
+
+    Push interval of every (src, cmdSet, cmdId) stream is learned as exponential moving
+    average. When no frame arrives for `factor` times the interval of the fastest
+    stream, clamped between minimum and maximum timeout, `on_stall` is called with
+    stage 1. Stage is increased every timeout while the stream stays silent, so the
+    caller can escalate, and reset by next received frame.
+    """
+
+    def __init__(
+        self,
+        on_stall: Callable[[int], None],
+        factor: float = DEFAULT_STALL_FACTOR,
+        min_timeout: float = DEFAULT_MIN_STALL_TIMEOUT,
+        max_timeout: float = DEFAULT_MAX_STALL_TIMEOUT,
+    ):
+        """
+        Create stall watchdog
+
+        Parameters
+        ----------
+        on_stall
+            Function called with stage of the stall, starting at 1
+        factor, optional
+            Number of learned push intervals without frame before stream is stalled
+        min_timeout, optional
+            Minimum time in seconds without frame before stream is stalled
+        max_timeout, optional
+            Maximum time in seconds without frame, also used before any push interval
+            is learned
+        """
+        self._on_stall = on_stall
+        self._factor = factor
+        self._min_timeout = min_timeout
+        self._max_timeout = max_timeout
+
+        self._streams: dict[StreamKey, _Stream] = {}
+        self._last_frame: float | None = None
+        self._stage = 0
+        self._handle: asyncio.TimerHandle | None = None
+
+        self.stalls = 0
+
+    @property
+    def last_frame_time(self) -> float | None:
+        """Value of `time.monotonic()` when the last frame was received"""
+        return self._last_frame
+
+    @property
+    def timeout(self) -> float:
+        """Time in seconds without frame after which stream is considered stalled"""
+        intervals = [
+            stream.interval
+            for stream in self._streams.values()
+            if stream.interval is not None and stream.samples >= _MIN_SAMPLES
+        ]
+        if not intervals:
+            return self._max_timeout
+        return min(
+            max(self._factor * min(intervals), self._min_timeout), self._max_timeout
+        )
+
+    def intervals(self) -> dict[StreamKey, float]:
+        """Learned push intervals in seconds"""
+        return {
+            key: stream.interval
+            for key, stream in self._streams.items()
+            if stream.interval is not None
+        }
+
+    def start(self):
+        """Start watching, learned intervals are kept between connections"""
+        self.stop()
+        self._last_frame = time.monotonic()
+        self._schedule(self._last_frame + self.timeout)
+
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stage = 0
+
+    def frame(self):
+        """Register received frame"""
+        self._last_frame = time.monotonic()
+        self._stage = 0
+
+    def packet(self, key: StreamKey):
+        """Register received packet to learn push interval of its stream"""
+        now = time.monotonic()
+        if (stream := self._streams.get(key)) is None:
+            self._streams[key] = _Stream(now)
+            return
+
+        elapsed = now - stream.last
+        if elapsed < _MIN_INTERVAL:
+            return
+
+        stream.last = now
+        stream.samples += 1
+        if stream.interval is None:
+            stream.interval = elapsed
+        else:
+            stream.interval += _SMOOTHING * (elapsed - stream.interval)
+
+    def _schedule(self, when: float):
+        self._handle = asyncio.get_running_loop().call_later(
+            max(when - time.monotonic(), 0), self._check
+        )
+
+    def _check(self):
+        self._handle = None
+        if self._last_frame is None:
+            return
+
+        timeout = self.timeout
+        now = time.monotonic()
+        if now - self._last_frame < timeout:
+            self._schedule(self._last_frame + timeout)
+            return
+
+        self._stage += 1
+        if self._stage == 1:
+            self.stalls += 1
+        self._schedule(now + timeout)
+        self._on_stall(self._stage)
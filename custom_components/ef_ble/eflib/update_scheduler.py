@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Callable, Iterable
+
+DEFAULT_WARMUP = 5.0
+
+
+class _PeriodGroup:
+    __slots__ = ("dirty", "handle", "next_flush", "period")
+
+    def __init__(self, period: float):
+        self.period = period
+        self.dirty: set[str] = set()
+        self.handle: asyncio.TimerHandle | None = None
+        self.next_flush = 0.0
+
+
+class UpdateScheduler:
+    """
+    Coalescing scheduler for property update callbacks
+
+    Properties marked as dirty are collected and flushed together at most once per
+    period on the event loop. Change after quiet period is flushed on the next loop
+    iteration, so all properties updated from single packet end up in one flush. Later
+    changes within the period are flushed as soon as the period ends, so the latest
+    value is never held back until another packet arrives.
+
+    Properties can have their own period, properties with the same period are flushed
+    together.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Iterable[str]], None],
+        period: float = 0,
+        warmup: float = DEFAULT_WARMUP,
+    ):
+        """
+        Create update scheduler
+
+        Parameters
+        ----------
+        flush
+            Function that receives names of properties that changed since last flush
+        period, optional
+            Minimum time in seconds between flushes, 0 flushes every change immediately
+        warmup, optional
+            Time in seconds after first change during which changes are not throttled,
+            otherwise everything would display unknown until first period ends
+        """
+        self._flush = flush
+        self._period = period
+        self._warmup = warmup
+        self._warmup_until: float | None = None
+        self._field_periods: dict[str, float] = {}
+        self._groups: dict[float, _PeriodGroup] = {}
+
+    @property
+    def period(self) -> float:
+        return self._period
+
+    def with_period(self, period: float, warmup: float | None = None):
+        self._period = period
+        if warmup is not None:
+            self._warmup = warmup
+        return self
+
+    def set_field_period(self, name: str, period: float | None):
+        """Override period for single property, None restores default period"""
+        if period is None:
+            self._field_periods.pop(name, None)
+        else:
+            self._field_periods[name] = period
+
+    def mark_dirty(self, *names: str):
+        """Mark properties as changed and schedule their flush"""
+        immediate = []
+        for name in names:
+            period = self._field_periods.get(name, self._period)
+            if period <= 0:
+                immediate.append(name)
+                continue
+
+            if (group := self._groups.get(period)) is None:
+                group = self._groups[period] = _PeriodGroup(period)
+
+            group.dirty.add(name)
+            if group.handle is None:
+                self._schedule(group)
+
+        if immediate:
+            self._flush(immediate)
+
+    def _schedule(self, group: _PeriodGroup):
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._warmup_until is None:
+            self._warmup_until = now + self._warmup
+
+        when = now if now < self._warmup_until else max(now, group.next_flush)
+        group.handle = loop.call_at(when, self._flush_group, group)
+
+    def flush(self):
+        """Flush all pending properties immediately"""
+        for group in self._groups.values():
+            if group.handle is not None:
+                group.handle.cancel()
+                self._flush_group(group)
+
+    def cancel(self):
+        """Drop all pending properties without flushing them"""
+        for group in self._groups.values():
+            if group.handle is not None:
+                group.handle.cancel()
+                group.handle = None
+            group.dirty.clear()
+
+    def _flush_group(self, group: _PeriodGroup):
+        group.handle = None
+        group.next_flush = asyncio.get_running_loop().time() + group.period
+
+        dirty, group.dirty = group.dirty, set()
+        self._flush(dirty)
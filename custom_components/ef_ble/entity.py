@@ -14,7 +14,9 @@ class EcoflowEntity(Entity):
 
     def __init__(self, device: DeviceBase):
         self._device = device
-        self._update_callbacks: list[tuple[str, Callable[[Any], None]]] = []
+        self._update_callbacks: list[
+            tuple[str, str, Callable[[Any], EcoflowEntity.SkipWrite | Any]]
+        ] = []
 
     @property
     def device_info(self):
@@ -34,8 +36,8 @@ class EcoflowEntity(Entity):
 
     @property
     def available(self) -> bool:
-        """Return True if device is connected."""
-        return self._device.is_connected
+        """Return True if device is connected and authenticated."""
+        return self._device.is_available
 
     class SkipWrite:
         """Sentinel value for skipping write in update callback"""
@@ -49,25 +51,49 @@ class EcoflowEntity(Entity):
         if prop_name is None:
             return
 
-        @callback
-        def state_updated(state: Any):
-            if (state := get_state(state)) is EcoflowEntity.SkipWrite:
-                return
+        if (state := getattr(self._device, prop_name, None)) is not None:
+            setattr(self, entity_attr, get_state(state))
+
+        self._update_callbacks.append((prop_name, entity_attr, get_state))
+
+    @callback
+    def _states_updated(self, updates: dict[str, Any]):
+        # all props updated from single packet are applied before writing state once
+        write_state = False
+        for prop_name, entity_attr, get_state in self._update_callbacks:
+            if prop_name not in updates:
+                continue
+
+            if (state := get_state(updates[prop_name])) is EcoflowEntity.SkipWrite:
+                continue
 
             setattr(self, entity_attr, state)
+            write_state = True
+
+        if write_state:
             self.async_write_ha_state()
 
-        if (state := getattr(self._device, prop_name, None)) is not None:
-            setattr(self, entity_attr, get_state(state))
+    @property
+    def _update_props(self):
+        return {prop_name for prop_name, _, _ in self._update_callbacks}
 
-        self._update_callbacks.append((prop_name, state_updated))
+    @callback
+    def _availability_changed(self, available: bool):
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        for prop, state_callback in self._update_callbacks:
-            self._device.register_state_update_callback(state_callback, prop)
+        self.async_on_remove(
+            self._device.on_availability_change(self._availability_changed)
+        )
+        if self._update_callbacks:
+            self._device.register_batch_update_callback(
+                self._states_updated, self._update_props
+            )
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        for prop, state_callback in self._update_callbacks:
-            self._device.remove_state_update_calback(state_callback, prop)
+        if self._update_callbacks:
+            self._device.remove_batch_update_callback(
+                self._states_updated, self._update_props
+            )
         await super().async_will_remove_from_hass()
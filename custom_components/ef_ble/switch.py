@@ -137,7 +137,7 @@ class EcoflowSwitchEntity(EcoflowEntity, SwitchEntity):
 
     @property
     def available(self):
-        return self._device.is_connected and self._on_off_state is not None
+        return super().available and self._on_off_state is not None
 
     @property
     def is_on(self):
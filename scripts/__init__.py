@@ -0,0 +1 @@
+"""Development scripts, run from repository root as `python -m scripts.<name>`"""
@@ -0,0 +1,60 @@
+"""Benchmark of session cipher against AES-CBC cipher created for every frame"""
+
+from functools import partial
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+
+from custom_components.ef_ble.eflib.cipher import SessionCipher
+
+from .benchmark import compare, header, random_payload
+
+KEY = random_payload(16, seed=1)
+IV = random_payload(16, seed=2)
+
+
+# inline copy of the previous Connection.encryptSession/decryptSession
+def old_encrypt(payload: bytes):
+    aes_session = AES.new(KEY, AES.MODE_CBC, IV)
+    return aes_session.encrypt(pad(payload, AES.block_size))
+
+
+def old_decrypt(encrypted_payload: bytes):
+    aes_session = AES.new(KEY, AES.MODE_CBC, IV)
+    return unpad(aes_session.decrypt(encrypted_payload), AES.block_size)
+
+
+def old_decrypt_many(encrypted_payloads: list[bytes]):
+    return [old_decrypt(payload) for payload in encrypted_payloads]
+
+
+def main():
+    cipher = SessionCipher(KEY, IV)
+
+    header("AES-CBC session encryption of random frames")
+    # command, small status and heartbeat sizes
+    for size in (30, 200, 600):
+        payload = random_payload(size)
+        encrypted = old_encrypt(payload)
+        compare(
+            f"decrypt {size} B",
+            partial(old_decrypt, encrypted),
+            partial(cipher.decrypt, encrypted),
+        )
+        compare(
+            f"encrypt {size} B",
+            partial(old_encrypt, payload),
+            partial(cipher.encrypt, payload),
+        )
+
+    # notification carrying several frames
+    frames = [old_encrypt(random_payload(200, seed)) for seed in range(4)]
+    compare(
+        "decrypt 4 x 200 B notification",
+        partial(old_decrypt_many, frames),
+        partial(cipher.decrypt_many, frames),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of table-driven CRC8/CRC16 against the previous `crc` package calculator
+
+Previous implementation needs the `crc` package, which is no longer a dependency of the
+integration, install it with `pip install crc` to run this benchmark.
+"""
+
+from functools import partial
+
+from crc import Calculator, Configuration, Crc8
+
+from custom_components.ef_ble.eflib import crc as eflib_crc
+
+from .benchmark import compare, header, random_payload
+
+# inline copy of the previous eflib.crc module
+crc16_arc = Configuration(
+    width=16,
+    polynomial=0x8005,
+    init_value=0x0000,
+    final_xor_value=0x0000,
+    reverse_input=True,
+    reverse_output=True,
+)
+
+
+def old_crc8(data: bytes):
+    return Calculator(Crc8.CCITT).checksum(data)
+
+
+def old_crc16(data: bytes):
+    return Calculator(crc16_arc).checksum(data)
+
+
+def main():
+    header("CRC of random payloads")
+    # header of every packet, small packet and multi-frame heartbeat
+    for size in (4, 32, 300):
+        data = random_payload(size)
+        compare(
+            f"crc8 {size} B", partial(old_crc8, data), partial(eflib_crc.crc8, data)
+        )
+        compare(
+            f"crc16 {size} B", partial(old_crc16, data), partial(eflib_crc.crc16, data)
+        )
+
+    data = random_payload(300)
+    compare(
+        "crc16 300 B memoryview",
+        lambda: old_crc16(data),
+        lambda: eflib_crc.crc16(memoryview(data)),
+    )
+    compare(
+        "crc16 300 B in 2 updates",
+        lambda: old_crc16(data),
+        lambda: eflib_crc.Crc16(data[:100]).update(data[100:]).value,
+    )
+
+
+if __name__ == "__main__":
+    main()
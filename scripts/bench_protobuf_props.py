@@ -0,0 +1,89 @@
+"""Benchmark of protobuf field updates through attribute path trie"""
+
+from collections import defaultdict
+from functools import partial
+
+from bleak.backends.device import BLEDevice
+from google.protobuf.message import Message
+
+from custom_components.ef_ble.eflib.devices import shp2
+from custom_components.ef_ble.eflib.pb import pd303_pb2
+from custom_components.ef_ble.eflib.props import ProtobufProps
+from custom_components.ef_ble.eflib.props.protobuf_field import ProtobufField
+from custom_components.ef_ble.eflib.props.repeated_protobuf_field import (
+    ProtobufRepeatedField,
+)
+
+from .benchmark import compare, filled_message, header
+
+
+# inline copy of the previous ProtobufProps.message_to_field
+def old_message_to_field(device_type: type[ProtobufProps]):
+    field_map = defaultdict(list)
+    for field in device_type._fields:
+        if isinstance(field, ProtobufRepeatedField):
+            continue
+
+        if not isinstance(field, ProtobufField):
+            continue
+
+        field_map[field.pb_field.message_type].append(field)
+    return field_map
+
+
+# inline copy of the previous ProtobufProps.update_from_message
+def old_update_from_message(
+    device: ProtobufProps,
+    message_to_field: dict[type[Message], list[ProtobufField]],
+    message: Message,
+):
+    for field in message_to_field[type(message)]:
+        setattr(device, field.public_name, message)
+
+    for repeated_fields in device._repeated_field_map[type(message)].values():
+        field_list = repeated_fields[0].get_list(message)
+        if field_list is None:
+            continue
+
+        for field in repeated_fields:
+            setattr(device, field.public_name, field_list)
+
+
+def new_device():
+    ble_dev = BLEDevice("00:00:00:00:00:00", "SHP2", None)
+    return shp2.Device(ble_dev, None, "HD31ZZZZ1234")  # type: ignore reportArgumentType
+
+
+def field_values(device: ProtobufProps):
+    return {
+        field.public_name: getattr(device, field.public_name)
+        for field in device._fields
+    }
+
+
+def main():
+    message_to_field = old_message_to_field(shp2.Device)
+
+    header("SHP2 update from ProtoPushAndSet")
+    for name, probability in (("all fields", 1.0), ("30% of fields", 0.3)):
+        serialized = filled_message(
+            pd303_pb2.ProtoPushAndSet, probability
+        ).SerializeToString()
+        message = pd303_pb2.ProtoPushAndSet.FromString(serialized)
+
+        old_device = new_device()
+        new = new_device()
+        old_update_from_message(old_device, message_to_field, message)
+        new.update_from_message(message)
+        if field_values(old_device) != field_values(new):
+            raise AssertionError(f"{name}: updated fields differ")
+
+        compare(
+            f"{len(serialized)} B, {name}",
+            partial(old_update_from_message, old_device, message_to_field, message),
+            partial(new.update_from_message, message),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark of precompiled RawData structs against format strings"""
+
+import struct
+from functools import cache, partial
+
+from custom_components.ef_ble.eflib.model import (
+    DirectBmsMDeltaHeartbeatPack,
+    Mr330PdHeart,
+    RawData,
+)
+from custom_components.ef_ble.eflib.model.kit_info import KitBaseInfo
+
+from .benchmark import compare, header
+
+KITS = 8
+
+
+# inline copy of the previous RawData.unpack and RawData._fit_struct_to_data
+@cache
+def old_fit_struct_to_data(cls: type[RawData], data_len: int):
+    full_struct_fmt = cls._STRUCT_FMT
+    size = cls.SIZE
+    i = 0
+    while size > data_len:
+        i += 1
+        reduced_fmt = full_struct_fmt[:-i]
+        size = struct.calcsize(reduced_fmt)
+
+    return full_struct_fmt[:-i], size
+
+
+def old_unpack(cls: type[RawData], data: bytes):
+    struct_fmt = cls._STRUCT_FMT
+    size = cls.SIZE
+    if (data_len := len(data)) < cls.SIZE:
+        struct_fmt, size = old_fit_struct_to_data(cls, data_len)
+
+    return struct.unpack(struct_fmt, data[:size])
+
+
+# inline copy of the previous kit list decoding in AllKitDetailData.from_bytes
+def old_kit_list(data: bytes, count: int):
+    kits = []
+    offset = 0
+    for _ in range(count):
+        kit = KitBaseInfo(*old_unpack(KitBaseInfo, data[offset:]))
+        kits.append(kit)
+        offset += kit.SIZE
+    return kits
+
+
+def sample_data(size: int) -> bytes:
+    # bytes below 0x7f never decode to float NaN, which would not compare equal
+    return bytes(i % 0x7F for i in range(size))
+
+
+def truncated_size(cls: type[RawData]) -> int:
+    """Return the largest field boundary below 3/4 of size that old code can decode"""
+    for size in reversed(cls._PREFIX_SIZES):
+        if size > cls.SIZE * 3 // 4:
+            continue
+        try:
+            old_unpack(cls, sample_data(size))
+        except struct.error:
+            # old code trimmed multi-character formats such as "4s" incorrectly
+            continue
+        return size
+    return 0
+
+
+def main():
+    header("RawData decoding of Delta 2 heartbeats")
+    for cls in (Mr330PdHeart, DirectBmsMDeltaHeartbeatPack):
+        for size in (cls.SIZE, truncated_size(cls)):
+            data = sample_data(size)
+            compare(
+                f"{cls.__name__} {size}/{cls.SIZE} B",
+                partial(old_unpack, cls, data),
+                partial(cls.unpack, data),
+            )
+
+    data = sample_data(KitBaseInfo.SIZE * KITS)
+    compare(
+        f"{KITS} concatenated KitBaseInfo",
+        partial(old_kit_list, data, KITS),
+        partial(KitBaseInfo.list_from_bytes, data, count=KITS),
+    )
+
+
+if __name__ == "__main__":
+    main()
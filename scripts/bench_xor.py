@@ -0,0 +1,57 @@
+"""Benchmark of XOR de-obfuscation of packet payloads against per-byte loop"""
+
+from functools import partial
+
+from custom_components.ef_ble.eflib.packet import Packet, _xor_payload
+from custom_components.ef_ble.eflib.pb import pr705_pb2
+
+from .benchmark import compare, filled_message, header
+
+KEY = 0x5A
+
+
+# inline copy of the previous de-obfuscation in Packet.fromBytes
+def old_xor_payload(payload: bytes, key: int):
+    return bytes([c ^ key for c in payload])
+
+
+def old_from_bytes_payload(data: bytes):
+    packet = Packet.fromBytes(data)
+    return old_xor_payload(packet.payload, packet.seq[0])
+
+
+def new_from_bytes_payload(data: bytes):
+    return Packet.fromBytes(data, is_xor=True).payload
+
+
+def main():
+    # River 3 status upload with every field populated
+    payload = filled_message(pr705_pb2.DisplayPropertyUpload).SerializeToString()
+
+    header(f"XOR of serialized DisplayPropertyUpload ({len(payload)} B)")
+    for size in (len(payload) // 4, len(payload) // 2, len(payload)):
+        obfuscated = old_xor_payload(payload[:size], KEY)
+        compare(
+            f"xor {size} B",
+            partial(old_xor_payload, obfuscated, KEY),
+            partial(_xor_payload, obfuscated, KEY),
+        )
+
+    data = Packet(
+        0x02,
+        0x21,
+        0xFE,
+        0x15,
+        old_xor_payload(payload, KEY),
+        version=3,
+        seq=bytes([KEY, 0, 0, 0]),
+    ).toBytes()
+    compare(
+        f"Packet.fromBytes {len(payload)} B",
+        partial(old_from_bytes_payload, data),
+        partial(new_from_bytes_payload, data),
+    )
+
+
+if __name__ == "__main__":
+    main()
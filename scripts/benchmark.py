@@ -0,0 +1,120 @@
+"""
+Helpers shared by micro-benchmarks of eflib hot paths
+
+Every benchmark compares the current implementation with an inline copy of the one it
+replaced, checks that both produce the same result and prints time per call. Timings
+are the best of several runs, so they show the cost of the code itself rather than
+noise of the host.
+"""
+
+import random
+import timeit
+from collections.abc import Callable
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import Message
+
+DEFAULT_REPEAT = 5
+
+
+def best_time(func: Callable[[], object], repeat: int = DEFAULT_REPEAT) -> float:
+    """
+    Return the best time of single call in microseconds
+
+    Number of calls in each run is chosen so the run takes at least 0.2 seconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def compare(
+    name: str,
+    old: Callable[[], object],
+    new: Callable[[], object],
+    repeat: int = DEFAULT_REPEAT,
+):
+    """
+    Check that both implementations return the same result and print their timings
+
+    Raises
+    ------
+    AssertionError
+        If results of the implementations differ
+    """
+    if (old_result := old()) != (new_result := new()):
+        raise AssertionError(f"{name}: results differ: {old_result!r} {new_result!r}")
+
+    old_us = best_time(old, repeat)
+    new_us = best_time(new, repeat)
+    print(
+        f"{name:<40} old {old_us:9.2f} us   new {new_us:9.2f} us"
+        f"   x{old_us / new_us:.1f}"
+    )
+
+
+def header(title: str, repeat: int = DEFAULT_REPEAT):
+    print(f"{title}, best of {repeat} runs")
+
+
+def random_payload(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def filled_message[T_MSG: Message](
+    message_type: type[T_MSG],
+    probability: float = 1.0,
+    seed: int = 0,
+    max_depth: int = 5,
+) -> T_MSG:
+    """
+    Create message with non-default values in its singular fields
+
+    Parameters
+    ----------
+    message_type
+        Type of the message to create
+    probability, optional
+        Probability that field is populated, populates all fields if 1.0
+    seed, optional
+        Seed of random generator, the same seed creates the same message
+    max_depth, optional
+        Maximum depth of populated sub-messages
+    """
+    message = message_type()
+    _fill(message, random.Random(seed), probability, max_depth)
+    return message
+
+
+def _fill(
+    message: Message,
+    rng: random.Random,
+    probability: float,
+    depth: int,
+):
+    for field in message.DESCRIPTOR.fields:
+        if field.is_repeated or rng.random() > probability:
+            continue
+
+        if field.message_type is not None:
+            if depth > 0:
+                _fill(getattr(message, field.name), rng, probability, depth - 1)
+            continue
+
+        setattr(message, field.name, _value(field, rng))
+
+
+def _value(field: FieldDescriptor, rng: random.Random):
+    match field.type:
+        case FieldDescriptor.TYPE_FLOAT | FieldDescriptor.TYPE_DOUBLE:
+            return rng.uniform(1, 100)
+        case FieldDescriptor.TYPE_BOOL:
+            return True
+        case FieldDescriptor.TYPE_STRING:
+            return f"SN{rng.randrange(10000):04}"
+        case FieldDescriptor.TYPE_BYTES:
+            return rng.randbytes(4)
+        case FieldDescriptor.TYPE_ENUM:
+            return field.enum_type.values[-1].number
+        case _:
+            return rng.randint(1, 100)